@@ -0,0 +1,33 @@
+from typing import Any, Dict, Optional, Protocol
+
+class Cache(Protocol):
+    """Key-value cache with TTL expiry, shared by every unit of work"""
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None on a miss"""
+        ...
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        generation: Optional[int] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        """Store a value; skipped if an invalidation happened since ``generation``.
+
+        ``ttl`` overrides the cache's default lifetime for this entry.
+        """
+        ...
+
+    async def invalidate(self, key: str) -> None:
+        """Drop a key and advance the generation"""
+        ...
+
+    async def current_generation(self) -> int:
+        """Counter advanced by every invalidation"""
+        ...
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters"""
+        ...
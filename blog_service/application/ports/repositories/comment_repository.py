@@ -1,18 +1,37 @@
-from typing import List, Protocol
+from typing import AsyncIterator, List, Optional, Protocol
 from uuid import UUID
 from domain.entities.comment import Comment
+from domain.value_objects.entity_version import EntityVersion
+from domain.value_objects.page_cursor import PageCursor
 
 class CommentRepository(Protocol):
     async def add(self, comment: Comment) -> Comment:
         """Add a new comment"""
         ...
 
+    async def add_many(self, comments: List[Comment]) -> List[Comment]:
+        """Add several comments in a single batch"""
+        ...
+
     async def get(self, comment_id: UUID) -> Comment:
         """Get a comment by id"""
         ...
 
-    async def get_by_post(self, post_id: UUID) -> List[Comment]:
-        """Get all comments for a post"""
+    async def get_by_post(
+        self,
+        post_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        """Get comments for a post oldest first, starting after the given cursor"""
+        ...
+
+    async def get_version_by_post(self, post_id: UUID) -> EntityVersion:
+        """Get the version of a post's comment set without loading the comments"""
+        ...
+
+    def stream(self, batch_size: int = 500) -> AsyncIterator[Comment]:
+        """Yield every comment, fetching batch_size rows at a time"""
         ...
 
     async def update(self, comment: Comment) -> Comment:
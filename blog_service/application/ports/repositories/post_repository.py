@@ -1,25 +1,70 @@
-from typing import Protocol, List, Optional
+from typing import Any, AsyncIterator, Dict, Protocol, List, Optional, Sequence
+from uuid import UUID
 from domain.entities.post import Post
+from domain.value_objects.entity_version import EntityVersion
+from domain.value_objects.page_cursor import PageCursor
+from domain.value_objects.post_summary import PostSummary
 
 class PostRepository(Protocol):
     """Repository interface for post persistence"""
     
-    async def create(self, post: Post) -> Post:
-        """Create a new post"""
+    async def add(self, post: Post) -> Post:
+        """Add a new post"""
         ...
 
-    async def get_by_id(self, post_id: int) -> Optional[Post]:
-        """Get a post by ID"""
+    async def get(self, post_id: UUID) -> Optional[Post]:
+        """Get a post by id"""
         ...
 
-    async def get_all(self) -> List[Post]:
-        """Get all posts"""
+    async def exists(self, post_id: UUID) -> bool:
+        """Whether a post exists, answered from the id index without reading the post"""
         ...
 
-    async def update(self, post_id: int, post: Post) -> Optional[Post]:
+    async def list(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Post]:
+        """Get posts newest first, starting after the given cursor"""
+        ...
+
+    async def list_summaries(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[PostSummary]:
+        """Get post summaries with comment counts, in the same order as list"""
+        ...
+
+    def stream(self, batch_size: int = 500) -> AsyncIterator[Post]:
+        """Yield every post without its comments, fetching batch_size rows at a time"""
+        ...
+
+    async def get_version(self, post_id: UUID) -> Optional[EntityVersion]:
+        """Get a post's version without loading it, or None if it does not exist"""
+        ...
+
+    async def get_fields(
+        self,
+        post_id: UUID,
+        fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get only the given fields of a post"""
+        ...
+
+    async def list_fields(
+        self,
+        fields: Sequence[str],
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Dict[str, Any]]:
+        """Get only the given fields of posts, in the same order as list"""
+        ...
+
+    async def update(self, post: Post) -> Optional[Post]:
         """Update a post"""
         ...
 
-    async def delete(self, post_id: int) -> bool:
-        """Delete a post"""
+    async def delete(self, post_id: UUID) -> bool:
+        """Delete a post, returning whether it existed"""
         ...
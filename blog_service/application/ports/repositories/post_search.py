@@ -0,0 +1,9 @@
+from typing import List, Protocol
+from domain.entities.post import Post
+
+class PostSearch(Protocol):
+    """Full-text search over post titles and content"""
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[Post]:
+        """Get posts matching the query, best match first"""
+        ...
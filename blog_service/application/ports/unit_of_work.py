@@ -1,10 +1,14 @@
 from typing import Protocol
 from application.ports.repositories.post_repository import PostRepository
 from application.ports.repositories.comment_repository import CommentRepository
+from application.ports.repositories.post_search import PostSearch
 
 class UnitOfWork(Protocol):
     posts: PostRepository
     comments: CommentRepository
+    search: PostSearch
+    # Read-only units of work skip transactions; writes should not be issued
+    readonly: bool
 
     async def __aenter__(self) -> "UnitOfWork":
         """Start a new transaction"""
@@ -0,0 +1,19 @@
+from typing import List, Optional, Protocol
+from uuid import UUID
+from domain.entities.comment import Comment
+from domain.value_objects.page_cursor import PageCursor, DEFAULT_PAGE_SIZE
+
+class CreateCommentUseCase(Protocol):
+    async def execute(self, post_id: UUID, content: str, author: str) -> Comment:
+        """Add a comment to an existing post"""
+        ...
+
+class GetPostCommentsUseCase(Protocol):
+    async def execute(
+        self,
+        post_id: UUID,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        """Get a page of a post's comments oldest first"""
+        ...
@@ -1,33 +1,73 @@
-from typing import Protocol, List, Optional
-from app.domain.entities.post import Post
-from app.domain.value_objects.post_status import PostStatus
+from typing import Any, AsyncIterator, Dict, Protocol, List, Optional, Sequence, Union
+from uuid import UUID
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from domain.value_objects.page_cursor import PageCursor, DEFAULT_PAGE_SIZE
+from domain.value_objects.post_summary import PostSummary
 
 class CreatePostUseCase(Protocol):
-    async def execute(self, post: Post) -> Post:
+    async def execute(self, title: str, content: str, author: str) -> Post:
         """Create a new blog post"""
         ...
 
 class GetPostUseCase(Protocol):
-    async def execute(self, post_id: int) -> Optional[Post]:
-        """Get a blog post by ID"""
+    async def execute(
+        self,
+        post_id: UUID,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[Post, Dict[str, Any], None]:
+        """Get a blog post by ID, optionally only the given fields"""
+        ...
+
+class GetPostVersionUseCase(Protocol):
+    async def execute(self, post_id: UUID) -> Optional[str]:
+        """Get a token that changes whenever the post or its comments change"""
         ...
 
 class ListPostsUseCase(Protocol):
-    async def execute(self) -> List[Post]:
-        """Get all blog posts"""
+    async def execute(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[PageCursor] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[List[PostSummary], List[Dict[str, Any]]]:
+        """Get a page of post summaries newest first, optionally only the given fields"""
+        ...
+
+class SearchPostsUseCase(Protocol):
+    async def execute(
+        self,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0
+    ) -> List[Post]:
+        """Full-text search over blog posts, best match first"""
+        ...
+
+class ExportPostsUseCase(Protocol):
+    def execute(self) -> AsyncIterator[Union[Post, Comment]]:
+        """Stream every post, then every comment"""
         ...
 
 class UpdatePostUseCase(Protocol):
-    async def execute(self, post_id: int, post: Post) -> Optional[Post]:
+    async def execute(
+        self,
+        post_id: UUID,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        author: Optional[str] = None,
+        status: Optional[PostStatus] = None
+    ) -> Optional[Post]:
         """Update a blog post"""
         ...
 
 class DeletePostUseCase(Protocol):
-    async def execute(self, post_id: int) -> bool:
+    async def execute(self, post_id: UUID) -> bool:
         """Delete a blog post"""
         ...
 
 class ChangePostStatusUseCase(Protocol):
-    async def execute(self, post_id: int, status: PostStatus) -> Optional[Post]:
+    async def execute(self, post_id: UUID, status: PostStatus) -> Optional[Post]:
         """Change post status"""
         ...
@@ -1,6 +1,7 @@
-from uuid import uuid4, UUID
+from uuid import UUID
 from datetime import datetime
 from domain.entities.comment import Comment
+from domain.value_objects.entity_id import new_id
 from application.ports.unit_of_work import UnitOfWork
 
 class CreateComment:
@@ -14,7 +15,7 @@ class CreateComment:
         author: str
     ) -> Comment:
         comment = Comment(
-            id=uuid4(),
+            id=new_id(),
             post_id=post_id,
             content=content,
             author=author,
@@ -22,9 +23,8 @@ class CreateComment:
         )
 
         async with self.uow as uow:
-            # Verify post exists
-            post = await uow.posts.get(post_id)
-            if not post:
+            # Existence check only; the post itself is never loaded
+            if not await uow.posts.exists(post_id):
                 raise ValueError(f"Post {post_id} not found")
 
             # Create comment
@@ -1,12 +1,39 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from domain.entities.comment import Comment
+from domain.value_objects.page_cursor import PageCursor, DEFAULT_PAGE_SIZE
 from application.ports.unit_of_work import UnitOfWork
+from application.use_cases.single_flight import SingleFlight
 
 class GetPostComments:
     def __init__(self, uow: UnitOfWork):
         self.uow = uow
 
-    async def execute(self, post_id: UUID) -> List[Comment]:
+    async def execute(
+        self,
+        post_id: UUID,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
         async with self.uow as uow:
-            return await uow.comments.get_by_post(post_id)
+            return await uow.comments.get_by_post(post_id, limit=limit, after=cursor)
+
+class CoalescedGetPostComments:
+    """GetPostComments whose concurrent calls for the same page share one query"""
+
+    def __init__(self, inner: GetPostComments, flight: SingleFlight):
+        self.inner = inner
+        self.flight = flight
+
+    async def execute(
+        self,
+        post_id: UUID,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        comments = await self.flight.do(
+            ("get_post_comments", post_id, limit, cursor),
+            lambda: self.inner.execute(post_id, limit=limit, cursor=cursor)
+        )
+        # Comments are immutable, but each caller gets its own list
+        return list(comments)
@@ -0,0 +1,12 @@
+from uuid import UUID
+from application.ports.unit_of_work import UnitOfWork
+
+class GetPostCommentsVersion:
+    """Version token of a post's comments, without loading them"""
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(self, post_id: UUID) -> str:
+        async with self.uow as uow:
+            return (await uow.comments.get_version_by_post(post_id)).token()
@@ -1,16 +1,23 @@
 from typing import Optional
-from blog_service.app.domain.entities.post import Post
-from blog_service.app.domain.ports.post_repository import PostRepository
-from blog_service.app.domain.value_objects.post_status import PostStatus
+from uuid import UUID
+from datetime import datetime
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from application.ports.unit_of_work import UnitOfWork
 
 class ChangePostStatus:
-    def __init__(self, post_repository: PostRepository):
-        self.post_repository = post_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
-    async def execute(self, post_id: int, status: PostStatus) -> Optional[Post]:
-        post = await self.post_repository.get_by_id(post_id)
-        if not post:
-            return None
-        
-        post.status = status
-        return await self.post_repository.update(post_id, post)
+    async def execute(self, post_id: UUID, status: PostStatus) -> Optional[Post]:
+        async with self.uow as uow:
+            post = await uow.posts.get(post_id)
+            if not post:
+                return None
+
+            updated_post = post.model_copy(
+                update={"status": status, "updated_at": datetime.utcnow()}
+            )
+            result = await uow.posts.update(updated_post)
+            await uow.commit()
+            return result
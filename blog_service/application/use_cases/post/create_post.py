@@ -1,9 +1,24 @@
+from datetime import datetime
 from domain.entities.post import Post
-from application.ports.repositories.post_repository import PostRepository
+from domain.value_objects.post_status import PostStatus
+from domain.value_objects.entity_id import new_id
+from application.ports.unit_of_work import UnitOfWork
 
 class CreatePost:
-    def __init__(self, post_repository: PostRepository):
-        self.post_repository = post_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
-    async def execute(self, post: Post) -> Post:
-        return await self.post_repository.create(post)
+    async def execute(self, title: str, content: str, author: str) -> Post:
+        post = Post(
+            id=new_id(),
+            title=title,
+            content=content,
+            author=author,
+            status=PostStatus.DRAFT,
+            created_at=datetime.utcnow()
+        )
+
+        async with self.uow as uow:
+            created_post = await uow.posts.add(post)
+            await uow.commit()
+            return created_post
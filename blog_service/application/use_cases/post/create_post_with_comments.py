@@ -1,9 +1,9 @@
 from typing import List, Tuple
-from uuid import uuid4
 from datetime import datetime
 from domain.entities.post import Post
 from domain.entities.comment import Comment
 from domain.value_objects.post_status import PostStatus
+from domain.value_objects.entity_id import new_id
 from application.ports.unit_of_work import UnitOfWork
 
 class CreatePostWithComments:
@@ -19,7 +19,7 @@ class CreatePostWithComments:
     ) -> Tuple[Post, List[Comment]]:
         # Create post entity
         post = Post(
-            id=uuid4(),
+            id=new_id(),
             title=title,
             content=content,
             author=author,
@@ -30,7 +30,7 @@ class CreatePostWithComments:
         # Create comment entities
         comments = [
             Comment(
-                id=uuid4(),
+                id=new_id(),
                 post_id=post.id,
                 content=comment_data["content"],
                 author=comment_data["author"],
@@ -44,11 +44,8 @@ class CreatePostWithComments:
                 # Create post
                 created_post = await uow.posts.add(post)
 
-                # Create comments
-                created_comments = []
-                for comment in comments:
-                    created_comment = await uow.comments.add(comment)
-                    created_comments.append(created_comment)
+                # Create comments in one batch
+                created_comments = await uow.comments.add_many(comments)
 
                 # Commit transaction
                 await uow.commit()
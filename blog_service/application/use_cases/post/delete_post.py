@@ -1,9 +1,13 @@
-from app.domain.ports.post_repository import PostRepository
-from app.application.ports.use_cases.post_use_cases import DeletePostUseCase
+from uuid import UUID
+from application.ports.unit_of_work import UnitOfWork
 
-class DeletePost(DeletePostUseCase):
-    def __init__(self, post_repository: PostRepository):
-        self.post_repository = post_repository
+class DeletePost:
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
-    async def execute(self, post_id: int) -> bool:
-        return await self.post_repository.delete(post_id)
+    async def execute(self, post_id: UUID) -> bool:
+        async with self.uow as uow:
+            await uow.comments.delete_by_post(post_id)
+            deleted = await uow.posts.delete(post_id)
+            await uow.commit()
+            return deleted
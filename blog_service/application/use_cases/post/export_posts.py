@@ -0,0 +1,17 @@
+from typing import AsyncIterator, Union
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+from application.ports.unit_of_work import UnitOfWork
+
+class ExportPosts:
+    def __init__(self, uow: UnitOfWork, batch_size: int = 500):
+        self.uow = uow
+        self.batch_size = batch_size
+
+    async def execute(self) -> AsyncIterator[Union[Post, Comment]]:
+        # Posts first, then comments, each streamed from a database cursor
+        async with self.uow as uow:
+            async for post in uow.posts.stream(self.batch_size):
+                yield post
+            async for comment in uow.comments.stream(self.batch_size):
+                yield comment
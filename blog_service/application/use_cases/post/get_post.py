@@ -1,10 +1,42 @@
-from typing import Optional
-from blog_service.app.domain.entities.post import Post
-from blog_service.app.domain.ports.post_repository import PostRepository
+from typing import Any, Dict, Optional, Sequence, Union
+from uuid import UUID
+from domain.entities.post import Post
+from application.ports.unit_of_work import UnitOfWork
+from application.use_cases.single_flight import SingleFlight
 
 class GetPost:
-    def __init__(self, post_repository: PostRepository):
-        self.post_repository = post_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
-    async def execute(self, post_id: int) -> Optional[Post]:
-        return await self.post_repository.get_by_id(post_id)
+    async def execute(
+        self,
+        post_id: UUID,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[Post, Dict[str, Any], None]:
+        async with self.uow as uow:
+            if fields:
+                return await uow.posts.get_fields(post_id, fields)
+            return await uow.posts.get(post_id)
+
+class CoalescedGetPost:
+    """GetPost whose concurrent calls for the same post share one query.
+
+    Posts are immutable, so every caller can safely get the same instance.
+    """
+
+    def __init__(self, inner: GetPost, flight: SingleFlight):
+        self.inner = inner
+        self.flight = flight
+
+    async def execute(
+        self,
+        post_id: UUID,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[Post, Dict[str, Any], None]:
+        fields = tuple(fields) if fields else None
+        result = await self.flight.do(
+            ("get_post", post_id, fields),
+            lambda: self.inner.execute(post_id, fields=fields)
+        )
+        # Sparse rows are plain dicts; give each caller its own
+        return dict(result) if isinstance(result, dict) else result
@@ -0,0 +1,22 @@
+from typing import Optional
+from uuid import UUID
+from application.ports.unit_of_work import UnitOfWork
+
+class GetPostVersion:
+    """Version token of a post as served, without loading it.
+
+    The post representation includes its comments, so the token covers
+    both. Read it before the body: a write in between then yields a tag
+    older than the body, which only costs the client one extra 200.
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(self, post_id: UUID) -> Optional[str]:
+        async with self.uow as uow:
+            post = await uow.posts.get_version(post_id)
+            if post is None:
+                return None
+            comments = await uow.comments.get_version_by_post(post_id)
+            return f"{post.token()}/{comments.token()}"
@@ -1,10 +1,21 @@
-from typing import List
-from blog_service.app.domain.entities.post import Post
-from blog_service.app.domain.ports.post_repository import PostRepository
+from typing import Any, Dict, List, Optional, Sequence, Union
+from domain.value_objects.page_cursor import PageCursor, DEFAULT_PAGE_SIZE
+from domain.value_objects.post_summary import PostSummary
+from application.ports.unit_of_work import UnitOfWork
 
 class ListPosts:
-    def __init__(self, post_repository: PostRepository):
-        self.post_repository = post_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
-    async def execute(self) -> List[Post]:
-        return await self.post_repository.get_all()
+    async def execute(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[PageCursor] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Union[List[PostSummary], List[Dict[str, Any]]]:
+        async with self.uow as uow:
+            if fields:
+                # Rows also carry the keyset columns so the caller can build a cursor
+                fetch = tuple(dict.fromkeys((*fields, "id", "created_at")))
+                return await uow.posts.list_fields(fetch, limit=limit, after=cursor)
+            return await uow.posts.list_summaries(limit=limit, after=cursor)
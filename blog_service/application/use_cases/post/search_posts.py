@@ -0,0 +1,17 @@
+from typing import List
+from domain.entities.post import Post
+from domain.value_objects.page_cursor import DEFAULT_PAGE_SIZE
+from application.ports.unit_of_work import UnitOfWork
+
+class SearchPosts:
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def execute(
+        self,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0
+    ) -> List[Post]:
+        async with self.uow as uow:
+            return await uow.search.search(query, limit=limit, offset=offset)
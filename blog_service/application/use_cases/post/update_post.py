@@ -1,10 +1,42 @@
 from typing import Optional
-from blog_service.app.domain.entities.post import Post
-from blog_service.app.domain.ports.post_repository import PostRepository
+from uuid import UUID
+from datetime import datetime
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from application.ports.unit_of_work import UnitOfWork
 
 class UpdatePost:
-    def __init__(self, post_repository: PostRepository):
-        self.post_repository = post_repository
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
-    async def execute(self, post_id: int, post: Post) -> Optional[Post]:
-        return await self.post_repository.update(post_id, post)
+    async def execute(
+        self,
+        post_id: UUID,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        author: Optional[str] = None,
+        status: Optional[PostStatus] = None
+    ) -> Optional[Post]:
+        async with self.uow as uow:
+            post = await uow.posts.get(post_id)
+            if not post:
+                return None
+
+            changes = {
+                key: value
+                for key, value in {
+                    "title": title,
+                    "content": content,
+                    "author": author,
+                    "status": status,
+                }.items()
+                if value is not None
+            }
+            # Rebuild the entity so the new values go through validation
+            updated_post = Post(
+                **{**post.model_dump(), **changes, "updated_at": datetime.utcnow()}
+            )
+
+            result = await uow.posts.update(updated_post)
+            await uow.commit()
+            return result
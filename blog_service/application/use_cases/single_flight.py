@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """Concurrent calls with the same key share one execution.
+
+    The first caller starts the work as its own task, and later callers
+    await that task. Each caller waits through ``asyncio.shield``, so a
+    client that disconnects does not cancel the query the others are
+    waiting on. Followers wait at most ``timeout`` seconds, then run the
+    call themselves rather than queueing behind a stuck query.
+
+    ``generation`` is the post cache's invalidation counter. It is part of
+    the key, so a call that arrives after a write has committed never joins
+    a query that started before it.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        generation: Optional[Callable[[], Awaitable[int]]] = None
+    ):
+        self.timeout = timeout
+        self.generation = generation
+        self._flights: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.timeouts = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        if self.generation is not None:
+            key = (key, await self.generation())
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.wait_for(asyncio.shield(flight), self.timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                return await call()
+
+        self.executions += 1
+        flight = asyncio.ensure_future(call())
+        self._flights[key] = flight
+        flight.add_done_callback(lambda done: self._land(key, done))
+        return await asyncio.shield(flight)
+
+    def _land(self, key: Hashable, flight: "asyncio.Task[Any]") -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the exception retrieved in case every caller went away
+        if not flight.cancelled():
+            flight.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "timeouts": self.timeouts,
+            "in_flight": len(self._flights),
+        }
@@ -0,0 +1,143 @@
+"""Post cache hit ratio with one vs several workers, per-process vs shared cache.
+
+Each worker process replays its share of one Zipf-distributed request trace.
+Reads go through get / current_generation / guarded set, the way
+``CachedPostRepository`` uses them. A small fraction of requests are writes
+that bump the post's version and invalidate it, as a committed update does.
+The authoritative versions live in shared memory, so every cache hit can be
+checked for staleness.
+
+With the memory backend, each worker warms its own copy, and an invalidation
+only reaches the worker that made the write. The shared backend keeps one
+copy for all workers.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.cache_hit_ratio --workers 1 8
+    python -m benchmarks.cache_hit_ratio --cache-url redis://localhost:6379
+"""
+import argparse
+import asyncio
+import itertools
+import multiprocessing
+import os
+import random
+import time
+from benchmarks.scratch import scratch_dir
+
+PAYLOAD = b"x" * 1024
+
+def zipf_trace(args, seed: int, count: int) -> list:
+    rng = random.Random(seed)
+    weights = [1 / (rank ** args.zipf) for rank in range(1, args.posts + 1)]
+    keys = rng.choices(range(args.posts), cum_weights=list(itertools.accumulate(weights)), k=count)
+    return [(key, rng.random() < args.write_ratio) for key in keys]
+
+def make_cache(backend: str, args):
+    if backend == "shared":
+        from infrastructure.cache.shared import SharedCache
+        return SharedCache(args.cache_url, args.ttl, bytes, bytes)
+    from infrastructure.cache.memory import MemoryCache
+    return MemoryCache(max_size=args.max_size, ttl=args.ttl)
+
+async def replay(backend: str, trace: list, versions, args) -> dict:
+    cache = make_cache(backend, args)
+    reads = hits = stale = 0
+    for key, is_write in trace:
+        name = f"post:{key}"
+        if is_write:
+            with versions.get_lock():
+                versions[key] += 1
+            await cache.invalidate(name)
+            continue
+        reads += 1
+        value = await cache.get(name)
+        if value is not None:
+            hits += 1
+            if int(value[:16]) < versions[key]:
+                stale += 1
+            continue
+        generation = await cache.current_generation()
+        # The "database read"
+        version = versions[key]
+        await cache.set(name, b"%016d" % version + PAYLOAD, generation)
+    if backend == "shared":
+        await cache.close()
+    return {"reads": reads, "hits": hits, "stale": stale}
+
+def worker(backend: str, index: int, workers: int, versions, results, args) -> None:
+    count = args.requests // workers
+    trace = zipf_trace(args, seed=index, count=count)
+    results.put(asyncio.run(replay(backend, trace, versions, args)))
+
+def run(backend: str, workers: int, args) -> None:
+    if backend == "shared":
+        asyncio.run(flush(args))
+    versions = multiprocessing.Array("q", args.posts)
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=worker, args=(backend, i, workers, versions, results, args))
+        for i in range(workers)
+    ]
+    started = time.perf_counter()
+    for process in processes:
+        process.start()
+    totals = {"reads": 0, "hits": 0, "stale": 0}
+    for _ in processes:
+        for name, value in results.get().items():
+            totals[name] += value
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - started
+    print(
+        f"{backend:<8}{workers:>8}"
+        f"{totals['hits'] / totals['reads']:>12.1%}"
+        f"{totals['stale'] / max(totals['hits'], 1):>12.2%}"
+        f"{args.requests / elapsed:>14,.0f}"
+    )
+
+async def flush(args) -> None:
+    from infrastructure.cache.shared import SharedCache
+    cache = SharedCache(args.cache_url, args.ttl, bytes, bytes)
+    await cache._call(("FLUSHDB",))
+    await cache.close()
+
+def main(args) -> None:
+    # The unix socket of a local cache-server lives in a scratch directory
+    with scratch_dir() as workdir:
+        server = None
+        if not args.cache_url:
+            from infrastructure.cache.server import run_server
+            path = os.path.join(workdir, "cache.sock")
+            args.cache_url = f"unix://{path}"
+            server = multiprocessing.Process(
+                target=run_server, args=(args.cache_url, args.max_size, args.ttl), daemon=True
+            )
+            server.start()
+            while not os.path.exists(path):
+                time.sleep(0.05)
+
+        print(
+            f"{args.requests:,} requests over {args.posts:,} posts, zipf s={args.zipf}, "
+            f"{args.write_ratio:.1%} writes"
+        )
+        print(f"{'backend':<8}{'workers':>8}{'hit ratio':>12}{'stale hits':>12}{'requests/s':>14}")
+        try:
+            for backend in ("memory", "shared"):
+                for workers in args.workers:
+                    run(backend, workers, args)
+        finally:
+            if server is not None:
+                server.terminate()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=200_000, help="total across all workers")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--zipf", type=float, default=1.1, help="skew of post popularity")
+    parser.add_argument("--write-ratio", type=float, default=0.01)
+    parser.add_argument("--max-size", type=int, default=10_000, help="POST_CACHE_MAX_SIZE")
+    parser.add_argument("--ttl", type=float, default=60.0, help="POST_CACHE_TTL_SECONDS")
+    parser.add_argument("--cache-url", help="use this RESP server instead of a local cache-server")
+    main(parser.parse_args())
@@ -0,0 +1,102 @@
+"""Response compression: ratio and time per coding, and event-loop stalls.
+
+Builds a JSON listing of ``--posts`` posts with word-salad content and
+compresses it with each available coding at the levels from the settings.
+It then compresses ``--concurrency`` copies at once while a ticker task
+measures how late the event loop wakes it. This is done once with
+compression inline on the loop and once offloaded to threads, which is
+what ``COMPRESSION_THREAD_MIN_SIZE`` selects.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.compression --posts 100
+    python -m benchmarks.compression --posts 1000 --concurrency 16
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+WORDS = "post blog comment author status draft published title content service".split()
+
+def best_of(call, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def make_body(args) -> bytes:
+    from domain.entities.post import Post
+    from domain.value_objects.entity_id import uuid7
+    from domain.value_objects.post_status import PostStatus
+    from presentation.serialization import POST_SEARCH_RESULT, dumps
+
+    rng = random.Random(42)
+    created = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    posts = [
+        Post(
+            id=uuid7(),
+            title=f"Post number {i}",
+            content=" ".join(rng.choice(WORDS) for _ in range(args.words)),
+            author=f"author{rng.randrange(50)}",
+            status=PostStatus.PUBLISHED,
+            created_at=created + timedelta(seconds=i)
+        )
+        for i in range(args.posts)
+    ]
+    return dumps({"posts": POST_SEARCH_RESULT.to_list(posts), "next_offset": args.posts})
+
+async def loop_lag(compressor, body: bytes, coding: str, concurrency: int) -> float:
+    """Worst delay of a 1ms ticker while ``concurrency`` bodies are compressed"""
+    worst = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal worst
+        while not done:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, time.perf_counter() - started - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    await asyncio.gather(*(compressor.compress(body, coding) for _ in range(concurrency)))
+    done = True
+    await task
+    return worst
+
+async def main(args) -> None:
+    from core.config import get_settings
+    from presentation.compression import CODINGS, ResponseCompressor
+
+    settings = get_settings()
+    body = make_body(args)
+    compressor = ResponseCompressor(settings.COMPRESSION_ENCODINGS, settings.COMPRESSION_LEVELS, 0, 0)
+    print(f"{args.posts}-post listing, {len(body):,} bytes, best of {args.repeat}")
+    print(f"{'':<8}{'level':>6}{'bytes':>10}{'ratio':>8}{'compress':>12}")
+    for coding in compressor.encodings:
+        level = compressor.levels[coding]
+        compressed = await compressor.compress(body, coding)
+        elapsed = best_of(lambda: CODINGS[coding](body, level), args.repeat)
+        print(
+            f"{coding:<8}{level:>6}{len(compressed):>10,}{len(body) / len(compressed):>7.1f}x"
+            f"{elapsed * 1000:>10.2f}ms"
+        )
+
+    coding = compressor.encodings[-1]
+    print(f"\nworst event-loop delay, {args.concurrency} concurrent {coding} compressions")
+    for label, thread_min_size in (("inline", len(body) + 1), ("threads", 0)):
+        compressor.thread_min_size = thread_min_size
+        lag = await loop_lag(compressor, body, coding, args.concurrency)
+        print(f"  {label:<10}{lag * 1000:>8.2f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--words", type=int, default=80, help="words of content per post")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,72 @@
+"""Payload size and encode/decode time of post listings as JSON vs MessagePack.
+
+Builds a listing of ``--posts`` posts with their content, in the shape
+the search routes return, and times the JSON and MessagePack codecs
+from ``presentation.serialization`` on them. Bodies are compared raw and
+gzip-compressed, since most internal traffic is also compressed.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.content_negotiation --posts 1000
+"""
+import argparse
+import gzip
+import time
+from datetime import datetime, timedelta
+
+def best_of(call, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def make_listing(args) -> dict:
+    from domain.entities.post import Post
+    from domain.value_objects.entity_id import uuid7
+    from domain.value_objects.post_status import PostStatus
+    from presentation.serialization import POST_SEARCH_RESULT
+
+    created = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    posts = [
+        Post(
+            id=uuid7(),
+            title=f"Post number {i}",
+            content="x" * args.content_size,
+            author="bench",
+            status=PostStatus.PUBLISHED,
+            created_at=created + timedelta(seconds=i),
+            updated_at=created + timedelta(seconds=i, milliseconds=5)
+        )
+        for i in range(args.posts)
+    ]
+    return {
+        "posts": POST_SEARCH_RESULT.to_list(posts),
+        "next_offset": args.posts
+    }
+
+def main(args) -> None:
+    from presentation.serialization import JSON, MSGPACK
+
+    if MSGPACK is None:
+        raise SystemExit("MessagePack support needs the ormsgpack package")
+    listing = make_listing(args)
+    print(f"{args.posts}-post listing, {args.content_size}-byte content, best of {args.repeat}")
+    print(f"{'':<10}{'bytes':>10}{'gzip':>10}{'encode':>12}{'decode':>12}")
+    for codec in (JSON, MSGPACK):
+        body = codec.dumps(listing)
+        encode = best_of(lambda: codec.dumps(listing), args.repeat)
+        decode = best_of(lambda: codec.loads(body), args.repeat)
+        name = codec.media_type.split("/")[1]
+        print(
+            f"{name:<10}{len(body):>10,}{len(gzip.compress(body)):>10,}"
+            f"{encode * 1000:>10.2f}ms{decode * 1000:>10.2f}ms"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=1_000)
+    parser.add_argument("--content-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
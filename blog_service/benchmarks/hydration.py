@@ -0,0 +1,168 @@
+"""Rows per second mapping stored posts to entities: model_validate vs model_construct vs Hydrator.
+
+Times the adapters' own mapping code (``PostModel.to_entity`` and
+``PostDocument.from_document``) on ``--rows`` posts with ``--comments``
+comments each, swapping the hydrate functions those modules use:
+
+- ``validate``: ``model_validate``, what the constructors did before
+- ``model_construct``: pydantic's unvalidated constructor
+- ``hydrator``: ``infrastructure.hydration``, a ``TypeAdapter`` per entity,
+  what the adapters use now
+
+The ``sqlite list`` case is a whole ``SQLitePostRepository.list`` call
+over a scratch database, so the mapping cost can be seen next to the
+query and ORM loading cost. As with ``timeit``, the garbage collector is
+paused while timing so that collections of the large test heap do not
+land on random runs.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.hydration --rows 10000 --comments 5
+"""
+import argparse
+import asyncio
+import gc
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from benchmarks.scratch import scratch_database
+
+def strategies() -> dict:
+    from domain.entities.comment import Comment
+    from domain.entities.post import Post
+    from infrastructure.hydration import hydrate_comment, hydrate_post
+
+    return {
+        "validate": (Post.model_validate, Comment.model_validate),
+        "model_construct": (
+            lambda values: Post.model_construct(**values),
+            lambda values: Comment.model_construct(**values),
+        ),
+        "hydrator": (hydrate_post, hydrate_comment),
+    }
+
+@contextmanager
+def hydrating_with(post, comment):
+    from infrastructure.mongodb.models import comment as mongo_comment, post as mongo_post
+    from infrastructure.sqlite3.models import comment as sqlite_comment, post as sqlite_post
+
+    modules = [
+        (sqlite_post, "hydrate_post", post), (mongo_post, "hydrate_post", post),
+        (sqlite_comment, "hydrate_comment", comment), (mongo_comment, "hydrate_comment", comment),
+    ]
+    saved = [(module, name, getattr(module, name)) for module, name, _ in modules]
+    for module, name, value in modules:
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for module, name, value in saved:
+            setattr(module, name, value)
+
+def make_posts(args) -> list:
+    from domain.entities.comment import Comment
+    from domain.entities.post import Post
+    from domain.value_objects.entity_id import uuid7
+    from domain.value_objects.post_status import PostStatus
+
+    started = datetime(2024, 1, 1)
+    posts = []
+    for i in range(args.rows):
+        post_id = uuid7()
+        created = started + timedelta(seconds=i)
+        posts.append(Post(
+            id=post_id, title=f"Post {i}", content="x" * 500, author="bench",
+            status=PostStatus.PUBLISHED, created_at=created,
+            comments=[
+                Comment(id=uuid7(), post_id=post_id, content=f"Comment {j}", author="reader",
+                        created_at=created + timedelta(milliseconds=j))
+                for j in range(args.comments)
+            ]
+        ))
+    return posts
+
+@contextmanager
+def gc_paused():
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+def rate(call, rows: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        with gc_paused():
+            started = time.perf_counter()
+            call()
+            best = min(best, time.perf_counter() - started)
+    return rows / best
+
+async def sqlite_list_rate(rows: int, repeat: int) -> float:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    from infrastructure.sqlite3.repositories.post_repository import SQLitePostRepository
+    from infrastructure.sqlite3.session import get_engine
+
+    engine = get_engine()
+    best = float("inf")
+    for _ in range(repeat):
+        async with AsyncSession(engine) as session:
+            with gc_paused():
+                started = time.perf_counter()
+                await SQLitePostRepository(session).list(limit=rows)
+                best = min(best, time.perf_counter() - started)
+    return rows / best
+
+async def seed_sqlite(posts) -> None:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    from infrastructure.sqlite3.repositories.comment_repository import SQLiteCommentRepository
+    from infrastructure.sqlite3.repositories.post_repository import SQLitePostRepository
+    from infrastructure.sqlite3.session import get_engine, init_db
+
+    engine = get_engine()
+    engine.echo = False
+    await init_db()
+    async with AsyncSession(engine) as session:
+        for post in posts:
+            await SQLitePostRepository(session).add(post)
+        await SQLiteCommentRepository(session).add_many(
+            [comment for post in posts for comment in post.comments]
+        )
+        await session.commit()
+
+async def main(args) -> None:
+    from infrastructure.mongodb.models.post import PostDocument
+    from infrastructure.sqlite3.models.comment import CommentModel
+    from infrastructure.sqlite3.models.post import PostModel
+
+    posts = make_posts(args)
+    models = []
+    for post in posts:
+        model = PostModel.from_entity(post)
+        model.comments = [CommentModel.from_entity(comment) for comment in post.comments]
+        models.append(model)
+    documents = [PostDocument.to_document(post) for post in posts]
+    await seed_sqlite(posts)
+
+    print(f"{args.rows:,} posts with {args.comments} comments each, best of {args.repeat}; rows/s")
+    print(f"{'':<18}{'to_entity':>14}{'from_document':>16}{'sqlite list':>14}")
+    for name, (post, comment) in strategies().items():
+        with hydrating_with(post, comment):
+            sqlite_rate = rate(lambda: [model.to_entity() for model in models], args.rows, args.repeat)
+            mongo_rate = rate(
+                lambda: [PostDocument.from_document(doc) for doc in documents], args.rows, args.repeat
+            )
+            list_rate = await sqlite_list_rate(args.rows, args.repeat)
+        print(f"{name:<18}{sqlite_rate:>14,.0f}{mongo_rate:>16,.0f}{list_rate:>14,.0f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--comments", type=int, default=5, help="comments per post")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Point the SQLite adapter at a scratch database before it is imported
+    with scratch_database():
+        asyncio.run(main(args))
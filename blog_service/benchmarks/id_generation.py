@@ -0,0 +1,127 @@
+"""Comment insert throughput with random UUIDv4 ids vs time-ordered UUIDv7.
+
+For each generator, a fresh database receives ``--rows`` comments. They are
+inserted in ``add_many``-sized transactions spread over ``--posts`` posts.
+The report shows overall and tail throughput plus the final index sizes.
+Random v4 keys land on random primary-key pages, and that cost grows once
+the index outgrows the page cache. v7 keys are appended at the right edge.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.id_generation --rows 1000000
+    python -m benchmarks.id_generation --rows 1000000 --mongo-url mongodb://localhost:27017
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from benchmarks.scratch import scratch_dir, sqlite_url
+
+def report(name: str, rows: int, elapsed: float, tail_rate: float, sizes: dict) -> None:
+    print(f"\n{name}: {rows / elapsed:,.0f} rows/s overall, {tail_rate:,.0f} rows/s over the last 10%")
+    for index, size in sizes.items():
+        print(f"  {index:<40}{size / 1024 / 1024:>8.1f} MiB")
+
+def comment_rows(generator, post_ids, count: int, start: int, rng: random.Random):
+    created = datetime(2024, 1, 1)
+    return [
+        {
+            "id": generator(),
+            "post_id": rng.choice(post_ids),
+            "content": "Comment",
+            "author": "bench",
+            "created_at": created + timedelta(milliseconds=start + i),
+            "updated_at": None,
+        }
+        for i in range(count)
+    ]
+
+async def insert_all(insert_batch, generator, post_ids, args) -> tuple:
+    rng = random.Random(42)
+    tail_from = args.rows - args.rows // 10
+    started = time.perf_counter()
+    tail_started = None
+    for start in range(0, args.rows, args.batch_size):
+        if tail_started is None and start >= tail_from:
+            tail_started = time.perf_counter()
+        count = min(args.batch_size, args.rows - start)
+        await insert_batch(comment_rows(generator, post_ids, count, start, rng))
+    finished = time.perf_counter()
+    tail_rows = args.rows - tail_from
+    return finished - started, tail_rows / (finished - (tail_started or started))
+
+async def run_sqlite(name: str, generator, args) -> None:
+    from sqlalchemy import insert
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel import SQLModel
+    from infrastructure.sqlite3.models.comment import CommentModel
+    from infrastructure.sqlite3.models.post import PostModel
+
+    with scratch_dir() as workdir:
+        path = os.path.join(workdir, f"{name}.db")
+        engine = create_async_engine(sqlite_url(workdir, f"{name}.db"))
+        post_ids = [generator() for _ in range(args.posts)]
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.execute(insert(PostModel), [
+                {"id": post_id, "title": "Title", "content": "Content", "author": "bench",
+                 "status": "PUBLISHED", "created_at": datetime(2024, 1, 1)}
+                for post_id in post_ids
+            ])
+
+        async def insert_batch(rows) -> None:
+            # Same statement SQLiteCommentRepository.add_many issues
+            async with engine.begin() as conn:
+                await conn.execute(insert(CommentModel), rows)
+
+        elapsed, tail_rate = await insert_all(insert_batch, generator, post_ids, args)
+        await engine.dispose()
+        with sqlite3.connect(path) as conn:
+            sizes = dict(conn.execute(
+                "SELECT name, SUM(pgsize) FROM dbstat WHERE name IN ("
+                "  SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'comments'"
+                ") GROUP BY name ORDER BY name"
+            ).fetchall())
+        report(name, args.rows, elapsed, tail_rate, sizes)
+
+async def run_mongo(name: str, generator, args) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from infrastructure.mongodb.models.binary_uuid import to_binary
+
+    client = AsyncIOMotorClient(args.mongo_url)
+    database = client[f"blog_bench_{name}"]
+    await client.drop_database(database.name)
+    await database.comments.create_index([("post_id", 1), ("created_at", 1), ("_id", 1)])
+    post_ids = [to_binary(generator()) for _ in range(args.posts)]
+
+    async def insert_batch(rows) -> None:
+        docs = [{**row, "_id": to_binary(row.pop("id"))} for row in rows]
+        await database.comments.insert_many(docs, ordered=True)
+
+    try:
+        elapsed, tail_rate = await insert_all(insert_batch, generator, post_ids, args)
+        stats = await database.command("collStats", "comments")
+        report(name, args.rows, elapsed, tail_rate, stats["indexSizes"])
+    finally:
+        await client.drop_database(database.name)
+        client.close()
+
+async def main(args) -> None:
+    from domain.value_objects.entity_id import ID_GENERATORS
+
+    run = run_mongo if args.mongo_url else run_sqlite
+    print(f"{args.rows:,} comments over {args.posts:,} posts, {args.batch_size} per transaction")
+    for name in ("uuid4", "uuid7"):
+        await run(name, ID_GENERATORS[name], args)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--posts", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=500, help="comments per add_many")
+    parser.add_argument("--mongo-url", help="benchmark this MongoDB server instead of SQLite")
+    asyncio.run(main(parser.parse_args()))
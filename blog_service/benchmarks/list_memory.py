@@ -0,0 +1,92 @@
+"""Memory and allocations per listed post: Post entities vs PostSummary read models.
+
+Seeds a scratch SQLite database with ``--posts`` posts, each with
+``--comments`` comments and ``--content-size`` bytes of content. Then
+tracemalloc measures one ``--limit`` page loaded through
+``PostRepository.list`` (what ListPosts used) and through
+``list_summaries`` (what it uses now):
+
+- retained: bytes and memory blocks still held by the returned page
+- peak: the highest traced memory while the page was being built
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.list_memory --limit 100 --comments 20
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from benchmarks.scratch import scratch_database
+
+async def seed(args) -> None:
+    from application.use_cases.post.create_post_with_comments import CreatePostWithComments
+    from infrastructure.sqlite3.session import get_engine, init_db
+    from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
+
+    engine = get_engine()
+    engine.echo = False
+    await init_db()
+    comments = [{"content": f"Comment {i} " * 10, "author": "reader"} for i in range(args.comments)]
+    for i in range(args.posts):
+        await CreatePostWithComments(SQLiteUnitOfWork()).execute(
+            title=f"Post {i}", content="x" * args.content_size, author="bench",
+            comments_data=comments
+        )
+
+async def measure(label: str, load, args) -> None:
+    from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
+
+    # Warm up statement caches and imports so they are not counted
+    async with SQLiteUnitOfWork(readonly=True) as uow:
+        await load(uow.posts, args.limit)
+
+    async with SQLiteUnitOfWork(readonly=True) as uow:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        page = await load(uow.posts, args.limit)
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    retained = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    count = len(page)
+    print(
+        f"{label:<16}{retained / count:>12,.0f}{blocks / count:>10,.1f}"
+        f"{peak / count:>12,.0f}{elapsed * 1e6 / count:>10,.0f}"
+    )
+    del page
+
+async def main(args) -> None:
+    from infrastructure.sqlite3.session import get_engine
+
+    engine = get_engine()
+    await seed(args)
+    print(
+        f"{args.limit}-post page of {args.posts}, {args.comments} comments and "
+        f"{args.content_size}-byte content per post; per listed post:"
+    )
+    print(f"{'':<16}{'retained B':>12}{'blocks':>10}{'peak B':>12}{'us':>10}")
+    await measure("list", lambda posts, limit: posts.list(limit=limit), args)
+    await measure("list_summaries", lambda posts, limit: posts.list_summaries(limit=limit), args)
+    await engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--comments", type=int, default=20, help="comments per post")
+    parser.add_argument("--content-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    # Point the SQLite adapter at a scratch database before it is imported
+    with scratch_database():
+        asyncio.run(main(args))
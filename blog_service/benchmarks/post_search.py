@@ -0,0 +1,124 @@
+"""FTS5 search against the full-scan approach it replaces.
+
+Seeds a scratch SQLite database with synthetic posts, then times the same
+queries three ways:
+
+* ``fts``   - ``SearchPosts`` backed by the posts_fts index
+* ``like``  - a ``LIKE '%term%'`` scan in SQL; unranked, so it can stop at
+  the first 20 hits and is only competitive for very common terms
+* ``scan``  - ``PostRepository.list()`` followed by filtering in Python,
+  which is what clients had to do before the search endpoint existed
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.post_search --posts 100000
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+from benchmarks.scratch import scratch_database
+
+# Zipf-distributed vocabulary so term frequencies look like real text:
+# a few words appear everywhere and most are rare
+VOCABULARY = (
+    "python async event loop sqlite mongo index cursor query cache latency "
+    "throughput worker request response schema entity domain port adapter "
+    "garden tomato recipe travel music guitar camera winter summer coffee"
+).split() + [f"term{n}" for n in range(20000)]
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+QUERIES = ["asyncio", "python", "coffee recipe", "term500", "term50 term90"]
+
+async def seed(posts: int) -> None:
+    from sqlalchemy import insert
+    from domain.value_objects.post_status import PostStatus
+    from infrastructure.sqlite3 import session
+    from infrastructure.sqlite3.models.post import PostModel
+
+    rng = random.Random(42)
+    started = datetime.utcnow() - timedelta(days=365)
+    batch_size = 5000
+    async with session.get_engine().begin() as conn:
+        for start in range(0, posts, batch_size):
+            rows = []
+            for i in range(start, min(start + batch_size, posts)):
+                words = rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=200)
+                if i % 1000 == 0:
+                    words.append("asyncio")
+                rows.append({
+                    "id": uuid4(),
+                    "title": " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=6)),
+                    "content": " ".join(words),
+                    "author": "bench",
+                    "status": PostStatus.PUBLISHED,
+                    "created_at": started + timedelta(seconds=i),
+                    "updated_at": None,
+                })
+            await conn.execute(insert(PostModel), rows)
+
+async def time_it(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+async def main(args) -> None:
+    from sqlalchemy import or_
+    from sqlmodel import select
+    from application.use_cases.post.search_posts import SearchPosts
+    from infrastructure.sqlite3 import session
+    from infrastructure.sqlite3.models.post import PostModel
+    from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
+
+    session.get_engine().echo = False
+    await session.init_db()
+    started = time.perf_counter()
+    await seed(args.posts)
+    print(f"seeded {args.posts} posts in {time.perf_counter() - started:.1f}s\n")
+
+    print(f"{'query':<24}{'fts':>12}{'like':>12}{'scan':>12}")
+    for query in QUERIES:
+        terms = query.split()
+
+        async def fts():
+            return await SearchPosts(SQLiteUnitOfWork()).execute(query, limit=20)
+
+        async def like():
+            async with session.new_session() as db:
+                stmt = select(PostModel).limit(20)
+                for term in terms:
+                    stmt = stmt.where(or_(
+                        PostModel.title.contains(term), PostModel.content.contains(term)
+                    ))
+                return (await db.exec(stmt)).all()
+
+        async def scan():
+            async with SQLiteUnitOfWork() as uow:
+                posts = await uow.posts.list()
+            return [
+                post for post in posts
+                if all(term in f"{post.title} {post.content}" for term in terms)
+            ][:20]
+
+        results = [await time_it(fn, args.repeat) for fn in (fts, like)]
+        results.append(await time_it(scan, 1))
+        print(f"{query:<24}" + "".join(f"{r * 1000:10.1f}ms" for r in results))
+
+    await session.get_engine().dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per fts/like query")
+    args = parser.parse_args()
+
+    # Point the SQLite adapter at a scratch database before it is imported
+    with scratch_database():
+        asyncio.run(main(args))
@@ -0,0 +1,36 @@
+"""Scratch directories and databases shared by the benchmarks.
+
+Everything is created under a temporary directory that is removed, with
+any SQLite WAL/SHM files, when the ``with`` block exits.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+@contextmanager
+def scratch_dir() -> Iterator[str]:
+    with tempfile.TemporaryDirectory(prefix="blog-bench-") as workdir:
+        yield workdir
+
+def sqlite_url(workdir: str, name: str = "bench.db") -> str:
+    return f"sqlite+aiosqlite:///{os.path.join(workdir, name)}"
+
+@contextmanager
+def scratch_database() -> Iterator[str]:
+    """Point the SQLite adapter at a scratch database for the block.
+
+    The URL is always assigned, never defaulted, so a database exported
+    by the operator is never written to. Enter this before the adapter
+    is imported; the previous value is restored on exit.
+    """
+    previous = os.environ.get("SQLITE_DATABASE_URL")
+    with scratch_dir() as workdir:
+        url = os.environ["SQLITE_DATABASE_URL"] = sqlite_url(workdir)
+        try:
+            yield url
+        finally:
+            if previous is None:
+                del os.environ["SQLITE_DATABASE_URL"]
+            else:
+                os.environ["SQLITE_DATABASE_URL"] = previous
@@ -0,0 +1,134 @@
+"""Microseconds per post to encode API responses, before and after the shared encoders.
+
+Builds ``--posts`` Post entities in memory, each with ``--comments``
+comments, and times three ways of turning them into JSON bytes:
+
+- ``pydantic``: what FastAPI did with ``response_model``: validate into
+  ``PostResponse``, dump in JSON mode, then ``json.dumps``
+- ``dict + str()``: the hand-built dicts the Sanic routes used, with
+  ``str()`` on every UUID and datetime, then ``json.dumps``
+- ``EntityEncoder``: the shapes in ``presentation.serialization``
+
+The list case encodes posts with a comment count, the shape of search
+results; the detail case embeds the comments.
+Request parsing is timed as well: ``json.loads`` vs ``orjson.loads``.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.serialization --posts 1000 --comments 20
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+def per_post(encode: Callable[[], object], posts: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode()
+        best = min(best, time.perf_counter() - started)
+    return best / posts * 1e6
+
+def make_posts(args) -> list:
+    from domain.entities.comment import Comment
+    from domain.entities.post import Post
+    from domain.value_objects.entity_id import uuid7
+    from domain.value_objects.post_status import PostStatus
+
+    created = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    posts = []
+    for i in range(args.posts):
+        post_id = uuid7()
+        posts.append(Post(
+            id=post_id,
+            title=f"Post {i}",
+            content="x" * args.content_size,
+            author="bench",
+            status=PostStatus.PUBLISHED,
+            created_at=created + timedelta(seconds=i),
+            updated_at=created + timedelta(seconds=i, milliseconds=5),
+            comments=[
+                Comment(
+                    id=uuid7(),
+                    post_id=post_id,
+                    content=f"Comment {j}",
+                    author="reader",
+                    created_at=created + timedelta(seconds=i, milliseconds=j)
+                )
+                for j in range(args.comments)
+            ]
+        ))
+    return posts
+
+def pydantic_list(posts) -> bytes:
+    from presentation.schemas.post_schema import PostResponse
+
+    rows = [PostResponse.model_validate(post).model_dump(mode="json") for post in posts]
+    return json.dumps(rows).encode()
+
+def str_comment(comment) -> dict:
+    return {
+        "id": str(comment.id),
+        "content": comment.content,
+        "author": comment.author,
+        "created_at": str(comment.created_at)
+    }
+
+def str_summary(post) -> dict:
+    return {
+        "id": str(post.id),
+        "title": post.title,
+        "content": post.content,
+        "author": post.author,
+        "created_at": str(post.created_at),
+        "updated_at": str(post.updated_at) if post.updated_at else None,
+        "comments_count": len(post.comments)
+    }
+
+def str_detail(post) -> dict:
+    row = str_summary(post)
+    del row["comments_count"]
+    row["comments"] = [str_comment(comment) for comment in post.comments]
+    return row
+
+def main(args) -> None:
+    from presentation.serialization import (
+        POST_DETAIL, POST_RESPONSE, POST_SEARCH_RESULT, dumps, loads
+    )
+
+    posts = make_posts(args)
+    cases = [
+        ("list", [
+            ("pydantic", lambda: pydantic_list(posts)),
+            ("dict + str()", lambda: json.dumps([str_summary(post) for post in posts]).encode()),
+            ("EntityEncoder", lambda: POST_SEARCH_RESULT.dumps_many(posts)),
+            ("EntityEncoder (FastAPI shape)", lambda: POST_RESPONSE.dumps_many(posts)),
+        ]),
+        ("detail", [
+            ("dict + str()", lambda: [json.dumps(str_detail(post)).encode() for post in posts]),
+            ("EntityEncoder", lambda: [POST_DETAIL.dumps(post) for post in posts]),
+        ]),
+    ]
+    print(
+        f"{args.posts} posts, {args.content_size}-byte content, {args.comments} comments each; "
+        f"best of {args.repeat}"
+    )
+    for name, encoders in cases:
+        print(f"\n{name}")
+        for label, encode in encoders:
+            print(f"  {label:<32}{per_post(encode, args.posts, args.repeat):>8.2f} us/post")
+
+    body = dumps([POST_DETAIL.to_dict(post) for post in posts])
+    print("\nparse detail bodies")
+    print(f"  {'json.loads':<32}{per_post(lambda: json.loads(body), args.posts, args.repeat):>8.2f} us/post")
+    print(f"  {'orjson.loads':<32}{per_post(lambda: loads(body), args.posts, args.repeat):>8.2f} us/post")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=1_000)
+    parser.add_argument("--comments", type=int, default=20, help="comments per post")
+    parser.add_argument("--content-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
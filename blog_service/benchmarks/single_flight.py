@@ -0,0 +1,130 @@
+"""Database queries and latency of bursts of hot post reads, with and without single-flight.
+
+Each burst fires ``--concurrency`` simultaneous GetPost and GetPostComments
+calls at each of ``--hot-posts`` posts, the way a viral post is hit right
+after a cache miss. The post cache is left out so every call reaches the
+repository. SQL statements are counted on the engine, and the report
+shows, per key per burst, how many times the use case ran and how many
+statements reached SQLite, then the per-call latency.
+
+A key is one use case for one post. Single-flight runs each key once per
+burst, and the benchmark fails if it runs any key twice. One run is not
+one statement: GetPost reads the post row and then its comments, while
+GetPostComments reads one page, so a fully coalesced burst costs 1.5
+statements per key. That is the direct cost of a single call of each.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.single_flight --concurrency 200 --bursts 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+from benchmarks.scratch import scratch_database
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+async def seed(args) -> list:
+    from application.use_cases.post.create_post_with_comments import CreatePostWithComments
+    from infrastructure.sqlite3.session import init_db
+    from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
+
+    await init_db()
+    comments = [{"content": f"Comment {i}", "author": "bench"} for i in range(args.comments)]
+    post_ids = []
+    for i in range(args.hot_posts):
+        post, _ = await CreatePostWithComments(SQLiteUnitOfWork()).execute(
+            title=f"Viral {i}", content="x" * 2000, author="bench", comments_data=comments
+        )
+        post_ids.append(post.id)
+    return post_ids
+
+async def run(label: str, post_ids: list, flight, args) -> float:
+    from sqlalchemy import event
+    from application.use_cases.comment.get_post_comments import (
+        CoalescedGetPostComments,
+        GetPostComments,
+    )
+    from application.use_cases.post.get_post import CoalescedGetPost, GetPost
+    from infrastructure.sqlite3.session import get_engine
+    from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
+
+    engine = get_engine()
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    samples: List[float] = []
+
+    async def timed(use_case, post_id) -> None:
+        started = time.perf_counter()
+        await use_case.execute(post_id)
+        samples.append(time.perf_counter() - started)
+
+    def calls():
+        for post_id in post_ids:
+            for _ in range(args.concurrency):
+                get_post = GetPost(SQLiteUnitOfWork(readonly=True))
+                get_comments = GetPostComments(SQLiteUnitOfWork(readonly=True))
+                if flight:
+                    get_post = CoalescedGetPost(get_post, flight)
+                    get_comments = CoalescedGetPostComments(get_comments, flight)
+                yield timed(get_post, post_id)
+                yield timed(get_comments, post_id)
+
+    started = time.perf_counter()
+    for _ in range(args.bursts):
+        await asyncio.gather(*calls())
+    elapsed = time.perf_counter() - started
+    event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+    keys = args.bursts * len(post_ids) * 2
+    runs = flight.executions + flight.timeouts if flight else len(samples)
+    print(
+        f"{label:<16}{runs / keys:>12.1f}{statements / keys:>12.1f}"
+        f"{statistics.median(samples) * 1000:>10.1f}ms{percentile(samples, 0.99) * 1000:>10.1f}ms"
+        f"{len(samples) / elapsed:>12,.0f}"
+    )
+    if flight:
+        print(f"  {flight.stats()}")
+    return statements / runs
+
+async def main(args) -> None:
+    from application.use_cases.single_flight import SingleFlight
+    from infrastructure.sqlite3.session import get_engine
+
+    engine = get_engine()
+    engine.echo = False
+    post_ids = await seed(args)
+    print(
+        f"{args.bursts} bursts of {args.concurrency} GetPost + {args.concurrency} GetPostComments "
+        f"per post, {args.hot_posts} hot posts with {args.comments} comments"
+    )
+    print(f"{'':<16}{'runs/key':>12}{'SQL/key':>12}{'p50':>12}{'p99':>12}{'calls/s':>12}")
+    per_run = await run("direct", post_ids, None, args)
+    flight = SingleFlight(timeout=5.0)
+    coalesced_per_run = await run("single-flight", post_ids, flight, args)
+    await engine.dispose()
+
+    keys = args.bursts * len(post_ids) * 2
+    assert flight.executions + flight.timeouts == keys, "a key ran more than once in a burst"
+    assert coalesced_per_run == per_run, "a coalesced run issued extra statements"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=200, help="callers per post per burst")
+    parser.add_argument("--bursts", type=int, default=20)
+    parser.add_argument("--hot-posts", type=int, default=3)
+    parser.add_argument("--comments", type=int, default=50, help="comments per hot post")
+    args = parser.parse_args()
+
+    # Point the SQLite adapter at a scratch database before it is imported
+    with scratch_database():
+        asyncio.run(main(args))
@@ -0,0 +1,112 @@
+"""Read latency of the SQLite adapter while writes are in progress.
+
+Runs a fixed number of concurrent readers against ``SQLiteUnitOfWork`` twice:
+once on an idle database and once while writer tasks keep inserting posts
+with comments. It also samples event loop lag, which is what blocks every
+other request on the worker when a repository call runs synchronously.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.sqlite_concurrency --readers 50 --duration 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+from benchmarks.scratch import scratch_database
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def report(label: str, samples: List[float]) -> None:
+    if not samples:
+        print(f"{label:<28} no samples")
+        return
+    print(
+        f"{label:<28} n={len(samples):<6} "
+        f"p50={percentile(samples, 50) * 1000:7.2f}ms "
+        f"p99={percentile(samples, 99) * 1000:7.2f}ms "
+        f"max={max(samples) * 1000:7.2f}ms"
+    )
+
+async def reader(post_id, stop: asyncio.Event, samples: List[float]) -> None:
+    from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
+
+    while not stop.is_set():
+        started = time.perf_counter()
+        async with SQLiteUnitOfWork() as uow:
+            await uow.posts.get(post_id)
+        samples.append(time.perf_counter() - started)
+
+async def writer(stop: asyncio.Event, comments_per_post: int) -> None:
+    from application.use_cases.post.create_post_with_comments import CreatePostWithComments
+    from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
+
+    comments_data = [
+        {"content": f"Comment {i}", "author": "bench"} for i in range(comments_per_post)
+    ]
+    while not stop.is_set():
+        await CreatePostWithComments(SQLiteUnitOfWork()).execute(
+            title="Benchmark post",
+            content="x" * 2000,
+            author="bench",
+            comments_data=comments_data
+        )
+
+async def loop_lag(stop: asyncio.Event, samples: List[float], interval: float = 0.001) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - started - interval)
+
+async def run_phase(post_id, readers: int, writers: int, duration: float, comments_per_post: int):
+    stop = asyncio.Event()
+    read_samples: List[float] = []
+    lag_samples: List[float] = []
+    tasks = [asyncio.create_task(reader(post_id, stop, read_samples)) for _ in range(readers)]
+    tasks += [asyncio.create_task(writer(stop, comments_per_post)) for _ in range(writers)]
+    tasks.append(asyncio.create_task(loop_lag(stop, lag_samples)))
+    await asyncio.sleep(duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+    return read_samples, lag_samples
+
+async def main(args) -> None:
+    from application.use_cases.post.create_post import CreatePost
+    from infrastructure.sqlite3 import session
+    from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
+
+    session.get_engine().echo = False
+    await session.init_db()
+    post = await CreatePost(SQLiteUnitOfWork()).execute(
+        title="Hot post", content="Read me", author="bench"
+    )
+
+    idle_reads, idle_lag = await run_phase(post.id, args.readers, 0, args.duration, args.comments)
+    busy_reads, busy_lag = await run_phase(
+        post.id, args.readers, args.writers, args.duration, args.comments
+    )
+
+    report("read (idle)", idle_reads)
+    report("read (writes in progress)", busy_reads)
+    report("loop lag (idle)", idle_lag)
+    report("loop lag (writes)", busy_lag)
+    ratio = percentile(busy_reads, 99) / percentile(idle_reads, 99)
+    print(f"p99 read latency ratio busy/idle: {ratio:.2f}")
+    print(f"mean loop lag under writes: {statistics.mean(busy_lag) * 1000:.3f}ms")
+    await session.get_engine().dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=50)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--comments", type=int, default=100, help="comments per written post")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per phase")
+    args = parser.parse_args()
+
+    # Point the SQLite adapter at a scratch database before it is imported
+    with scratch_database():
+        asyncio.run(main(args))
@@ -0,0 +1,175 @@
+"""Index size and lookup latency before and after binary UUID storage.
+
+Seeds posts and comments with ids in the legacy text form: 32-char hex in
+SQLite, 36-char strings in Mongo. The benchmark measures index sizes and
+times comments-by-post lookups, runs ``migrate-uuids``, then measures again.
+SQLite is compacted with VACUUM before each measurement, so both sides are
+compared with fully packed pages.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.uuid_storage --posts 20000 --comments-per-post 10
+    python -m benchmarks.uuid_storage --mongo-url mongodb://localhost:27017
+"""
+import argparse
+import asyncio
+import random
+import sqlite3
+import statistics
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+from benchmarks.scratch import scratch_database
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def report(label: str, sizes: dict, samples: list) -> None:
+    print(f"\n{label}")
+    for name, size in sizes.items():
+        print(f"  {name:<40}{size / 1024:>10.0f} KiB")
+    print(
+        f"  {'comments by post_id':<40}"
+        f"p50 {statistics.median(samples) * 1e6:.0f}us  p99 {percentile(samples, 0.99) * 1e6:.0f}us"
+    )
+
+def legacy_rows(args):
+    rng = random.Random(42)
+    started = datetime.utcnow() - timedelta(days=365)
+    post_ids = [uuid4() for _ in range(args.posts)]
+    comments = [
+        (uuid4(), rng.choice(post_ids), started + timedelta(seconds=i))
+        for i in range(args.posts * args.comments_per_post)
+    ]
+    return post_ids, comments, started
+
+def sqlite_index_sizes(path: str) -> dict:
+    with sqlite3.connect(path) as conn:
+        return dict(conn.execute(
+            "SELECT name, SUM(pgsize) FROM dbstat WHERE name IN ("
+            "  SELECT name FROM sqlite_master"
+            "  WHERE type = 'index' AND tbl_name IN ('posts', 'comments')"
+            ") GROUP BY name ORDER BY name"
+        ).fetchall())
+
+def sqlite_lookups(path: str, keys: list) -> list:
+    samples = []
+    with sqlite3.connect(path) as conn:
+        for key in keys:
+            started = time.perf_counter()
+            conn.execute(
+                "SELECT id, content FROM comments WHERE post_id = ?"
+                " ORDER BY created_at, id LIMIT 20",
+                (key,)
+            ).fetchall()
+            samples.append(time.perf_counter() - started)
+    return samples
+
+async def run_sqlite(args) -> None:
+    from infrastructure.sqlite3 import session
+    from infrastructure.sqlite3.models.post import PostModel  # noqa: F401 - registers tables
+    from infrastructure.sqlite3.uuid_migration import migrate_uuids
+
+    session.get_engine().echo = False
+    await session.init_db()
+    path = session.get_engine().url.database
+    post_ids, comments, started = legacy_rows(args)
+    async with session.get_engine().begin() as conn:
+        await conn.exec_driver_sql(
+            "INSERT INTO posts (id, title, content, author, status, created_at)"
+            " VALUES (?, 'Title', 'Content', 'bench', 'PUBLISHED', ?)",
+            [(post_id.hex, started) for post_id in post_ids]
+        )
+        await conn.exec_driver_sql(
+            "INSERT INTO comments (id, post_id, content, author, created_at)"
+            " VALUES (?, ?, 'Comment', 'bench', ?)",
+            [(comment_id.hex, post_id.hex, created) for comment_id, post_id, created in comments]
+        )
+
+    await session.get_engine().dispose()
+    with sqlite3.connect(path) as conn:
+        conn.execute("VACUUM")
+
+    rng = random.Random(7)
+    probe = [rng.choice(post_ids) for _ in range(args.lookups)]
+    print(f"sqlite: {len(post_ids)} posts, {len(comments)} comments")
+    report("text ids (CHAR(32) hex)", sqlite_index_sizes(path),
+           sqlite_lookups(path, [post_id.hex for post_id in probe]))
+
+    started_at = time.perf_counter()
+    migrated = await migrate_uuids(session.get_engine(), args.batch_size)
+    print(f"\nmigrated {migrated} in {time.perf_counter() - started_at:.1f}s")
+    await session.get_engine().dispose()
+    with sqlite3.connect(path) as conn:
+        conn.execute("VACUUM")
+
+    report("binary ids (16-byte BLOB)", sqlite_index_sizes(path),
+           sqlite_lookups(path, [post_id.bytes for post_id in probe]))
+
+async def run_mongo(args) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from infrastructure.mongodb.models.binary_uuid import to_binary
+    from infrastructure.mongodb.uuid_migration import migrate_uuids
+
+    client = AsyncIOMotorClient(args.mongo_url)
+    database = client[f"blog_bench_{uuid4().hex[:8]}"]
+    await database.comments.create_index([("post_id", 1), ("created_at", 1), ("_id", 1)])
+    post_ids, comments, started = legacy_rows(args)
+    await database.posts.insert_many([
+        {"_id": str(post_id), "title": "Title", "content": "Content", "author": "bench",
+         "status": "published", "created_at": started, "updated_at": None, "comments": []}
+        for post_id in post_ids
+    ])
+    await database.comments.insert_many([
+        {"_id": str(comment_id), "post_id": str(post_id), "content": "Comment",
+         "author": "bench", "created_at": created, "updated_at": None}
+        for comment_id, post_id, created in comments
+    ])
+
+    async def sizes() -> dict:
+        result = {}
+        for name in ("posts", "comments"):
+            stats = await database.command("collStats", name)
+            for index, size in stats["indexSizes"].items():
+                result[f"{name}.{index}"] = size
+        return result
+
+    async def lookups(keys) -> list:
+        samples = []
+        for key in keys:
+            started_at = time.perf_counter()
+            await database.comments.find({"post_id": key}).sort(
+                [("created_at", 1), ("_id", 1)]
+            ).limit(20).to_list(length=20)
+            samples.append(time.perf_counter() - started_at)
+        return samples
+
+    rng = random.Random(7)
+    probe = [rng.choice(post_ids) for _ in range(args.lookups)]
+    try:
+        print(f"mongo: {len(post_ids)} posts, {len(comments)} comments")
+        report("string ids", await sizes(), await lookups([str(key) for key in probe]))
+        started_at = time.perf_counter()
+        migrated = await migrate_uuids(database, args.batch_size)
+        print(f"\nmigrated {migrated} in {time.perf_counter() - started_at:.1f}s")
+        # Rebuild so index sizes are not inflated by the deleted string keys
+        await database.command("compact", "posts")
+        await database.command("compact", "comments")
+        report("Binary subtype 4 ids", await sizes(), await lookups([to_binary(key) for key in probe]))
+    finally:
+        await client.drop_database(database.name)
+        client.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=20_000)
+    parser.add_argument("--comments-per-post", type=int, default=10)
+    parser.add_argument("--lookups", type=int, default=5_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--mongo-url", help="benchmark this MongoDB server instead of SQLite")
+    args = parser.parse_args()
+
+    # Point the SQLite adapter at a scratch database before it is imported
+    with scratch_database():
+        asyncio.run(run_mongo(args) if args.mongo_url else run_sqlite(args))
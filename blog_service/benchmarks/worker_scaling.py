@@ -0,0 +1,142 @@
+"""Request throughput of ``blog run --workers N`` from one worker up to N.
+
+For each worker count, the benchmark starts the service on a scratch SQLite
+database and seeds ``--posts`` posts through the API. Load comes from
+``--clients`` processes, each holding ``--connections`` keep-alive
+connections that request random posts by id for ``--duration`` seconds.
+Throughput should grow with workers until the cores run out. The load
+generators run on the same machine and compete with the workers for
+cores, so leave some cores free for them.
+
+Usage (from the blog_service directory)::
+
+    python -m benchmarks.worker_scaling --workers 1 2 4 8
+    python -m benchmarks.worker_scaling --framework sanic --workers 1 4 --path /api/v1/posts/
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+from benchmarks.scratch import scratch_dir, sqlite_url
+
+HOST = "127.0.0.1"
+
+async def request(reader, writer, method: str, path: str, host: str, body: bytes = b"") -> bytes:
+    """One HTTP/1.1 exchange on a keep-alive connection; returns the response body"""
+    head = f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+    if body:
+        head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+    writer.write(head.encode() + b"\r\n" + body)
+    headers = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in headers.split(b"\r\n"):
+        name, _, value = line.partition(b":")
+        if name.lower() == b"content-length":
+            length = int(value)
+    return await reader.readexactly(length)
+
+async def wait_until_ready(args, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection(HOST, args.port)
+            await request(reader, writer, "GET", "/api/v1/posts/?limit=1", HOST)
+            writer.close()
+            return
+        except (OSError, asyncio.IncompleteReadError):
+            await asyncio.sleep(0.2)
+    raise SystemExit("the server did not start")
+
+async def seed(args) -> list:
+    reader, writer = await asyncio.open_connection(HOST, args.port)
+    ids = []
+    for i in range(args.posts):
+        body = json.dumps({"title": f"Post {i}", "content": "Content " * 50, "author": "bench"})
+        created = json.loads(await request(reader, writer, "POST", "/api/v1/posts/", HOST, body.encode()))
+        # FastAPI returns the post, Sanic wraps it with the created comments
+        ids.append(created.get("post", created)["id"])
+    writer.close()
+    return ids
+
+async def load(args, paths: list, seed_value: int) -> int:
+    rng = random.Random(seed_value)
+    deadline = time.monotonic() + args.duration
+    completed = 0
+
+    async def connection() -> None:
+        nonlocal completed
+        reader, writer = await asyncio.open_connection(HOST, args.port)
+        while time.monotonic() < deadline:
+            await request(reader, writer, "GET", rng.choice(paths), HOST)
+            completed += 1
+        writer.close()
+
+    await asyncio.gather(*(connection() for _ in range(args.connections)))
+    return completed
+
+def client(args, paths: list, index: int, results) -> None:
+    results.put(asyncio.run(load(args, paths, index)))
+
+def measure(workers: int, args) -> float:
+    with scratch_dir() as workdir:
+        return run_server(workers, args, {**os.environ, "SQLITE_DATABASE_URL": sqlite_url(workdir)})
+
+def run_server(workers: int, args, env: dict) -> float:
+    server = subprocess.Popen(
+        [sys.executable, "main.py", "run", "--framework", args.framework,
+         "--host", HOST, "--port", str(args.port), "--workers", str(workers)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        asyncio.run(wait_until_ready(args))
+        ids = asyncio.run(seed(args))
+        paths = [args.path] if args.path else [f"/api/v1/posts/{post_id}" for post_id in ids]
+        # Let the remaining workers finish starting before the clock runs
+        time.sleep(args.warmup)
+        results = multiprocessing.Queue()
+        clients = [
+            multiprocessing.Process(target=client, args=(args, paths, i, results))
+            for i in range(args.clients)
+        ]
+        for process in clients:
+            process.start()
+        completed = sum(results.get() for _ in clients)
+        for process in clients:
+            process.join()
+        return completed / args.duration
+    finally:
+        server.send_signal(signal.SIGINT)
+        server.wait(timeout=30)
+
+def main(args) -> None:
+    print(
+        f"{args.framework}, {args.clients} client processes x {args.connections} connections, "
+        f"{args.duration:.0f}s per run, {os.cpu_count()} cores"
+    )
+    print(f"{'workers':>8}{'req/s':>12}{'speedup':>10}")
+    baseline = None
+    for workers in args.workers:
+        rate = measure(workers, args)
+        baseline = baseline or rate
+        print(f"{workers:>8}{rate:>12,.0f}{rate / baseline:>9.2f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--framework", choices=("fastapi", "sanic"), default="fastapi")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--clients", type=int, default=4, help="load generator processes")
+    parser.add_argument("--connections", type=int, default=16, help="connections per client")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--path", help="request this path instead of random posts by id")
+    parser.add_argument("--port", type=int, default=8765)
+    main(parser.parse_args())
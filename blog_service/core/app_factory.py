@@ -1,11 +1,13 @@
+import os
 from typing import Optional, Type
 from fastapi import FastAPI
 from sanic import Sanic
 from sanic.config import Config
 from core.config import get_settings
 from core.db_factory import DBFactory
-from infrastructure.sqlite3.session import init_db as init_sqlite
-from infrastructure.mongodb.session import init_db as init_mongo
+from domain.value_objects.entity_id import ID_GENERATORS, set_id_generator
+from infrastructure.sqlite3.session import dispose_engine, init_db as init_sqlite
+from infrastructure.mongodb.session import close_client, init_db as init_mongo
 
 settings = get_settings()
 
@@ -13,38 +15,72 @@ class AppFactory:
     """Factory for creating web applications with different frameworks"""
     
     @staticmethod
-    def create_app(framework: str = "fastapi", db: str = "sqlite") -> Optional[Type]:
+    def create_app(
+        framework: str = "fastapi",
+        db: str = "sqlite",
+        loop: Optional[str] = None
+    ) -> Optional[Type]:
         """Create a web application based on the specified framework
         
         Args:
             framework: Web framework to use ("fastapi" or "sanic")
             db: Database to use ("sqlite" or "mongo")
+            loop: Event loop Sanic workers run on ("asyncio" or "uvloop");
+                None keeps Sanic's default. uvicorn picks its loop itself.
         """
         # Set database type for DBFactory
         DBFactory.set_db_type(db)
+        set_id_generator(ID_GENERATORS[settings.ID_GENERATOR])
         
         if framework.lower() == "fastapi":
             return AppFactory._create_fastapi_app(db)
         elif framework.lower() == "sanic":
-            return AppFactory._create_sanic_app(db)
+            return AppFactory._create_sanic_app(db, loop)
         else:
             raise ValueError(f"Unsupported framework: {framework}")
 
+    @staticmethod
+    def _compressor():
+        from presentation.compression import ResponseCompressor
+        return ResponseCompressor(
+            encodings=settings.COMPRESSION_ENCODINGS,
+            levels=settings.COMPRESSION_LEVELS,
+            min_size=settings.COMPRESSION_MIN_SIZE,
+            thread_min_size=settings.COMPRESSION_THREAD_MIN_SIZE,
+            cache=DBFactory.get_compression_cache()
+        )
+
     @staticmethod
     def _create_fastapi_app(db: str) -> FastAPI:
         from presentation.api.v1.post_router import router as post_router
+        from presentation.api.middleware.query_profiler import QueryProfilerMiddleware
+        from presentation.api.middleware.compression import CompressionMiddleware
         
         app = FastAPI(
             title=settings.PROJECT_NAME,
             openapi_url=f"{settings.API_V1_STR}/openapi.json"
         )
         
+        # Runs in each worker process, so every worker opens its own engine
+        # or client instead of inheriting one across fork
         @app.on_event("startup")
         async def startup_event():
             if db == "sqlite":
-                init_sqlite()
+                await init_sqlite()
             elif db == "mongo":
                 await init_mongo()
+
+        @app.on_event("shutdown")
+        async def shutdown_event():
+            if db == "sqlite":
+                await dispose_engine()
+            elif db == "mongo":
+                close_client()
+        
+        if settings.QUERY_PROFILING:
+            app.add_middleware(QueryProfilerMiddleware)
+        if settings.COMPRESSION_ENABLED:
+            app.add_middleware(CompressionMiddleware, compressor=AppFactory._compressor())
         
         # Include routers
         app.include_router(post_router, prefix=settings.API_V1_STR)
@@ -52,10 +88,16 @@ class AppFactory:
         return app
 
     @staticmethod
-    def _create_sanic_app(db: str) -> Sanic:
+    def _create_sanic_app(db: str, loop: Optional[str] = None) -> Sanic:
         from presentation.sanic.routes.post_routes import bp as post_bp
         from presentation.sanic.routes.comment_routes import bp as comment_bp
         from presentation.sanic.middleware.error_handler import ErrorHandler
+        from presentation.sanic.middleware.compression import compress_responses
+        from presentation.serialization import dumps, loads
+        from presentation.sanic.middleware.query_profiler import (
+            start_query_profile,
+            finish_query_profile
+        )
         
         # Configure Sanic
         config = Config()
@@ -70,22 +112,61 @@ class AppFactory:
             "CORS_ALLOW_HEADERS": "*",
             "CORS_ALLOW_METHODS": "*",
         })
+        if loop:
+            # Read by each worker when it sets up its event loop
+            config.USE_UVLOOP = loop == "uvloop"
         
-        app = Sanic(settings.PROJECT_NAME, config=config)
+        # Sanic app names may only contain alphanumerics, "_" and "-"
+        app = Sanic(
+            settings.PROJECT_NAME.replace(" ", "_"),
+            config=config,
+            dumps=dumps,
+            loads=loads
+        )
         
         # Add error handlers
         error_handler = ErrorHandler()
         app.error_handler = error_handler
         
+        # Runs in each worker process, so every worker opens its own engine
+        # or client instead of inheriting one across fork
         @app.before_server_start
         async def init_db(app, _):
             if db == "sqlite":
-                init_sqlite()
+                await init_sqlite()
             elif db == "mongo":
                 await init_mongo()
+
+        @app.after_server_stop
+        async def close_db(app, _):
+            if db == "sqlite":
+                await dispose_engine()
+            elif db == "mongo":
+                close_client()
+        
+        if settings.QUERY_PROFILING:
+            app.on_request(start_query_profile)
+            app.on_response(finish_query_profile)
+        if settings.COMPRESSION_ENABLED:
+            app.on_response(compress_responses(AppFactory._compressor()))
         
         # Register blueprints with versioned prefix
         app.blueprint(post_bp, url_prefix=f"{settings.API_V1_STR}/posts")
         app.blueprint(comment_bp, url_prefix=f"{settings.API_V1_STR}/comments")
         
         return app
+
+
+# Environment variables through which `blog run` tells server worker
+# processes which app to build
+FRAMEWORK_ENV = "BLOG_FRAMEWORK"
+DB_ENV = "BLOG_DB"
+LOOP_ENV = "BLOG_LOOP"
+
+def create_worker_app():
+    """App factory for server workers, e.g. ``uvicorn --factory core.app_factory:create_worker_app``"""
+    return AppFactory.create_app(
+        framework=os.environ.get(FRAMEWORK_ENV, "fastapi"),
+        db=os.environ.get(DB_ENV, "sqlite"),
+        loop=os.environ.get(LOOP_ENV) or None
+    )
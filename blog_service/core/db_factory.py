@@ -1,18 +1,36 @@
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 from functools import lru_cache
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from application.ports.repositories.post_repository import PostRepository
+from core.config import get_settings
+from application.ports.unit_of_work import UnitOfWork
 from infrastructure.sqlite3.repositories.post_repository import SQLitePostRepository
 from infrastructure.mongodb.repositories.post_repository import MongoPostRepository
 from infrastructure.sqlite3.session import get_session as get_sqlite_session
+from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
 from infrastructure.mongodb.session import get_database as get_mongo_db
+from infrastructure.mongodb.session import get_client as get_mongo_client, DATABASE_NAME, LIST_READ_PREFERENCE
+from infrastructure.mongodb.unit_of_work import MongoUnitOfWork
+from application.ports.cache import Cache
+from infrastructure.cache.memory import MemoryCache
+from infrastructure.cache.repositories import decode_entry, encode_entry
+from infrastructure.cache.responses import ResponseCache
+from infrastructure.cache.shared import SharedCache
+from infrastructure.cache.unit_of_work import CachingUnitOfWork
+from application.use_cases.single_flight import SingleFlight
+
+settings = get_settings()
 
 class DBFactory:
     """Factory for creating database dependencies"""
     
     _db_type: str = "sqlite"  # default database type
+    _post_cache: Optional[Cache] = None
+    _response_cache: Optional[ResponseCache] = None
+    _read_flight: Optional[SingleFlight] = None
+    _compression_cache: Optional[Cache] = None
     
     @classmethod
     def set_db_type(cls, db_type: str):
@@ -24,7 +42,7 @@ class DBFactory:
     def get_repository_factory(cls) -> Callable[..., PostRepository]:
         """Get the appropriate repository factory based on database type"""
         if cls._db_type == "sqlite":
-            def get_repository(session: Session = get_sqlite_session()) -> PostRepository:
+            def get_repository(session: AsyncSession = get_sqlite_session()) -> PostRepository:
                 return SQLitePostRepository(session)
             return get_repository
         elif cls._db_type == "mongo":
@@ -43,3 +61,100 @@ class DBFactory:
             return get_mongo_db
         else:
             raise ValueError(f"Unsupported database type: {cls._db_type}")
+
+    @classmethod
+    def get_post_cache(cls) -> Cache:
+        """Post cache shared by every unit of work in this process"""
+        if cls._post_cache is None:
+            if settings.CACHE_BACKEND == "shared":
+                cls._post_cache = SharedCache(
+                    url=settings.CACHE_URL,
+                    ttl=settings.POST_CACHE_TTL_SECONDS,
+                    encode=encode_entry,
+                    decode=decode_entry,
+                    pool_size=settings.CACHE_POOL_SIZE
+                )
+            elif settings.CACHE_BACKEND == "memory":
+                cls._post_cache = MemoryCache(
+                    max_size=settings.POST_CACHE_MAX_SIZE,
+                    ttl=settings.POST_CACHE_TTL_SECONDS
+                )
+            else:
+                raise ValueError(f"Unsupported cache backend: {settings.CACHE_BACKEND}")
+        return cls._post_cache
+
+    @classmethod
+    def get_response_cache(cls) -> ResponseCache:
+        """Encoded response cache; always misses when the post cache is off"""
+        if cls._response_cache is None:
+            cache = generations = None
+            if settings.POST_CACHE_ENABLED and settings.RESPONSE_CACHE_ENABLED:
+                # Writes advance the post cache's generation; the bodies live
+                # in their own store so they cannot evict posts
+                generations = cls.get_post_cache()
+                if settings.CACHE_BACKEND == "shared":
+                    cache = SharedCache(
+                        url=settings.CACHE_URL,
+                        ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+                        encode=bytes,
+                        decode=bytes,
+                        pool_size=settings.CACHE_POOL_SIZE
+                    )
+                else:
+                    cache = MemoryCache(
+                        max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+                        ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+                    )
+            cls._response_cache = ResponseCache(cache, generations)
+        return cls._response_cache
+
+    @classmethod
+    def get_compression_cache(cls) -> Optional[Cache]:
+        """Cache of compressed response bodies, or None if disabled"""
+        if cls._compression_cache is None and settings.COMPRESSION_CACHE_SIZE > 0:
+            if settings.CACHE_BACKEND == "shared":
+                # Workers reuse each other's compressed bytes; keys name the
+                # exact body, so no invalidation is needed
+                cls._compression_cache = SharedCache(
+                    url=settings.CACHE_URL,
+                    ttl=settings.COMPRESSION_CACHE_TTL_SECONDS,
+                    encode=bytes,
+                    decode=bytes,
+                    pool_size=settings.CACHE_POOL_SIZE
+                )
+            else:
+                cls._compression_cache = MemoryCache(
+                    max_size=settings.COMPRESSION_CACHE_SIZE,
+                    ttl=settings.COMPRESSION_CACHE_TTL_SECONDS
+                )
+        return cls._compression_cache
+
+    @classmethod
+    def get_read_flight(cls) -> Optional[SingleFlight]:
+        """Process-wide single-flight group for hot reads, or None if disabled"""
+        if cls._read_flight is None and settings.SINGLE_FLIGHT_ENABLED:
+            generation = None
+            if settings.POST_CACHE_ENABLED:
+                generation = cls.get_post_cache().current_generation
+            cls._read_flight = SingleFlight(
+                timeout=settings.SINGLE_FLIGHT_TIMEOUT_SECONDS,
+                generation=generation
+            )
+        return cls._read_flight
+
+    @classmethod
+    def create_uow(cls, readonly: bool = False) -> UnitOfWork:
+        """Create a unit of work for the configured database type"""
+        if cls._db_type == "sqlite":
+            uow = SQLiteUnitOfWork(readonly=readonly)
+        elif cls._db_type == "mongo":
+            uow = MongoUnitOfWork(
+                get_mongo_client(), DATABASE_NAME, LIST_READ_PREFERENCE, readonly=readonly
+            )
+        else:
+            raise ValueError(f"Unsupported database type: {cls._db_type}")
+        if settings.POST_CACHE_ENABLED:
+            return CachingUnitOfWork(
+                uow, cls.get_post_cache(), settings.POST_CACHE_NEGATIVE_TTL_SECONDS
+            )
+        return uow
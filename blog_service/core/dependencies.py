@@ -1,29 +1,84 @@
 from fastapi import Depends
 from core.db_factory import DBFactory
-from application.use_cases.post.create_post import CreatePost, CreatePostUseCase
-from application.use_cases.post.get_post import GetPost, GetPostUseCase
-from application.use_cases.post.list_posts import ListPosts, ListPostsUseCase
-from application.use_cases.post.update_post import UpdatePost, UpdatePostUseCase
-from application.use_cases.post.delete_post import DeletePost, DeletePostUseCase
-from application.use_cases.post.change_post_status import ChangePostStatus, ChangePostStatusUseCase
+from infrastructure.cache.responses import ResponseCache
+from application.ports.unit_of_work import UnitOfWork
+from application.ports.use_cases.post_use_cases import (
+    CreatePostUseCase,
+    GetPostUseCase,
+    GetPostVersionUseCase,
+    ListPostsUseCase,
+    SearchPostsUseCase,
+    ExportPostsUseCase,
+    UpdatePostUseCase,
+    DeletePostUseCase,
+    ChangePostStatusUseCase
+)
+from application.ports.use_cases.comment_use_cases import (
+    CreateCommentUseCase,
+    GetPostCommentsUseCase
+)
+from application.use_cases.comment.create_comment import CreateComment
+from application.use_cases.comment.get_post_comments import (
+    CoalescedGetPostComments,
+    GetPostComments,
+)
+from application.use_cases.post.create_post import CreatePost
+from application.use_cases.post.get_post import CoalescedGetPost, GetPost
+from application.use_cases.post.get_post_version import GetPostVersion
+from application.use_cases.post.list_posts import ListPosts
+from application.use_cases.post.search_posts import SearchPosts
+from application.use_cases.post.export_posts import ExportPosts
+from application.use_cases.post.update_post import UpdatePost
+from application.use_cases.post.delete_post import DeletePost
+from application.use_cases.post.change_post_status import ChangePostStatus
 
-# Get the repository factory based on current database type
-get_post_repository = DBFactory.get_repository_factory()
+def get_uow(readonly: bool = False) -> UnitOfWork:
+    """Create a unit of work for the database chosen in DBFactory"""
+    return DBFactory.create_uow(readonly=readonly)
 
-def get_create_post_use_case(repo=Depends(get_post_repository)) -> CreatePostUseCase:
-    return CreatePost(repo)
+def get_response_cache() -> ResponseCache:
+    return DBFactory.get_response_cache()
 
-def get_get_post_use_case(repo=Depends(get_post_repository)) -> GetPostUseCase:
-    return GetPost(repo)
+# FastAPI would expose get_uow's argument as a query parameter, so routes
+# depend on these wrappers instead
+def get_write_uow() -> UnitOfWork:
+    return get_uow()
 
-def get_list_posts_use_case(repo=Depends(get_post_repository)) -> ListPostsUseCase:
-    return ListPosts(repo)
+def get_readonly_uow() -> UnitOfWork:
+    return get_uow(readonly=True)
 
-def get_update_post_use_case(repo=Depends(get_post_repository)) -> UpdatePostUseCase:
-    return UpdatePost(repo)
+def get_create_post_use_case(uow=Depends(get_write_uow)) -> CreatePostUseCase:
+    return CreatePost(uow)
 
-def get_delete_post_use_case(repo=Depends(get_post_repository)) -> DeletePostUseCase:
-    return DeletePost(repo)
+def get_get_post_use_case(uow=Depends(get_readonly_uow)) -> GetPostUseCase:
+    flight = DBFactory.get_read_flight()
+    return CoalescedGetPost(GetPost(uow), flight) if flight else GetPost(uow)
 
-def get_change_post_status_use_case(repo=Depends(get_post_repository)) -> ChangePostStatusUseCase:
-    return ChangePostStatus(repo)
+def get_create_comment_use_case(uow=Depends(get_write_uow)) -> CreateCommentUseCase:
+    return CreateComment(uow)
+
+def get_get_post_comments_use_case(uow=Depends(get_readonly_uow)) -> GetPostCommentsUseCase:
+    flight = DBFactory.get_read_flight()
+    use_case = GetPostComments(uow)
+    return CoalescedGetPostComments(use_case, flight) if flight else use_case
+
+def get_get_post_version_use_case(uow=Depends(get_readonly_uow)) -> GetPostVersionUseCase:
+    return GetPostVersion(uow)
+
+def get_list_posts_use_case(uow=Depends(get_readonly_uow)) -> ListPostsUseCase:
+    return ListPosts(uow)
+
+def get_search_posts_use_case(uow=Depends(get_readonly_uow)) -> SearchPostsUseCase:
+    return SearchPosts(uow)
+
+def get_export_posts_use_case(uow=Depends(get_readonly_uow)) -> ExportPostsUseCase:
+    return ExportPosts(uow)
+
+def get_update_post_use_case(uow=Depends(get_write_uow)) -> UpdatePostUseCase:
+    return UpdatePost(uow)
+
+def get_delete_post_use_case(uow=Depends(get_write_uow)) -> DeletePostUseCase:
+    return DeletePost(uow)
+
+def get_change_post_status_use_case(uow=Depends(get_write_uow)) -> ChangePostStatusUseCase:
+    return ChangePostStatus(uow)
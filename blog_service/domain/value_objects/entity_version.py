@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+class EntityVersion(BaseModel):
+    """Change marker for a post or for a post's set of comments.
+
+    Built from timestamps and a row count only, so repositories can read it
+    from an index without loading any bodies. Every write that changes a
+    representation moves it: updates bump ``modified_at``, additions add a
+    newer ``created_at`` and deletions lower ``count``.
+    """
+
+    count: int
+    modified_at: Optional[datetime] = None
+
+    model_config = {
+        "frozen": True  # Immutable
+    }
+
+    @classmethod
+    def of(cls, created_at: datetime, updated_at: Optional[datetime]) -> "EntityVersion":
+        """Version of a single row"""
+        return cls(count=1, modified_at=max(filter(None, (created_at, updated_at))))
+
+    def token(self) -> str:
+        modified = self.modified_at.isoformat() if self.modified_at else "-"
+        return f"{self.count}@{modified}"
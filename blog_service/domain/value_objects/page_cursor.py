@@ -0,0 +1,40 @@
+import base64
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+class PageCursor(BaseModel):
+    """Keyset position in a listing ordered by (created_at, id)"""
+
+    created_at: datetime
+    id: UUID
+
+    model_config = {
+        "frozen": True  # Immutable
+    }
+
+    @classmethod
+    def after(cls, entity) -> "PageCursor":
+        """Cursor pointing just past the given post or comment"""
+        return cls(created_at=entity.created_at, id=entity.id)
+
+    @classmethod
+    def after_row(cls, row: dict) -> "PageCursor":
+        """Cursor pointing just past a projected row"""
+        return cls(created_at=row["created_at"], id=row["id"])
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, id_ = base64.urlsafe_b64decode(padded).decode().split("|")
+            return cls(created_at=datetime.fromisoformat(created_at), id=UUID(id_))
+        except Exception as exc:
+            raise ValueError("Invalid page cursor") from exc
@@ -0,0 +1,23 @@
+from typing import Tuple
+
+# Post attributes a client may select with ?fields=
+POST_FIELDS = (
+    "id",
+    "title",
+    "content",
+    "author",
+    "status",
+    "created_at",
+    "updated_at",
+    "comments_count",
+)
+
+def parse_fields(raw: str) -> Tuple[str, ...]:
+    """Parse a comma separated field list, raising ValueError on unknown names"""
+    fields = tuple(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+    if not fields:
+        raise ValueError("fields must name at least one field")
+    unknown = [name for name in fields if name not in POST_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+from uuid import UUID
+from domain.value_objects.post_status import PostStatus
+
+class PostSummary(NamedTuple):
+    """What list views show of a post.
+
+    A plain tuple instead of a ``Post`` entity: no content, no comment
+    bodies, no per-instance ``__dict__``, and nothing to validate. The
+    comments are only counted, in the same query.
+    """
+
+    id: UUID
+    title: str
+    author: str
+    status: PostStatus
+    created_at: datetime
+    updated_at: Optional[datetime]
+    comments_count: int
+
+SUMMARY_FIELDS = PostSummary._fields
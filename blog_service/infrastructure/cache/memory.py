@@ -0,0 +1,88 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from application.ports.cache import Cache
+
+class MemoryCache(Cache):
+    """Bounded in-process LRU cache whose entries also expire after a TTL.
+
+    ``generation`` is bumped on every invalidation. A reader that records it
+    before going to the database can pass it to ``set``. The entry is then
+    dropped if an invalidation happened in between, so a slow read cannot
+    put back a value a writer has just replaced.
+
+    Each worker process has its own copy; see ``SharedCache`` for entries
+    and invalidations shared across workers.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        return self.get_now(key)
+
+    async def set(
+        self,
+        key: Hashable,
+        value: Any,
+        generation: Optional[int] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        if generation is not None and generation != self.generation:
+            return
+        self.set_now(key, value, ttl)
+
+    async def invalidate(self, key: Hashable) -> None:
+        self.generation += 1
+        self.invalidations += 1
+        self._entries.pop(key, None)
+
+    async def current_generation(self) -> int:
+        return self.generation
+
+    def get_now(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set_now(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete_now(self, key: Hashable) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
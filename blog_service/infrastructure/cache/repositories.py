@@ -0,0 +1,171 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Union
+from uuid import UUID
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+from domain.value_objects.entity_version import EntityVersion
+from domain.value_objects.page_cursor import PageCursor
+from domain.value_objects.post_summary import PostSummary
+from application.ports.repositories.comment_repository import CommentRepository
+from application.ports.repositories.post_repository import PostRepository
+from application.ports.cache import Cache
+
+def cache_key(post_id: UUID) -> str:
+    return f"post:{post_id}"
+
+def missing_key(post_id: UUID) -> str:
+    """Negative entry: the post was looked up and did not exist"""
+    return f"missing:{post_id}"
+
+def encode_entry(value: Union[Post, bool]) -> bytes:
+    """Shared-cache codec for posts and negative-entry markers"""
+    if isinstance(value, Post):
+        return value.model_dump_json().encode()
+    return b"1" if value else b"0"
+
+def decode_entry(data: bytes) -> Union[Post, bool]:
+    if data in (b"0", b"1"):
+        return data == b"1"
+    return Post.model_validate_json(data)
+
+class CachedPostRepository(PostRepository):
+    """Read-through cache for ``get``; writes record the cache keys to invalidate.
+
+    Only read-only units of work read cached posts, so a write transaction
+    always bases its changes on the database row. ``exists`` also remembers
+    ids that were not found for ``negative_ttl`` seconds, in any unit of
+    work. A post created with such an id clears the entry when it commits.
+    """
+
+    def __init__(
+        self,
+        inner: PostRepository,
+        cache: Cache,
+        dirty: Set[str],
+        readonly: bool,
+        negative_ttl: Optional[float] = None
+    ):
+        self.inner = inner
+        self.cache = cache
+        self.dirty = dirty
+        self.readonly = readonly
+        self.negative_ttl = negative_ttl
+
+    async def add(self, post: Post) -> Post:
+        # Nothing cached yet, but invalidating moves the generation that
+        # keys cached listings, and drops a stale "missing" entry
+        self.dirty.update((cache_key(post.id), missing_key(post.id)))
+        return await self.inner.add(post)
+
+    async def get(self, post_id: UUID) -> Optional[Post]:
+        if not self.readonly:
+            return await self.inner.get(post_id)
+        key = cache_key(post_id)
+        post = await self.cache.get(key)
+        if post is None:
+            generation = await self.cache.current_generation()
+            post = await self.inner.get(post_id)
+            if post is not None:
+                await self.cache.set(key, post, generation)
+        return post
+
+    async def exists(self, post_id: UUID) -> bool:
+        if not self.negative_ttl:
+            return await self.inner.exists(post_id)
+        key = missing_key(post_id)
+        if await self.cache.get(key) is not None:
+            return False
+        generation = await self.cache.current_generation()
+        found = await self.inner.exists(post_id)
+        if not found:
+            await self.cache.set(key, True, generation, ttl=self.negative_ttl)
+        return found
+
+    def stream(self, batch_size: int = 500) -> AsyncIterator[Post]:
+        return self.inner.stream(batch_size)
+
+    async def get_version(self, post_id: UUID) -> Optional[EntityVersion]:
+        return await self.inner.get_version(post_id)
+
+    async def get_fields(
+        self,
+        post_id: UUID,
+        fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        return await self.inner.get_fields(post_id, fields)
+
+    async def list_fields(
+        self,
+        fields: Sequence[str],
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Dict[str, Any]]:
+        return await self.inner.list_fields(fields, limit=limit, after=after)
+
+    async def update(self, post: Post) -> Optional[Post]:
+        self.dirty.add(cache_key(post.id))
+        return await self.inner.update(post)
+
+    async def delete(self, post_id: UUID) -> bool:
+        self.dirty.add(cache_key(post_id))
+        return await self.inner.delete(post_id)
+
+    async def list(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Post]:
+        return await self.inner.list(limit=limit, after=after)
+
+    async def list_summaries(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[PostSummary]:
+        return await self.inner.list_summaries(limit=limit, after=after)
+
+class CachedCommentRepository(CommentRepository):
+    """Comments are part of a cached post, so comment writes invalidate their post"""
+
+    def __init__(self, inner: CommentRepository, dirty: Set[str]):
+        self.inner = inner
+        self.dirty = dirty
+
+    async def add(self, comment: Comment) -> Comment:
+        self.dirty.add(cache_key(comment.post_id))
+        return await self.inner.add(comment)
+
+    async def add_many(self, comments: List[Comment]) -> List[Comment]:
+        self.dirty.update(cache_key(comment.post_id) for comment in comments)
+        return await self.inner.add_many(comments)
+
+    async def get(self, comment_id: UUID) -> Comment:
+        return await self.inner.get(comment_id)
+
+    async def get_by_post(
+        self,
+        post_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        return await self.inner.get_by_post(post_id, limit=limit, after=after)
+
+    async def get_version_by_post(self, post_id: UUID) -> EntityVersion:
+        return await self.inner.get_version_by_post(post_id)
+
+    def stream(self, batch_size: int = 500) -> AsyncIterator[Comment]:
+        return self.inner.stream(batch_size)
+
+    async def update(self, comment: Comment) -> Comment:
+        self.dirty.add(cache_key(comment.post_id))
+        return await self.inner.update(comment)
+
+    async def delete(self, comment_id: UUID) -> None:
+        # Only the comment id is known; look up which post it belongs to
+        comment = await self.inner.get(comment_id)
+        if comment:
+            self.dirty.add(cache_key(comment.post_id))
+        await self.inner.delete(comment_id)
+
+    async def delete_by_post(self, post_id: UUID) -> None:
+        self.dirty.add(cache_key(post_id))
+        await self.inner.delete_by_post(post_id)
@@ -0,0 +1,85 @@
+"""Minimal RESP2 framing shared by the cache server and ``SharedCache``.
+
+Only the reply types the cache commands use are supported: simple strings,
+errors, integers, bulk strings and arrays.
+"""
+import asyncio
+from typing import Any, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+Arg = Union[bytes, str, int, float]
+
+class RespError(Exception):
+    """Error reply sent by the server"""
+
+def encode_command(*args: Arg) -> bytes:
+    """Encode one command as an array of bulk strings"""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+def encode_reply(value: Any) -> bytes:
+    """Encode a server reply; None is the nil bulk string"""
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, RespError):
+        return b"-%s\r\n" % str(value).encode()
+    if isinstance(value, bool) or isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(encode_reply(item) for item in value)
+    raise TypeError(f"Cannot encode {type(value).__name__} as RESP")
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read one reply; error replies are returned as ``RespError`` instances"""
+    line = await reader.readuntil(b"\r\n")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode()
+    if kind == b"-":
+        return RespError(body.decode())
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(body)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise RespError(f"Unexpected reply type {kind!r}")
+
+async def read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+    """Read one client command; None once the client disconnects"""
+    try:
+        request = await read_reply(reader)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+    if not isinstance(request, list) or not request:
+        raise RespError("ERR expected a command array")
+    return request
+
+def parse_url(url: str) -> Tuple[str, Union[str, Tuple[str, int]]]:
+    """``unix:///path.sock`` or ``redis://host:port`` to (scheme, address)"""
+    parsed = urlparse(url)
+    if parsed.scheme == "unix":
+        return "unix", parsed.path
+    if parsed.scheme in ("redis", "tcp"):
+        return "tcp", (parsed.hostname or "127.0.0.1", parsed.port or 6379)
+    raise ValueError(f"Unsupported cache URL: {url}")
+
+async def open_connection(url: str) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    scheme, address = parse_url(url)
+    if scheme == "unix":
+        return await asyncio.open_unix_connection(address)
+    return await asyncio.open_connection(*address)
@@ -0,0 +1,57 @@
+import json
+from typing import Any, Dict, Iterable, Optional, Tuple
+from application.ports.cache import Cache
+
+class CachedResponse:
+    """Result of a response cache lookup; ``store`` fills the entry on a miss"""
+
+    def __init__(self, cache: Optional[Cache], key: str, value: Optional[bytes]):
+        self._cache = cache
+        self._key = key
+        self.hit = value is not None
+        self.headers: Dict[str, str] = {}
+        self.body: Optional[bytes] = None
+        if value is not None:
+            headers, _, self.body = value.partition(b"\n")
+            self.headers = json.loads(headers)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    async def store(
+        self,
+        body: bytes,
+        etag: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Store ``body`` with the ETag and any other headers a hit must repeat"""
+        if self._cache is None:
+            return
+        headers = {**(headers or {}), **({"ETag": etag} if etag else {})}
+        await self._cache.set(self._key, json.dumps(headers).encode() + b"\n" + body)
+
+class ResponseCache:
+    """Encoded response bodies keyed by route, arguments and data generation.
+
+    The generation is the post cache's invalidation counter. Every
+    committed write moves it, so entries built from older data are never
+    read again and simply age out of the LRU. A hit skips the database,
+    entity construction and JSON encoding.
+
+    Bodies are kept in ``cache``, apart from the posts, so large listings
+    do not evict post entries; ``generations`` is the post cache, whose
+    counter the writes advance. It defaults to ``cache`` itself.
+    """
+
+    def __init__(self, cache: Optional[Cache], generations: Optional[Cache] = None):
+        self.cache = cache
+        self.generations = cache if generations is None else generations
+
+    async def lookup(self, route: str, *args: Any, query: Iterable[Tuple[str, str]] = ()) -> CachedResponse:
+        if self.cache is None:
+            return CachedResponse(None, "", None)
+        generation = await self.generations.current_generation()
+        params = "&".join(f"{name}={value}" for name, value in sorted(query))
+        key = f"response:{generation}:{route}:{':'.join(map(str, args))}?{params}"
+        return CachedResponse(self.cache, key, await self.cache.get(key))
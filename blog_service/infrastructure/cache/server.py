@@ -0,0 +1,154 @@
+"""Local cache server speaking the subset of the Redis protocol ``SharedCache`` uses.
+
+Lets every worker on one host share cache entries and invalidations without
+running Redis. Anything that speaks RESP (Redis, Valkey, KeyDB) can replace it
+by pointing ``CACHE_URL`` at it.
+
+Commands: PING, GET, SET (with PX), DEL, INCR, FLUSHDB, WATCH, UNWATCH,
+MULTI and EXEC. Entries live in a bounded ``MemoryCache``; INCR counters are
+kept outside it so an eviction can never reset a generation.
+"""
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional
+from infrastructure.cache.memory import MemoryCache
+from infrastructure.cache.resp import RespError, encode_reply, parse_url, read_command
+
+logger = logging.getLogger(__name__)
+
+class CacheServer:
+    def __init__(self, max_size: int, ttl: float):
+        self.store = MemoryCache(max_size=max_size, ttl=ttl)
+        self.counters: Dict[bytes, int] = {}
+        # Bumped on every write to a watched key; WATCH compares these at
+        # EXEC time. Only keys some connection is WATCHing have an entry,
+        # so the map stays as small as the set of open watches
+        self.versions: Dict[bytes, int] = {}
+        self.watchers: Dict[bytes, int] = {}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        watched: Dict[bytes, int] = {}
+        queued: Optional[List[List[bytes]]] = None
+        try:
+            while True:
+                try:
+                    command = await read_command(reader)
+                except RespError as error:
+                    writer.write(encode_reply(error))
+                    break
+                if command is None:
+                    break
+                name = command[0].upper()
+                if name == b"MULTI":
+                    queued = []
+                    reply: Any = "OK"
+                elif name == b"EXEC":
+                    if queued is None:
+                        reply = RespError("ERR EXEC without MULTI")
+                    elif any(self.versions.get(key, 0) != version for key, version in watched.items()):
+                        reply = None
+                    else:
+                        reply = [self.execute(queued_command) for queued_command in queued]
+                    queued = None
+                    self._unwatch(watched)
+                elif queued is not None:
+                    queued.append(command)
+                    reply = "QUEUED"
+                elif name == b"WATCH":
+                    for key in command[1:]:
+                        if key not in watched:
+                            self.watchers[key] = self.watchers.get(key, 0) + 1
+                            watched[key] = self.versions.setdefault(key, 0)
+                    reply = "OK"
+                elif name == b"UNWATCH":
+                    self._unwatch(watched)
+                    reply = "OK"
+                else:
+                    reply = self.execute(command)
+                writer.write(encode_reply(reply))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._unwatch(watched)
+            writer.close()
+
+    def execute(self, command: List[bytes]) -> Any:
+        name, args = command[0].upper(), command[1:]
+        try:
+            if name == b"GET":
+                if args[0] in self.counters:
+                    return str(self.counters[args[0]]).encode()
+                return self.store.get_now(args[0])
+            if name == b"SET":
+                ttl = None
+                if len(args) == 4 and args[2].upper() == b"PX":
+                    ttl = int(args[3]) / 1000
+                self.counters.pop(args[0], None)
+                self.store.set_now(args[0], args[1], ttl)
+                self._touch(args[0])
+                return "OK"
+            if name == b"DEL":
+                deleted = 0
+                for key in args:
+                    if self.store.delete_now(key) or self.counters.pop(key, None) is not None:
+                        deleted += 1
+                    self._touch(key)
+                return deleted
+            if name == b"INCR":
+                value = self.counters.get(args[0], 0) + 1
+                self.counters[args[0]] = value
+                self._touch(args[0])
+                return value
+            if name == b"PING":
+                return "PONG"
+            if name == b"FLUSHDB":
+                self.store.clear()
+                self.counters.clear()
+                for key in self.versions:
+                    self.versions[key] += 1
+                return "OK"
+        except (IndexError, ValueError):
+            return RespError(f"ERR wrong arguments for '{name.decode().lower()}'")
+        return RespError(f"ERR unknown command '{name.decode().lower()}'")
+
+    def _touch(self, key: bytes) -> None:
+        if key in self.versions:
+            self.versions[key] += 1
+
+    def _unwatch(self, watched: Dict[bytes, int]) -> None:
+        """Release one connection's watches, dropping versions nobody watches any more"""
+        for key in watched:
+            remaining = self.watchers[key] - 1
+            if remaining:
+                self.watchers[key] = remaining
+            else:
+                del self.watchers[key]
+                del self.versions[key]
+        watched.clear()
+
+async def serve(url: str, max_size: int, ttl: float) -> asyncio.AbstractServer:
+    """Start listening on ``url``; a stale unix socket file is replaced"""
+    server = CacheServer(max_size=max_size, ttl=ttl)
+    scheme, address = parse_url(url)
+    if scheme == "unix":
+        if os.path.exists(address):
+            os.unlink(address)
+        listener = await asyncio.start_unix_server(server.handle, path=address)
+    else:
+        listener = await asyncio.start_server(server.handle, *address)
+    logger.info("Cache server listening on %s", url)
+    return listener
+
+async def serve_forever(url: str, max_size: int, ttl: float) -> None:
+    listener = await serve(url, max_size, ttl)
+    async with listener:
+        await listener.serve_forever()
+
+def run_server(url: str, max_size: int, ttl: float) -> None:
+    """Process entry point used by ``main.run_app`` and the ``cache-server`` command"""
+    try:
+        asyncio.run(serve_forever(url, max_size, ttl))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from application.ports.cache import Cache
+from infrastructure.cache.resp import Arg, RespError, encode_command, open_connection, read_reply
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "cache:generation"
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+class SharedCache(Cache):
+    """Cache stored in a RESP server, so every worker sees the same entries.
+
+    ``CACHE_URL`` may point at the bundled ``cache-server`` or at any
+    Redis-compatible server. The generation is a server-side counter. A
+    guarded ``set`` WATCHes it and only writes inside MULTI/EXEC, so an
+    invalidation from any worker during the database read cancels the write.
+
+    The cache is an optimisation, not a source of truth: if the server is
+    unreachable, reads count as misses and writes are dropped, with a logged
+    warning. A lost invalidation is bounded by the entry TTL.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        ttl: float,
+        encode: Callable[[Any], bytes],
+        decode: Callable[[bytes], Any],
+        pool_size: int = 16
+    ):
+        self.url = url
+        self.ttl = ttl
+        self._encode = encode
+        self._decode = decode
+        self._idle: List[Connection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        replies = await self._call(("GET", key))
+        if not replies or replies[0] is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._decode(replies[0])
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        generation: Optional[int] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        store = ("SET", key, self._encode(value), "PX", int((ttl or self.ttl) * 1000))
+        if generation is None:
+            await self._call(store)
+            return
+        async with self._connection() as connection:
+            if connection is None:
+                return
+            _, current = await self._send(connection, ("WATCH", GENERATION_KEY), ("GET", GENERATION_KEY))
+            if int(current or 0) != generation:
+                await self._send(connection, ("UNWATCH",))
+                return
+            await self._send(connection, ("MULTI",), store, ("EXEC",))
+
+    async def invalidate(self, key: str) -> None:
+        # Bump the generation before deleting, so a reader that fetched the
+        # old row cannot store it after the delete
+        if await self._call(("INCR", GENERATION_KEY), ("DEL", key)):
+            self.invalidations += 1
+
+    async def current_generation(self) -> int:
+        replies = await self._call(("GET", GENERATION_KEY))
+        return int(replies[0] or 0) if replies else 0
+
+    async def ping(self) -> bool:
+        return bool(await self._call(("PING",)))
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
+
+    async def _call(self, *commands: Tuple[Arg, ...]) -> Optional[List[Any]]:
+        async with self._connection() as connection:
+            if connection is None:
+                return None
+            return await self._send(connection, *commands)
+
+    async def _send(self, connection: Connection, *commands: Tuple[Arg, ...]) -> List[Any]:
+        """Pipeline ``commands`` in one write and read all replies"""
+        reader, writer = connection
+        writer.write(b"".join(encode_command(*command) for command in commands))
+        await writer.drain()
+        replies = [await read_reply(reader) for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    def _connection(self) -> "_PooledConnection":
+        return _PooledConnection(self)
+
+class _PooledConnection:
+    """Borrow a pooled connection; yields None and logs if the server is down.
+
+    A connection that failed mid-command is closed rather than returned, so
+    no later caller reads a reply meant for someone else.
+    """
+
+    def __init__(self, cache: SharedCache):
+        self.cache = cache
+        self.connection: Optional[Connection] = None
+
+    async def __aenter__(self) -> Optional[Connection]:
+        await self.cache._slots.acquire()
+        if self.cache._idle:
+            self.connection = self.cache._idle.pop()
+            return self.connection
+        try:
+            self.connection = await open_connection(self.cache.url)
+        except OSError as error:
+            self.cache.errors += 1
+            logger.warning("Cache server %s unavailable: %s", self.cache.url, error)
+        return self.connection
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.cache._slots.release()
+        if self.connection is None:
+            return False
+        if exc_type is None:
+            self.cache._idle.append(self.connection)
+            return False
+        self.connection[1].close()
+        if issubclass(exc_type, (OSError, asyncio.IncompleteReadError, RespError)):
+            self.cache.errors += 1
+            logger.warning("Cache command failed on %s: %s", self.cache.url, exc_val)
+            return True
+        return False
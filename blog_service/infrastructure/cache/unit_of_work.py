@@ -0,0 +1,58 @@
+from typing import Optional, Set
+from application.ports.unit_of_work import UnitOfWork
+from application.ports.cache import Cache
+from infrastructure.cache.repositories import (
+    CachedCommentRepository,
+    CachedPostRepository,
+)
+
+class CachingUnitOfWork:
+    """Wraps any unit of work with the post cache.
+
+    Cache keys of posts touched by writes are invalidated once the wrapped
+    transaction commits. That covers explicit ``commit()`` calls and adapters that
+    commit on exit.
+    """
+
+    def __init__(self, inner: UnitOfWork, cache: Cache, negative_ttl: Optional[float] = None):
+        self._inner = inner
+        self._cache = cache
+        self._negative_ttl = negative_ttl
+        self._dirty: Set[str] = set()
+        self.readonly = inner.readonly
+        self.posts = None
+        self.comments = None
+        self.search = None
+
+    async def __aenter__(self) -> "CachingUnitOfWork":
+        await self._inner.__aenter__()
+        self.posts = CachedPostRepository(
+            self._inner.posts, self._cache, self._dirty, self.readonly, self._negative_ttl
+        )
+        self.comments = CachedCommentRepository(self._inner.comments, self._dirty)
+        self.search = self._inner.search
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            await self._inner.__aexit__(exc_type, exc_val, exc_tb)
+            if not exc_type:
+                await self._invalidate()
+        finally:
+            self._dirty.clear()
+            self.posts = None
+            self.comments = None
+            self.search = None
+
+    async def commit(self) -> None:
+        await self._inner.commit()
+        await self._invalidate()
+
+    async def rollback(self) -> None:
+        await self._inner.rollback()
+        self._dirty.clear()
+
+    async def _invalidate(self) -> None:
+        for key in self._dirty:
+            await self._cache.invalidate(key)
+        self._dirty.clear()
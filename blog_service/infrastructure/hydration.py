@@ -0,0 +1,29 @@
+"""Build domain entities from rows our own storage wrote.
+
+Rows read back from SQLite or Mongo already hold typed values (UUID,
+datetime, PostStatus), which the compiled pydantic-core validator checks
+with very little work. Most of the cost of ``model_validate`` is the
+Python call wrapped around that validator, and ``BaseModel.model_construct``
+is slower still on pydantic 2. ``Hydrator`` validates through a
+``TypeAdapter``, which calls the compiled validator directly. Stored rows
+are still checked, and no pydantic internals are touched.
+"""
+from typing import Any, Callable, Dict, Generic, Type, TypeVar
+from pydantic import BaseModel, TypeAdapter
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+
+E = TypeVar("E", bound=BaseModel)
+
+class Hydrator(Generic[E]):
+    """Constructor for one entity class from a dict of already typed field values"""
+
+    def __init__(self, entity: Type[E]):
+        self.entity = entity
+        self._validate: Callable[[Dict[str, Any]], E] = TypeAdapter(entity).validate_python
+
+    def __call__(self, values: Dict[str, Any]) -> E:
+        return self._validate(values)
+
+hydrate_post: Hydrator[Post] = Hydrator(Post)
+hydrate_comment: Hydrator[Comment] = Hydrator(Comment)
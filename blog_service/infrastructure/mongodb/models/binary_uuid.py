@@ -0,0 +1,29 @@
+from typing import Any, Union
+from uuid import UUID
+from bson.binary import Binary, UuidRepresentation
+from core.config import get_settings
+
+settings = get_settings()
+
+def to_binary(value: UUID) -> Binary:
+    """A UUID as 16-byte BSON Binary subtype 4"""
+    return Binary.from_uuid(value, UuidRepresentation.STANDARD)
+
+def from_binary(value: Any) -> UUID:
+    """Decode a stored id, including string ids written before binary storage"""
+    if isinstance(value, UUID):
+        return value
+    if isinstance(value, Binary):
+        return value.as_uuid(UuidRepresentation.STANDARD)
+    return UUID(value)
+
+def id_match(value: UUID) -> Union[Binary, dict]:
+    """Equality match for an id field.
+
+    While MONGODB_UUID_STRING_FALLBACK is on, documents not yet converted by
+    ``blog migrate-uuids`` still match through their string id.
+    """
+    binary = to_binary(value)
+    if settings.MONGODB_UUID_STRING_FALLBACK:
+        return {"$in": [binary, str(value)]}
+    return binary
@@ -1,14 +1,19 @@
 from datetime import datetime
 from typing import Dict, Any
-from uuid import UUID
 from domain.entities.comment import Comment
+from infrastructure.hydration import hydrate_comment
+from .binary_uuid import from_binary, to_binary
+
+# Keyset pagination of a post's comments (created_at, _id); updated_at lets
+# the comment-set version aggregation be answered from the index alone
+PAGINATION_INDEX = [("post_id", 1), ("created_at", 1), ("_id", 1), ("updated_at", 1)]
 
 class CommentDocument:
     @staticmethod
     def to_document(comment: Comment) -> Dict[str, Any]:
         return {
-            "_id": str(comment.id),
-            "post_id": str(comment.post_id),
+            "_id": to_binary(comment.id),
+            "post_id": to_binary(comment.post_id),
             "content": comment.content,
             "author": comment.author,
             "created_at": comment.created_at,
@@ -17,11 +22,11 @@ class CommentDocument:
 
     @staticmethod
     def from_document(doc: Dict[str, Any]) -> Comment:
-        return Comment(
-            id=UUID(doc["_id"]),
-            post_id=UUID(doc["post_id"]),
-            content=doc["content"],
-            author=doc["author"],
-            created_at=doc["created_at"],
-            updated_at=doc.get("updated_at")
-        )
+        return hydrate_comment({
+            "id": from_binary(doc["_id"]),
+            "post_id": from_binary(doc["post_id"]),
+            "content": doc["content"],
+            "author": doc["author"],
+            "created_at": doc["created_at"],
+            "updated_at": doc.get("updated_at")
+        })
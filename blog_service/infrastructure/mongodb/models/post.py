@@ -1,14 +1,20 @@
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from uuid import UUID
+from typing import Optional, List, Dict, Any, Sequence
 from domain.entities.post import Post
 from domain.value_objects.post_status import PostStatus
+from domain.value_objects.post_summary import PostSummary, SUMMARY_FIELDS
+from infrastructure.hydration import hydrate_post
+from .binary_uuid import from_binary, to_binary
+from .comment import CommentDocument
+
+# Lets the version lookup behind conditional GETs be a covered query
+VERSION_INDEX = [("_id", 1), ("created_at", 1), ("updated_at", 1)]
 
 class PostDocument:
     @staticmethod
     def to_document(post: Post) -> Dict[str, Any]:
         return {
-            "_id": str(post.id),
+            "_id": to_binary(post.id),
             "title": post.title,
             "content": post.content,
             "author": post.author,
@@ -19,14 +25,51 @@ class PostDocument:
         }
 
     @staticmethod
-    def from_document(doc: Dict[str, Any]) -> Post:
-        return Post(
-            id=UUID(doc["_id"]),
-            title=doc["title"],
-            content=doc["content"],
-            author=doc["author"],
-            status=PostStatus(doc["status"]),
-            created_at=doc["created_at"],
-            updated_at=doc.get("updated_at"),
-            comments=[CommentDocument.from_document(comment) for comment in doc.get("comments", [])]
+    def projection(fields: Sequence[str]) -> Dict[str, Any]:
+        """Mongo projection returning only the given post fields"""
+        projection: Dict[str, Any] = {"_id": 1 if "id" in fields else 0}
+        for name in fields:
+            if name == "comments_count":
+                projection[name] = {"$size": {"$ifNull": ["$comments", []]}}
+            elif name != "id":
+                projection[name] = 1
+        return projection
+
+    @staticmethod
+    def from_projection(doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a projected document back to post field values"""
+        row = dict(doc)
+        if "_id" in row:
+            row["id"] = from_binary(row.pop("_id"))
+        if "status" in row:
+            row["status"] = PostStatus(row["status"])
+        return row
+
+    @staticmethod
+    def to_summary(doc: Dict[str, Any]) -> PostSummary:
+        """Map a document projected with SUMMARY_PROJECTION"""
+        return PostSummary(
+            from_binary(doc["_id"]),
+            doc["title"],
+            doc["author"],
+            PostStatus(doc["status"]),
+            doc["created_at"],
+            doc.get("updated_at"),
+            doc["comments_count"]
         )
+
+    @staticmethod
+    def from_document(doc: Dict[str, Any]) -> Post:
+        # Values are already typed, so validation only checks them
+        return hydrate_post({
+            "id": from_binary(doc["_id"]),
+            "title": doc["title"],
+            "content": doc["content"],
+            "author": doc["author"],
+            "status": PostStatus(doc["status"]),
+            "created_at": doc["created_at"],
+            "updated_at": doc.get("updated_at"),
+            "comments": [CommentDocument.from_document(comment) for comment in doc.get("comments", [])]
+        })
+
+SUMMARY_PROJECTION = PostDocument.projection(SUMMARY_FIELDS)
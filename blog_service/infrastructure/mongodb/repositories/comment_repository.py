@@ -1,38 +1,110 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from motor.motor_asyncio import AsyncIOMotorCollection
 from domain.entities.comment import Comment
+from domain.value_objects.entity_version import EntityVersion
+from domain.value_objects.page_cursor import PageCursor
 from application.ports.repositories.comment_repository import CommentRepository
 from ..models.comment import CommentDocument
+from ..models.binary_uuid import id_match, to_binary
+from ..transaction import LazyTransaction
 
 class MongoCommentRepository(CommentRepository):
-    def __init__(self, collection: AsyncIOMotorCollection):
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection,
+        transaction: Optional[LazyTransaction] = None
+    ):
         self.collection = collection
+        self.transaction = transaction
 
     async def add(self, comment: Comment) -> Comment:
         doc = CommentDocument.to_document(comment)
-        await self.collection.insert_one(doc)
+        await self.collection.insert_one(doc, session=await self._write_session())
         return comment
 
+    async def add_many(self, comments: List[Comment]) -> List[Comment]:
+        if not comments:
+            return []
+        docs = [CommentDocument.to_document(comment) for comment in comments]
+        await self.collection.insert_many(
+            docs, ordered=True, session=await self._write_session()
+        )
+        return list(comments)
+
     async def get(self, comment_id: UUID) -> Optional[Comment]:
-        doc = await self.collection.find_one({"_id": str(comment_id)})
+        doc = await self.collection.find_one(
+            {"_id": id_match(comment_id)}, session=self._read_session()
+        )
         return CommentDocument.from_document(doc) if doc else None
 
-    async def get_by_post(self, post_id: UUID) -> List[Comment]:
-        cursor = self.collection.find({"post_id": str(post_id)})
-        docs = await cursor.to_list(length=None)
+    async def get_by_post(
+        self,
+        post_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        query = {"post_id": id_match(post_id)}
+        if after:
+            query["$or"] = [
+                {"created_at": {"$gt": after.created_at}},
+                {"created_at": after.created_at, "_id": {"$gt": to_binary(after.id)}},
+            ]
+        cursor = self.collection.find(query, session=self._read_session()).sort([("created_at", 1), ("_id", 1)])
+        if limit:
+            cursor = cursor.limit(limit)
+        docs = await cursor.to_list(length=limit)
         return [CommentDocument.from_document(doc) for doc in docs]
 
+    async def get_version_by_post(self, post_id: UUID) -> EntityVersion:
+        pipeline = [
+            {"$match": {"post_id": id_match(post_id)}},
+            {"$group": {
+                "_id": None,
+                "count": {"$sum": 1},
+                "created_at": {"$max": "$created_at"},
+                "updated_at": {"$max": "$updated_at"},
+            }},
+        ]
+        docs = await self.collection.aggregate(pipeline, session=self._read_session()).to_list(length=1)
+        if not docs:
+            return EntityVersion(count=0)
+        doc = docs[0]
+        return EntityVersion(
+            count=doc["count"],
+            modified_at=max(filter(None, (doc["created_at"], doc["updated_at"])), default=None)
+        )
+
+    async def stream(self, batch_size: int = 500) -> AsyncIterator[Comment]:
+        cursor = (
+            self.collection.find({}, session=self._read_session())
+            .sort([("post_id", 1), ("created_at", 1), ("_id", 1)])
+            .batch_size(batch_size)
+        )
+        async for doc in cursor:
+            yield CommentDocument.from_document(doc)
+
     async def update(self, comment: Comment) -> Optional[Comment]:
         doc = CommentDocument.to_document(comment)
         result = await self.collection.replace_one(
-            {"_id": str(comment.id)},
-            doc
+            {"_id": id_match(comment.id)},
+            doc,
+            session=await self._write_session()
         )
         return comment if result.modified_count > 0 else None
 
     async def delete(self, comment_id: UUID) -> None:
-        await self.collection.delete_one({"_id": str(comment_id)})
+        await self.collection.delete_one(
+            {"_id": id_match(comment_id)}, session=await self._write_session()
+        )
 
     async def delete_by_post(self, post_id: UUID) -> None:
-        await self.collection.delete_many({"post_id": str(post_id)})
+        await self.collection.delete_many(
+            {"post_id": id_match(post_id)}, session=await self._write_session()
+        )
+
+    def _read_session(self):
+        return self.transaction.session if self.transaction else None
+
+    async def _write_session(self):
+        return await self.transaction.begin() if self.transaction else None
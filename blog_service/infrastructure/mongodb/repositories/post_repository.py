@@ -1,45 +1,160 @@
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.read_preferences import _ServerMode
 from domain.entities.post import Post
+from domain.value_objects.entity_version import EntityVersion
+from domain.value_objects.page_cursor import PageCursor
+from domain.value_objects.post_summary import PostSummary
 from application.ports.repositories.post_repository import PostRepository
-from ..models.post import PostDocument
+from ..models.post import PostDocument, SUMMARY_PROJECTION, VERSION_INDEX
+from ..models.binary_uuid import id_match, to_binary
+from ..transaction import LazyTransaction
 
 class MongoPostRepository(PostRepository):
-    def __init__(self, collection: AsyncIOMotorCollection):
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection,
+        list_read_preference: Optional[_ServerMode] = None,
+        transaction: Optional[LazyTransaction] = None
+    ):
         self.collection = collection
+        self.transaction = transaction
+        # List queries may be routed to secondaries; writes and get() stay on the primary
+        self.list_collection = (
+            collection.database.get_collection(
+                collection.name, read_preference=list_read_preference
+            )
+            if list_read_preference else collection
+        )
 
     async def add(self, post: Post) -> Post:
         doc = PostDocument.to_document(post)
-        await self.collection.insert_one(doc)
+        await self.collection.insert_one(doc, session=await self._write_session())
         return post
 
     async def get(self, post_id: UUID) -> Optional[Post]:
-        doc = await self.collection.find_one({"_id": str(post_id)})
+        doc = await self.collection.find_one({"_id": id_match(post_id)}, session=self._read_session())
         return PostDocument.from_document(doc) if doc else None
 
+    async def exists(self, post_id: UUID) -> bool:
+        # Projecting only _id makes this a covered query on the _id index,
+        # so the document and its embedded comments are never fetched
+        doc = await self.collection.find_one(
+            {"_id": id_match(post_id)}, {"_id": 1}, session=self._read_session()
+        )
+        return doc is not None
+
+    async def stream(self, batch_size: int = 500) -> AsyncIterator[Post]:
+        cursor = (
+            self._list_find({}, {"comments": 0})
+            .sort([("created_at", 1), ("_id", 1)])
+            .batch_size(batch_size)
+        )
+        async for doc in cursor:
+            yield PostDocument.from_document(doc)
+
+    async def get_version(self, post_id: UUID) -> Optional[EntityVersion]:
+        cursor = self.collection.find(
+            {"_id": id_match(post_id)},
+            {"_id": 0, "created_at": 1, "updated_at": 1},
+            session=self._read_session()
+        ).hint(VERSION_INDEX).limit(1)
+        docs = await cursor.to_list(length=1)
+        if not docs:
+            return None
+        return EntityVersion.of(docs[0]["created_at"], docs[0].get("updated_at"))
+
+    async def get_fields(
+        self,
+        post_id: UUID,
+        fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        doc = await self.collection.find_one(
+            {"_id": id_match(post_id)},
+            PostDocument.projection(fields),
+            session=self._read_session()
+        )
+        return PostDocument.from_projection(doc) if doc else None
+
+    async def list_fields(
+        self,
+        fields: Sequence[str],
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Dict[str, Any]]:
+        cursor = self._page(limit, after, PostDocument.projection(fields))
+        docs = await cursor.to_list(length=limit)
+        return [PostDocument.from_projection(doc) for doc in docs]
+
+    async def list_summaries(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[PostSummary]:
+        # Leaves content and the embedded comments on the server
+        docs = await self._page(limit, after, SUMMARY_PROJECTION).to_list(length=limit)
+        return [PostDocument.to_summary(doc) for doc in docs]
+
     async def update(self, post: Post) -> Optional[Post]:
         doc = PostDocument.to_document(post)
         result = await self.collection.replace_one(
-            {"_id": str(post.id)},
-            doc
+            {"_id": id_match(post.id)},
+            doc,
+            session=await self._write_session()
         )
         return post if result.modified_count > 0 else None
 
-    async def delete(self, post_id: UUID) -> None:
-        await self.collection.delete_one({"_id": str(post_id)})
+    async def delete(self, post_id: UUID) -> bool:
+        result = await self.collection.delete_one(
+            {"_id": id_match(post_id)}, session=await self._write_session()
+        )
+        return result.deleted_count > 0
 
-    async def list(self) -> List[Post]:
-        cursor = self.collection.find({})
-        docs = await cursor.to_list(length=None)
+    async def list(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Post]:
+        docs = await self._page(limit, after).to_list(length=limit)
         return [PostDocument.from_document(doc) for doc in docs]
 
+    def _page(
+        self,
+        limit: Optional[int],
+        after: Optional[PageCursor],
+        projection: Optional[Dict[str, Any]] = None
+    ):
+        query = {}
+        if after:
+            query = {"$or": [
+                {"created_at": {"$lt": after.created_at}},
+                {"created_at": after.created_at, "_id": {"$lt": to_binary(after.id)}},
+            ]}
+        cursor = self._list_find(query, projection).sort([("created_at", -1), ("_id", -1)])
+        if limit:
+            cursor = cursor.limit(limit)
+        return cursor
+
     async def get_by_author(self, author: str) -> List[Post]:
-        cursor = self.collection.find({"author": author})
+        cursor = self._list_find({"author": author})
         docs = await cursor.to_list(length=None)
         return [PostDocument.from_document(doc) for doc in docs]
 
     async def get_by_status(self, status: str) -> List[Post]:
-        cursor = self.collection.find({"status": status})
+        cursor = self._list_find({"status": status})
         docs = await cursor.to_list(length=None)
         return [PostDocument.from_document(doc) for doc in docs]
+
+    def _list_find(self, query: Dict[str, Any], projection: Optional[Dict[str, Any]] = None):
+        session = self._read_session()
+        if session:
+            # Reads inside a transaction must go to the primary
+            return self.collection.find(query, projection, session=session)
+        return self.list_collection.find(query, projection)
+
+    def _read_session(self):
+        return self.transaction.session if self.transaction else None
+
+    async def _write_session(self):
+        return await self.transaction.begin() if self.transaction else None
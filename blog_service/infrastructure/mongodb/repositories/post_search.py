@@ -0,0 +1,33 @@
+from typing import List, Optional
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.read_preferences import _ServerMode
+from domain.entities.post import Post
+from application.ports.repositories.post_search import PostSearch
+from ..models.post import PostDocument
+
+class MongoPostSearch(PostSearch):
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection,
+        read_preference: Optional[_ServerMode] = None
+    ):
+        self.collection = (
+            collection.database.get_collection(
+                collection.name, read_preference=read_preference
+            )
+            if read_preference else collection
+        )
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[Post]:
+        if not query.strip():
+            return []
+
+        score = {"$meta": "textScore"}
+        cursor = (
+            self.collection.find({"$text": {"$search": query}}, {"score": score})
+            .sort([("score", score)])
+            .skip(offset)
+            .limit(limit)
+        )
+        docs = await cursor.to_list(length=limit)
+        return [PostDocument.from_document(doc) for doc in docs]
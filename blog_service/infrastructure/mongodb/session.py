@@ -1,23 +1,93 @@
+import os
+from typing import Any, Dict, Optional
 import motor.motor_asyncio
-from core.config import get_settings
+from pymongo import TEXT
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
+from core.config import Settings, get_settings
+from infrastructure.query_profiler import MongoCommandProfiler
+from infrastructure.mongodb.models.comment import PAGINATION_INDEX as COMMENT_PAGINATION_INDEX
+from infrastructure.mongodb.models.post import VERSION_INDEX as POST_VERSION_INDEX
 
 settings = get_settings()
 
 # MongoDB connection URL
-MONGODB_URL = "mongodb://localhost:27017"
+MONGODB_URL = settings.MONGODB_URL
 DATABASE_NAME = "blog_db"
 
-client = motor.motor_asyncio.AsyncIOMotorClient(MONGODB_URL)
-database = client[DATABASE_NAME]
+def read_preference(name: str):
+    """Resolve a read preference mode name such as 'secondaryPreferred'"""
+    return make_read_preference(read_pref_mode_from_name(name), None)
+
+def client_options(settings: Settings) -> Dict[str, Any]:
+    """Build the Motor client keyword arguments from settings"""
+    options = {
+        "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGODB_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        # Writes and point reads; list/search routing is applied per operation
+        "readPreference": settings.MONGODB_READ_PREFERENCE,
+    }
+    if settings.MONGODB_COMPRESSORS:
+        # pymongo warns and skips any compressor whose module is not installed
+        options["compressors"] = settings.MONGODB_COMPRESSORS
+    return {name: value for name, value in options.items() if value is not None}
+
+# Read preference for list and search queries, which tolerate replica lag
+LIST_READ_PREFERENCE = read_preference(settings.MONGODB_LIST_READ_PREFERENCE)
+
+# A MongoClient is not fork-safe: its monitor threads and pooled sockets
+# stay with the process that opened it. Server workers create theirs in the
+# startup hook, and anything else gets one on first use.
+_client: Optional[motor.motor_asyncio.AsyncIOMotorClient] = None
+_client_pid: Optional[int] = None
+
+def create_client() -> motor.motor_asyncio.AsyncIOMotorClient:
+    """New Motor client for MONGODB_URL with the pool options and profiler"""
+    return motor.motor_asyncio.AsyncIOMotorClient(
+        MONGODB_URL,
+        event_listeners=[MongoCommandProfiler()] if settings.QUERY_PROFILING else [],
+        **client_options(settings)
+    )
+
+def get_client() -> motor.motor_asyncio.AsyncIOMotorClient:
+    """This process's client, created on first use"""
+    global _client, _client_pid
+    if _client is None or _client_pid != os.getpid():
+        _client = create_client()
+        _client_pid = os.getpid()
+    return _client
+
+def get_db() -> motor.motor_asyncio.AsyncIOMotorDatabase:
+    """The blog database on this process's client"""
+    return get_client()[DATABASE_NAME]
+
+def close_client() -> None:
+    """Close this process's client; the next use creates a new one"""
+    global _client
+    if _client is not None and _client_pid == os.getpid():
+        _client.close()
+    _client = None
 
 async def init_db():
     """Initialize MongoDB collections and indexes"""
+    database = get_db()
     # Create indexes if needed
     await database.posts.create_index("title")
     await database.posts.create_index("author")
+    # Keyset pagination indexes, matching the sort orders used by the repositories
+    await database.posts.create_index([("created_at", -1), ("_id", -1)])
+    await database.comments.create_index(COMMENT_PAGINATION_INDEX)
+    await database.posts.create_index(POST_VERSION_INDEX)
+    # Full-text search; title matches weigh more than body matches
+    await database.posts.create_index(
+        [("title", TEXT), ("content", TEXT)],
+        weights={"title": 10, "content": 1},
+        name="posts_text"
+    )
 
 async def get_database():
-    yield database
+    yield get_db()
 
 def get_collection(collection_name: str):
-    return database[collection_name]
+    return get_db()[collection_name]
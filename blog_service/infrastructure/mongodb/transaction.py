@@ -0,0 +1,34 @@
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession
+
+class LazyTransaction:
+    """Client session and transaction that are only started on the first write.
+
+    Reads issued before any write run outside the session, so a unit of work
+    that never writes costs no extra round trips. Once the transaction is open,
+    reads join it to see their own writes.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient):
+        self._client = client
+        self.session: Optional[AsyncIOMotorClientSession] = None
+
+    async def begin(self) -> AsyncIOMotorClientSession:
+        if self.session is None:
+            self.session = await self._client.start_session()
+        if not self.session.in_transaction:
+            self.session.start_transaction()
+        return self.session
+
+    async def commit(self) -> None:
+        if self.session and self.session.in_transaction:
+            await self.session.commit_transaction()
+
+    async def abort(self) -> None:
+        if self.session and self.session.in_transaction:
+            await self.session.abort_transaction()
+
+    async def end(self) -> None:
+        if self.session:
+            await self.session.end_session()
+            self.session = None
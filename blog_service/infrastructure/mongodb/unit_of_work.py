@@ -1,23 +1,40 @@
+from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.read_preferences import _ServerMode
 from infrastructure.mongodb.repositories.post_repository import MongoPostRepository
 from infrastructure.mongodb.repositories.comment_repository import MongoCommentRepository
+from infrastructure.mongodb.repositories.post_search import MongoPostSearch
+from infrastructure.mongodb.transaction import LazyTransaction
 
 class MongoUnitOfWork:
-    def __init__(self, client: AsyncIOMotorClient, database_name: str):
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        database_name: str,
+        list_read_preference: Optional[_ServerMode] = None,
+        readonly: bool = False
+    ):
         self._client = client
+        self._list_read_preference = list_read_preference
+        self.readonly = readonly
         self._db: AsyncIOMotorDatabase = client[database_name]
         self.posts: MongoPostRepository | None = None
         self.comments: MongoCommentRepository | None = None
-        self._transaction = None
+        self.search: MongoPostSearch | None = None
+        self._transaction: LazyTransaction | None = None
 
     async def __aenter__(self) -> "MongoUnitOfWork":
-        # Start transaction
-        self._transaction = await self._client.start_session()
-        await self._transaction.start_transaction()
+        # Read-only units of work never open a session; write units open
+        # their session and transaction on the first write
+        if not self.readonly:
+            self._transaction = LazyTransaction(self._client)
 
         # Initialize repositories with collections
-        self.posts = MongoPostRepository(self._db.posts)
-        self.comments = MongoCommentRepository(self._db.comments)
+        self.posts = MongoPostRepository(
+            self._db.posts, self._list_read_preference, self._transaction
+        )
+        self.comments = MongoCommentRepository(self._db.comments, self._transaction)
+        self.search = MongoPostSearch(self._db.posts, self._list_read_preference)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -27,15 +44,17 @@ class MongoUnitOfWork:
             else:
                 await self.commit()
         finally:
-            await self._transaction.end_session()
+            if self._transaction:
+                await self._transaction.end()
             self._transaction = None
             self.posts = None
             self.comments = None
+            self.search = None
 
     async def commit(self) -> None:
         if self._transaction:
-            await self._transaction.commit_transaction()
+            await self._transaction.commit()
 
     async def rollback(self) -> None:
         if self._transaction:
-            await self._transaction.abort_transaction()
+            await self._transaction.abort()
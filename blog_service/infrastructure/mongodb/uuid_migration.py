@@ -0,0 +1,52 @@
+"""Convert string ``_id``/``post_id`` values to BSON Binary subtype 4.
+
+A document's ``_id`` cannot be updated, so each batch inserts converted
+copies under their binary ids and then deletes the string originals: two
+round trips per batch. A run that stops between the two steps can simply
+be restarted; copies that already exist are skipped. Keep
+MONGODB_UUID_STRING_FALLBACK on until the run completes.
+"""
+from typing import Any, Callable, Dict
+from uuid import UUID
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.errors import BulkWriteError
+from .models.binary_uuid import to_binary
+
+DUPLICATE_KEY = 11000
+
+def _binary(value: Any) -> Any:
+    return to_binary(UUID(value)) if isinstance(value, str) else value
+
+def _convert_comment(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {**doc, "_id": _binary(doc["_id"]), "post_id": _binary(doc["post_id"])}
+
+def _convert_post(doc: Dict[str, Any]) -> Dict[str, Any]:
+    comments = [_convert_comment(comment) for comment in doc.get("comments", [])]
+    return {**doc, "_id": _binary(doc["_id"]), "comments": comments}
+
+async def _migrate(
+    collection: AsyncIOMotorCollection,
+    convert: Callable[[Dict[str, Any]], Dict[str, Any]],
+    batch_size: int
+) -> int:
+    migrated = 0
+    while True:
+        docs = await collection.find({"_id": {"$type": "string"}}).limit(batch_size).to_list(
+            length=batch_size
+        )
+        if not docs:
+            return migrated
+        try:
+            await collection.insert_many([convert(doc) for doc in docs], ordered=False)
+        except BulkWriteError as exc:
+            # Copies left by an interrupted run are fine; anything else is not
+            if any(error["code"] != DUPLICATE_KEY for error in exc.details["writeErrors"]):
+                raise
+        await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in docs]}})
+        migrated += len(docs)
+
+async def migrate_uuids(database: AsyncIOMotorDatabase, batch_size: int = 1000) -> Dict[str, int]:
+    """Convert every string id in posts and comments; returns documents converted per collection"""
+    posts = await _migrate(database.posts, _convert_post, batch_size)
+    comments = await _migrate(database.comments, _convert_comment, batch_size)
+    return {"posts": posts, "comments": comments}
@@ -0,0 +1,116 @@
+import heapq
+import json
+import logging
+import time
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Tuple
+from pymongo import monitoring
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from core.config import get_settings
+
+settings = get_settings()
+
+slow_query_logger = logging.getLogger("blog.slow_query")
+
+_current_profile: ContextVar[Optional["QueryProfile"]] = ContextVar(
+    "query_profile", default=None
+)
+
+def summarize(statement: str, width: int = 120) -> str:
+    """Collapse whitespace and truncate a statement for headers and logs"""
+    text = " ".join(statement.split())
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+class QueryProfile:
+    """Database activity recorded while serving one request"""
+
+    __slots__ = ("label", "query_count", "total_time", "slowest", "pending_commands", "_top_n")
+
+    def __init__(self, label: str, top_n: int = settings.QUERY_PROFILE_TOP_N):
+        self.label = label
+        self.query_count = 0
+        self.total_time = 0.0
+        # Min-heap of (duration, sequence, statement) holding the N slowest
+        self.slowest: List[Tuple[float, int, str]] = []
+        # In-flight Mongo commands by request id, completed by MongoCommandProfiler
+        self.pending_commands: Dict[int, str] = {}
+        self._top_n = top_n
+
+    def record(self, statement: str, duration: float) -> None:
+        self.query_count += 1
+        self.total_time += duration
+        entry = (duration, self.query_count, statement)
+        if len(self.slowest) < self._top_n:
+            heapq.heappush(self.slowest, entry)
+        elif duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+        if duration * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+            slow_query_logger.warning(json.dumps({
+                "event": "slow_query",
+                "request": self.label,
+                "duration_ms": round(duration * 1000, 3),
+                "statement": summarize(statement, width=1000),
+            }))
+
+    def server_timing(self) -> str:
+        """Render the profile as a Server-Timing header value"""
+        metrics = [
+            f'db;dur={self.total_time * 1000:.3f};desc="{self.query_count} queries"'
+        ]
+        ranked = sorted(self.slowest, key=lambda entry: entry[0], reverse=True)
+        for rank, (duration, _, statement) in enumerate(ranked, start=1):
+            desc = summarize(statement, width=60).replace('"', "'").replace("\\", "/")
+            metrics.append(f'db-{rank};dur={duration * 1000:.3f};desc="{desc}"')
+        return ", ".join(metrics)
+
+def start_profile(label: str) -> Token:
+    return _current_profile.set(QueryProfile(label))
+
+def current_profile() -> Optional[QueryProfile]:
+    return _current_profile.get()
+
+def end_profile(token: Token) -> None:
+    _current_profile.reset(token)
+
+def install_sqlalchemy_profiler(engine: Engine) -> None:
+    """Time every statement executed through the engine"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start_time"].pop()
+        profile = current_profile()
+        if profile is not None:
+            profile.record(statement, time.perf_counter() - started)
+
+class MongoCommandProfiler(monitoring.CommandListener):
+    """pymongo command listener feeding the current request's profile
+
+    Motor runs pymongo calls in an executor with a copy of the caller's
+    context, so the request's profile is visible from these callbacks.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        profile = current_profile()
+        if profile is not None:
+            statement = f"{event.command_name} {event.database_name}.{event.command.get(event.command_name)}"
+            profile.pending_commands[event.request_id] = statement
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event)
+
+    def _finish(self, event) -> None:
+        profile = current_profile()
+        if profile is None:
+            return
+        statement = profile.pending_commands.pop(event.request_id, None)
+        if statement is not None:
+            profile.record(statement, event.duration_micros / 1_000_000)
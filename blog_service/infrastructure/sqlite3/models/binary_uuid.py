@@ -0,0 +1,57 @@
+from typing import Any, List, Optional
+from uuid import UUID
+from sqlalchemy import ColumnElement, literal, select
+from sqlalchemy.types import LargeBinary, String, TypeDecorator
+from core.config import get_settings
+
+settings = get_settings()
+
+class BinaryUUID(TypeDecorator):
+    """UUID stored as a 16-byte BLOB instead of sqlmodel's 32-char hex text.
+
+    Hex ids written before the switch still load; ``blog migrate-uuids``
+    converts them in place, and ``id_match`` finds them until it has.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if not isinstance(value, UUID):
+            value = UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value: Any, dialect) -> Optional[UUID]:
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            return UUID(bytes=value)
+        return UUID(value)
+
+def id_match(column, value: UUID) -> ColumnElement:
+    """Equality condition on an id column.
+
+    While SQLITE_UUID_TEXT_FALLBACK is on, rows not yet converted by
+    ``blog migrate-uuids`` still match through their hex text id.
+    """
+    if settings.SQLITE_UUID_TEXT_FALLBACK:
+        return column.in_([literal(value.bytes, LargeBinary), literal(value.hex, String)])
+    return column == value
+
+def id_values(value: UUID) -> List[Any]:
+    """Stored forms of an id, for an expanding ``IN`` in hand-written SQL"""
+    if settings.SQLITE_UUID_TEXT_FALLBACK:
+        return [value.bytes, value.hex]
+    return [value.bytes]
+
+def stored_id(column, value: UUID) -> Any:
+    """``value`` as ``column`` holds it, for copying into a foreign key.
+
+    While SQLITE_UUID_TEXT_FALLBACK is on this reads the referenced row, so
+    a key that is still hex text is copied as text and the constraint holds.
+    """
+    if settings.SQLITE_UUID_TEXT_FALLBACK:
+        return select(column).where(id_match(column, value)).scalar_subquery()
+    return value
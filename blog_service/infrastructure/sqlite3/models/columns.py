@@ -0,0 +1,15 @@
+from typing import Any, Dict, Sequence
+from sqlmodel import SQLModel
+
+def column_values(model: SQLModel, names: Sequence[str]) -> Dict[str, Any]:
+    """Column values of a loaded row, in ``names`` order.
+
+    Loaded columns sit in the instance ``__dict__``, and reading them there
+    skips the instrumented descriptors. Expired or deferred columns are
+    missing from it, so those rows go through ``getattr`` and load them.
+    """
+    state = model.__dict__
+    try:
+        return {name: state[name] for name in names}
+    except KeyError:
+        return {name: getattr(model, name) for name in names}
@@ -1,19 +1,44 @@
 from datetime import datetime
-from typing import Optional
-from uuid import UUID, uuid4
-from sqlmodel import Field, SQLModel
+from typing import Optional, TYPE_CHECKING
+from uuid import UUID
+from sqlalchemy import ForeignKey, Index
+from sqlmodel import Field, SQLModel, Relationship
 from domain.entities.comment import Comment
+from domain.value_objects.entity_id import new_id
+from infrastructure.hydration import hydrate_comment
+from .binary_uuid import BinaryUUID
+from .columns import column_values
+
+if TYPE_CHECKING:
+    from .post import PostModel
+
+COMMENT_COLUMNS = ("id", "post_id", "content", "author", "created_at", "updated_at")
 
 class CommentModel(SQLModel, table=True):
     __tablename__ = "comments"
+    __table_args__ = (
+        # Keyset pagination of a post's comments: ORDER BY created_at, id.
+        # updated_at makes it cover the comment-set version lookup too
+        Index(
+            "ix_comments_post_id_created_at_id_updated_at",
+            "post_id", "created_at", "id", "updated_at"
+        ),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    post_id: UUID = Field(foreign_key="posts.id")
+    id: UUID = Field(default_factory=new_id, primary_key=True, sa_type=BinaryUUID)
+    post_id: UUID = Field(
+        sa_type=BinaryUUID,
+        sa_column_args=[ForeignKey("posts.id", ondelete="CASCADE")],
+        nullable=False
+    )
     content: str
     author: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = Field(default=None)
 
+    # Relationships
+    post: Optional["PostModel"] = Relationship(back_populates="comments")
+
     @classmethod
     def from_entity(cls, comment: Comment) -> "CommentModel":
         return cls(
@@ -26,14 +51,7 @@ class CommentModel(SQLModel, table=True):
         )
 
     def to_entity(self) -> Comment:
-        return Comment(
-            id=self.id,
-            post_id=self.post_id,
-            content=self.content,
-            author=self.author,
-            created_at=self.created_at,
-            updated_at=self.updated_at
-        )
+        return hydrate_comment(column_values(self, COMMENT_COLUMNS))
 
     def update_from_entity(self, comment: Comment) -> None:
         self.content = comment.content
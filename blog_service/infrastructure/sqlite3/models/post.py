@@ -1,15 +1,29 @@
 from datetime import datetime
 from typing import Optional, List
-from uuid import UUID, uuid4
+from uuid import UUID
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 from domain.entities.post import Post
 from domain.value_objects.post_status import PostStatus
+from domain.value_objects.entity_id import new_id
+from infrastructure.hydration import hydrate_post
+from .binary_uuid import BinaryUUID
+from .columns import column_values
 from .comment import CommentModel
 
+POST_COLUMNS = ("id", "title", "content", "author", "status", "created_at", "updated_at")
+
 class PostModel(SQLModel, table=True):
     __tablename__ = "posts"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        # Covers the version lookup behind conditional GETs, so a 304 never
+        # reads the row itself
+        Index("ix_posts_id_version", "id", "created_at", "updated_at"),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=new_id, primary_key=True, sa_type=BinaryUUID)
     title: str = Field(index=True)
     content: str
     author: str = Field(index=True)
@@ -21,7 +35,10 @@ class PostModel(SQLModel, table=True):
     comments: List["CommentModel"] = Relationship(
         back_populates="post",
         sa_relationship_kwargs={
-            "cascade": "all, delete-orphan"
+            "cascade": "all, delete-orphan",
+            "lazy": "selectin",
+            # Let ON DELETE CASCADE remove children instead of loading them
+            "passive_deletes": True
         }
     )
 
@@ -38,16 +55,10 @@ class PostModel(SQLModel, table=True):
         )
 
     def to_entity(self) -> Post:
-        return Post(
-            id=self.id,
-            title=self.title,
-            content=self.content,
-            author=self.author,
-            status=self.status,
-            created_at=self.created_at,
-            updated_at=self.updated_at,
-            comments=[comment.to_entity() for comment in self.comments]
-        )
+        # Values are already typed, so validation only checks them
+        values = column_values(self, POST_COLUMNS)
+        values["comments"] = [comment.to_entity() for comment in self.comments]
+        return hydrate_post(values)
 
     def update_from_entity(self, post: Post) -> None:
         self.title = post.title
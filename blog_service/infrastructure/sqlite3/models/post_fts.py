@@ -0,0 +1,36 @@
+# FTS5 index over posts.title/posts.content. It is an external-content table,
+# so the text is stored once in ``posts`` and the triggers below keep the
+# index in step with every insert, update and delete.
+#
+# The index is keyed by the posts rowid; after a VACUUM run
+# ``INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')``.
+POST_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+        title, content, content='posts', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(rowid, title, content)
+        VALUES (new.rowid, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content)
+        VALUES ('delete', old.rowid, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF title, content ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content)
+        VALUES ('delete', old.rowid, old.title, old.content);
+        INSERT INTO posts_fts(rowid, title, content)
+        VALUES (new.rowid, new.title, new.content);
+    END
+    """,
+]
+
+# Index rows that existed before the table was created
+POST_FTS_REBUILD = "INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"
@@ -1,60 +1,119 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
+from sqlalchemy import delete, func, insert, tuple_, update
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from domain.entities.comment import Comment
+from domain.value_objects.entity_version import EntityVersion
+from domain.value_objects.page_cursor import PageCursor
 from application.ports.repositories.comment_repository import CommentRepository
+from infrastructure.sqlite3.models.binary_uuid import id_match, stored_id
 from infrastructure.sqlite3.models.comment import CommentModel
-from infrastructure.sqlite3.session import Session
+from infrastructure.sqlite3.models.post import PostModel
+
+def comment_row(comment: Comment) -> dict:
+    return {
+        "id": comment.id,
+        "post_id": comment.post_id,
+        "content": comment.content,
+        "author": comment.author,
+        "created_at": comment.created_at,
+        "updated_at": comment.updated_at
+    }
 
 class SQLiteCommentRepository(CommentRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
     async def add(self, comment: Comment) -> Comment:
-        comment_model = CommentModel.from_entity(comment)
-        self.session.add(comment_model)
-        await self.session.flush()
-        return comment_model.to_entity()
+        # post_id is copied from the post row, so a post whose id is still
+        # hex text gets a matching foreign key
+        values = {**comment_row(comment), "post_id": stored_id(PostModel.id, comment.post_id)}
+        await self.session.execute(insert(CommentModel).values(values))
+        return comment
+
+    async def add_many(self, comments: List[Comment]) -> List[Comment]:
+        if not comments:
+            return []
+        # One executemany of INSERT ... VALUES instead of a flush per ORM object
+        await self.session.execute(
+            insert(CommentModel),
+            [comment_row(comment) for comment in comments]
+        )
+        return list(comments)
 
     async def get(self, comment_id: UUID) -> Comment:
-        stmt = select(CommentModel).where(CommentModel.id == comment_id)
+        stmt = (
+            select(CommentModel)
+            .where(id_match(CommentModel.id, comment_id))
+            .execution_options(populate_existing=True)
+        )
         result = await self.session.execute(stmt)
         comment_model = result.scalar_one_or_none()
         return comment_model.to_entity() if comment_model else None
 
-    async def get_by_post(self, post_id: UUID) -> List[Comment]:
-        stmt = select(CommentModel).where(CommentModel.post_id == post_id)
+    async def get_by_post(
+        self,
+        post_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Comment]:
+        stmt = (
+            select(CommentModel)
+            .where(id_match(CommentModel.post_id, post_id))
+            .order_by(CommentModel.created_at, CommentModel.id)
+        )
+        if after:
+            stmt = stmt.where(
+                tuple_(CommentModel.created_at, CommentModel.id) > (after.created_at, after.id)
+            )
+        if limit:
+            stmt = stmt.limit(limit)
         result = await self.session.execute(stmt)
         comment_models = result.scalars().all()
         return [cm.to_entity() for cm in comment_models]
 
+    async def get_version_by_post(self, post_id: UUID) -> EntityVersion:
+        stmt = select(
+            func.count(),
+            func.max(CommentModel.created_at),
+            func.max(CommentModel.updated_at)
+        ).where(id_match(CommentModel.post_id, post_id))
+        count, created_at, updated_at = (await self.session.execute(stmt)).one()
+        return EntityVersion(
+            count=count,
+            modified_at=max(filter(None, (created_at, updated_at)), default=None)
+        )
+
+    async def stream(self, batch_size: int = 500) -> AsyncIterator[Comment]:
+        stmt = (
+            select(CommentModel)
+            .order_by(CommentModel.post_id, CommentModel.created_at, CommentModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for comment_model in result:
+            yield comment_model.to_entity()
+
     async def update(self, comment: Comment) -> Comment:
-        stmt = select(CommentModel).where(CommentModel.id == comment.id)
-        result = await self.session.execute(stmt)
-        comment_model = result.scalar_one_or_none()
-        if comment_model:
-            comment_model.content = comment.content
-            comment_model.author = comment.author
-            comment_model.updated_at = comment.updated_at
-            await self.session.flush()
-            return comment_model.to_entity()
-        return None
+        # A flush would match the row by its BLOB id only
+        stmt = (
+            update(CommentModel)
+            .where(id_match(CommentModel.id, comment.id))
+            .values(content=comment.content, author=comment.author, updated_at=comment.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        if not (await self.session.execute(stmt)).rowcount:
+            return None
+        return await self.get(comment.id)
 
     async def delete(self, comment_id: UUID) -> None:
-        stmt = select(CommentModel).where(CommentModel.id == comment_id)
-        result = await self.session.execute(stmt)
-        comment_model = result.scalar_one_or_none()
-        if comment_model:
-            await self.session.delete(comment_model)
-            await self.session.flush()
+        stmt = delete(CommentModel).where(id_match(CommentModel.id, comment_id))
+        await self.session.execute(stmt)
 
     async def delete_by_post(self, post_id: UUID) -> None:
-        stmt = select(CommentModel).where(CommentModel.post_id == post_id)
-        result = await self.session.execute(stmt)
-        comment_models = result.scalars().all()
-        for comment_model in comment_models:
-            await self.session.delete(comment_model)
-        await self.session.flush()
+        stmt = delete(CommentModel).where(id_match(CommentModel.post_id, post_id))
+        await self.session.execute(stmt)
 
     async def list(self) -> List[Comment]:
         stmt = select(CommentModel)
@@ -1,44 +1,167 @@
-from typing import List, Optional
-from sqlmodel import Session, select
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+from uuid import UUID
+from sqlalchemy import DateTime, bindparam, delete, func, literal, text, tuple_, update
+from sqlalchemy.orm import noload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from domain.entities.post import Post
+from domain.value_objects.entity_version import EntityVersion
+from domain.value_objects.page_cursor import PageCursor
+from domain.value_objects.post_summary import PostSummary, SUMMARY_FIELDS
 from application.ports.repositories.post_repository import PostRepository
+from infrastructure.sqlite3.models.post import PostModel
+from infrastructure.sqlite3.models.comment import CommentModel
+from infrastructure.sqlite3.models.binary_uuid import id_match, id_values
+
+# The planner prefers the primary key index for id lookups, which then reads
+# the row, overflow pages of long posts included. Force the covering index.
+VERSION_QUERY = text(
+    "SELECT created_at, updated_at FROM posts INDEXED BY ix_posts_id_version"
+    " WHERE id IN :post_ids"
+).bindparams(bindparam("post_ids", expanding=True)).columns(
+    created_at=DateTime, updated_at=DateTime
+)
+
+def field_columns(fields: Sequence[str]) -> list:
+    """Columns for a sparse fieldset; comments_count is a correlated COUNT"""
+    columns = []
+    for name in fields:
+        if name == "comments_count":
+            count = (
+                select(func.count(CommentModel.id))
+                .where(CommentModel.post_id == PostModel.id)
+                .scalar_subquery()
+            )
+            columns.append(count.label(name))
+        else:
+            columns.append(getattr(PostModel, name).label(name))
+    return columns
+
+def page(stmt, limit: Optional[int], after: Optional[PageCursor]):
+    """Newest-first keyset page of a posts query"""
+    stmt = stmt.order_by(PostModel.created_at.desc(), PostModel.id.desc())
+    if after:
+        stmt = stmt.where(
+            tuple_(PostModel.created_at, PostModel.id) < (after.created_at, after.id)
+        )
+    if limit:
+        stmt = stmt.limit(limit)
+    return stmt
 
 class SQLitePostRepository(PostRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, post: Post) -> Post:
-        self.session.add(post)
-        self.session.commit()
-        self.session.refresh(post)
+    async def add(self, post: Post) -> Post:
+        post_model = PostModel.from_entity(post)
+        self.session.add(post_model)
+        await self.session.flush()
         return post
 
-    async def get_by_id(self, post_id: int) -> Optional[Post]:
-        return self.session.get(Post, post_id)
+    async def get(self, post_id: UUID) -> Optional[Post]:
+        post_model = await self._load(post_id)
+        return post_model.to_entity() if post_model else None
+
+    async def _load(self, post_id: UUID) -> Optional[PostModel]:
+        # The relationship loader binds the post id as a BLOB and would miss
+        # comments still keyed by hex text, so they are fetched by id_match
+        stmt = (
+            select(PostModel)
+            .where(id_match(PostModel.id, post_id))
+            .options(noload(PostModel.comments))
+            .execution_options(populate_existing=True)
+        )
+        post_model = (await self.session.exec(stmt)).first()
+        if post_model:
+            comments = await self.session.exec(
+                select(CommentModel)
+                .where(id_match(CommentModel.post_id, post_id))
+                .order_by(CommentModel.created_at, CommentModel.id)
+            )
+            set_committed_value(post_model, "comments", comments.all())
+        return post_model
+
+    async def exists(self, post_id: UUID) -> bool:
+        # SELECT 1 is answered from the primary key index alone
+        stmt = select(literal(1)).where(id_match(PostModel.id, post_id)).limit(1)
+        return (await self.session.execute(stmt)).first() is not None
+
+    async def stream(self, batch_size: int = 500) -> AsyncIterator[Post]:
+        stmt = (
+            select(PostModel)
+            .options(noload(PostModel.comments))
+            .order_by(PostModel.created_at, PostModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for post_model in result:
+            yield post_model.to_entity()
 
-    async def get_all(self) -> List[Post]:
-        statement = select(Post)
-        return self.session.exec(statement).all()
+    async def get_version(self, post_id: UUID) -> Optional[EntityVersion]:
+        row = (await self.session.execute(VERSION_QUERY, {"post_ids": id_values(post_id)})).first()
+        return EntityVersion.of(*row) if row else None
 
-    async def update(self, post_id: int, post: Post) -> Optional[Post]:
-        db_post = await self.get_by_id(post_id)
-        if not db_post:
+    async def get_fields(
+        self,
+        post_id: UUID,
+        fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        stmt = select(*field_columns(fields)).where(id_match(PostModel.id, post_id))
+        result = await self.session.execute(stmt)
+        row = result.mappings().first()
+        return dict(row) if row else None
+
+    async def list_fields(
+        self,
+        fields: Sequence[str],
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Dict[str, Any]]:
+        stmt = page(select(*field_columns(fields)), limit, after)
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def list_summaries(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[PostSummary]:
+        # Columns only, with the comment count from the comments index;
+        # neither the content nor any comment row is read
+        stmt = page(select(*field_columns(SUMMARY_FIELDS)), limit, after)
+        result = await self.session.execute(stmt)
+        return [PostSummary._make(row) for row in result.all()]
+
+    async def update(self, post: Post) -> Optional[Post]:
+        # A flush would match the row by its BLOB id only
+        stmt = (
+            update(PostModel)
+            .where(id_match(PostModel.id, post.id))
+            .values(
+                title=post.title,
+                content=post.content,
+                author=post.author,
+                status=post.status,
+                updated_at=datetime.utcnow()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if not (await self.session.execute(stmt)).rowcount:
             return None
-        
-        post_data = post.dict(exclude_unset=True)
-        for key, value in post_data.items():
-            setattr(db_post, key, value)
-        
-        self.session.add(db_post)
-        self.session.commit()
-        self.session.refresh(db_post)
-        return db_post
-
-    async def delete(self, post_id: int) -> bool:
-        post = await self.get_by_id(post_id)
-        if not post:
-            return False
-        
-        self.session.delete(post)
-        self.session.commit()
-        return True
+        return (await self._load(post.id)).to_entity()
+
+    async def delete(self, post_id: UUID) -> bool:
+        # Comments go with it through the ON DELETE CASCADE foreign key
+        stmt = delete(PostModel).where(id_match(PostModel.id, post_id))
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
+
+    async def list(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None
+    ) -> List[Post]:
+        result = await self.session.exec(page(select(PostModel), limit, after))
+        return [pm.to_entity() for pm in result.all()]
@@ -0,0 +1,34 @@
+from typing import List
+from sqlalchemy import column, literal_column, table, text
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from domain.entities.post import Post
+from application.ports.repositories.post_search import PostSearch
+from infrastructure.sqlite3.models.post import PostModel
+
+posts_fts = table("posts_fts", column("rowid"), column("rank"))
+
+def to_match_expression(query: str) -> str:
+    """Quote every term so user input can't inject FTS5 query syntax"""
+    terms = query.split()
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+class SQLitePostSearch(PostSearch):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> List[Post]:
+        match = to_match_expression(query)
+        if not match:
+            return []
+
+        stmt = (
+            select(PostModel)
+            .join(posts_fts, posts_fts.c.rowid == literal_column("posts.rowid"))
+            .where(text("posts_fts MATCH :match").bindparams(match=match))
+            .order_by(posts_fts.c.rank)
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.exec(stmt)
+        return [pm.to_entity() for pm in result.all()]
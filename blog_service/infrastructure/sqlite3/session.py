@@ -1,20 +1,90 @@
-from sqlmodel import SQLModel, Session, create_engine
+import os
+from typing import Optional
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from core.config import get_settings
+from infrastructure.query_profiler import install_sqlalchemy_profiler
+from infrastructure.sqlite3.models.post_fts import POST_FTS_DDL, POST_FTS_REBUILD
 
 settings = get_settings()
 
-# SQLite database URL
-SQLITE_DATABASE_URL = "sqlite:///./blog.db"
+# SQLite database URL (aiosqlite runs each connection in its own thread)
+SQLITE_DATABASE_URL = settings.SQLITE_DATABASE_URL
 
-engine = create_engine(
-    SQLITE_DATABASE_URL, 
-    echo=True,
-    connect_args={"check_same_thread": False}
-)
+# The engine and its pool belong to one process: connections and their
+# aiosqlite threads do not survive a fork. Server workers create theirs in
+# the startup hook, and anything else gets one on first use.
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[sessionmaker] = None
+_engine_pid: Optional[int] = None
 
-def init_db():
-    SQLModel.metadata.create_all(engine)
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    # WAL lets readers proceed while a write transaction is open
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # SQLite only enforces FOREIGN KEY / ON DELETE CASCADE when asked to
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
 
-def get_session():
-    with Session(engine) as session:
+def create_engine() -> AsyncEngine:
+    """New engine for SQLITE_DATABASE_URL with the connection pragmas and profiler"""
+    engine = create_async_engine(SQLITE_DATABASE_URL, echo=settings.SQL_ECHO)
+    if settings.QUERY_PROFILING:
+        install_sqlalchemy_profiler(engine.sync_engine)
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragma)
+    return engine
+
+def get_engine() -> AsyncEngine:
+    """This process's engine, created on first use"""
+    global _engine, _session_factory, _engine_pid
+    if _engine is None or _engine_pid != os.getpid():
+        # An engine inherited across fork is dropped, not disposed: its
+        # connections belong to the parent
+        _engine = create_engine()
+        _session_factory = sessionmaker(_engine, class_=AsyncSession, expire_on_commit=False)
+        _engine_pid = os.getpid()
+    return _engine
+
+def new_session() -> AsyncSession:
+    """Session on this process's engine"""
+    get_engine()
+    return _session_factory()
+
+async def dispose_engine() -> None:
+    """Close this process's pooled connections; the next use creates a new engine"""
+    global _engine, _session_factory
+    if _engine is not None and _engine_pid == os.getpid():
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
+
+def create_missing_indexes(connection) -> None:
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+async def init_db():
+    async with get_engine().begin() as conn:
+        # Workers starting together each run this; the write lock makes
+        # them create the schema one after another instead of racing
+        await conn.exec_driver_sql("BEGIN IMMEDIATE")
+        await conn.run_sync(SQLModel.metadata.create_all)
+        # create_all skips indexes of tables that already exist; add any that
+        # were introduced after the database was created
+        await conn.run_sync(create_missing_indexes)
+
+        # FTS5 virtual table and sync triggers are not part of the SQLModel metadata
+        fts_exists = await conn.scalar(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'posts_fts'")
+        )
+        for ddl in POST_FTS_DDL:
+            await conn.execute(text(ddl))
+        if not fts_exists:
+            await conn.execute(text(POST_FTS_REBUILD))
+
+async def get_session():
+    async with new_session() as session:
         yield session
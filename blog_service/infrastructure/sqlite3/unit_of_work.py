@@ -1,26 +1,34 @@
-from infrastructure.sqlite3.session import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from infrastructure.sqlite3.session import new_session
 from infrastructure.sqlite3.repositories.post_repository import SQLitePostRepository
 from infrastructure.sqlite3.repositories.comment_repository import SQLiteCommentRepository
+from infrastructure.sqlite3.repositories.post_search import SQLitePostSearch
 
 class SQLiteUnitOfWork:
-    def __init__(self):
-        self._session: Session | None = None
+    def __init__(self, readonly: bool = False):
+        # SQLAlchemy sessions already begin lazily, so read-only mode only
+        # skips the rollback on exit
+        self.readonly = readonly
+        self._session: AsyncSession | None = None
         self.posts: SQLitePostRepository | None = None
         self.comments: SQLiteCommentRepository | None = None
+        self.search: SQLitePostSearch | None = None
 
     async def __aenter__(self) -> "SQLiteUnitOfWork":
-        self._session = Session()
+        self._session = new_session()
         self.posts = SQLitePostRepository(self._session)
         self.comments = SQLiteCommentRepository(self._session)
+        self.search = SQLitePostSearch(self._session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if exc_type:
+        if exc_type and not self.readonly:
             await self.rollback()
         await self._session.close()
         self._session = None
         self.posts = None
         self.comments = None
+        self.search = None
 
     async def commit(self) -> None:
         await self._session.commit()
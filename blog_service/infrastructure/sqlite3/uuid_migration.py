@@ -0,0 +1,63 @@
+"""Convert hex-text UUID keys to 16-byte BLOBs in place.
+
+Rows written before ``BinaryUUID`` hold ids as 32-char hex text. Each batch
+is one short ``BEGIN IMMEDIATE`` transaction, so WAL readers keep going and
+writers only wait for the batch in progress. A BLOB never equals its hex
+text, so until every batch has committed, id lookups find unconverted rows
+only through ``id_match`` with SQLITE_UUID_TEXT_FALLBACK on (the default).
+Turn it off once the migration has finished.
+"""
+from typing import Dict
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+async def migrate_uuids(engine: AsyncEngine, batch_size: int = 1000) -> Dict[str, int]:
+    """Convert every text id in posts and comments; returns rows converted per table"""
+    migrated = {"posts": 0, "comments": 0}
+
+    while True:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("BEGIN IMMEDIATE")
+            # A post and its comments' post_id change together; check the
+            # foreign key once both sides are updated
+            await conn.exec_driver_sql("PRAGMA defer_foreign_keys = ON")
+            rows = (await conn.exec_driver_sql(
+                "SELECT rowid, id FROM posts WHERE typeof(id) = 'text' LIMIT ?",
+                (batch_size,)
+            )).all()
+            if not rows:
+                break
+            await conn.exec_driver_sql(
+                "UPDATE posts SET id = ? WHERE rowid = ?",
+                [(UUID(post_id).bytes, rowid) for rowid, post_id in rows]
+            )
+            await conn.exec_driver_sql(
+                "UPDATE comments SET post_id = ? WHERE post_id = ?",
+                [(UUID(post_id).bytes, post_id) for _, post_id in rows]
+            )
+        migrated["posts"] += len(rows)
+
+    while True:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("BEGIN IMMEDIATE")
+            await conn.exec_driver_sql("PRAGMA defer_foreign_keys = ON")
+            rows = (await conn.exec_driver_sql(
+                "SELECT rowid, id, post_id FROM comments"
+                " WHERE typeof(id) = 'text' OR typeof(post_id) = 'text' LIMIT ?",
+                (batch_size,)
+            )).all()
+            if not rows:
+                break
+            await conn.exec_driver_sql(
+                "UPDATE comments SET id = ?, post_id = ? WHERE rowid = ?",
+                [
+                    (_as_bytes(comment_id), _as_bytes(post_id), rowid)
+                    for rowid, comment_id, post_id in rows
+                ]
+            )
+        migrated["comments"] += len(rows)
+
+    return migrated
+
+def _as_bytes(value) -> bytes:
+    return value if isinstance(value, bytes) else UUID(value).bytes
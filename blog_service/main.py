@@ -1,13 +1,25 @@
+import asyncio
+import importlib.util
+import multiprocessing
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
 import uvicorn
 from enum import Enum
-from typing import Optional
+from http.client import HTTPConnection
+from typing import List, Optional
 
 import typer
 from rich import print
 from rich.console import Console
 from rich.table import Table
 
-from core.app_factory import AppFactory
+from core.app_factory import DB_ENV, FRAMEWORK_ENV, LOOP_ENV, create_worker_app
+from core.config import get_settings
 
 console = Console()
 app = typer.Typer(
@@ -23,29 +35,99 @@ class Database(str, Enum):
     SQLITE = "sqlite"
     MONGO = "mongo"
 
+class EventLoop(str, Enum):
+    ASYNCIO = "asyncio"
+    UVLOOP = "uvloop"
+
+class HttpParser(str, Enum):
+    H11 = "h11"
+    HTTPTOOLS = "httptools"
+
+def ensure_cache_server() -> Optional[multiprocessing.Process]:
+    """Start the local cache server when the shared backend has nothing to talk to"""
+    settings = get_settings()
+    if not settings.POST_CACHE_ENABLED or settings.CACHE_BACKEND != "shared":
+        return None
+    from infrastructure.cache.server import run_server
+    from infrastructure.cache.shared import SharedCache
+
+    async def reachable() -> bool:
+        cache = SharedCache(settings.CACHE_URL, 0, bytes, bytes)
+        try:
+            return await cache.ping()
+        finally:
+            await cache.close()
+
+    if asyncio.run(reachable()):
+        return None
+    process = multiprocessing.Process(
+        target=run_server,
+        args=(settings.CACHE_URL, settings.POST_CACHE_MAX_SIZE, settings.POST_CACHE_TTL_SECONDS),
+        daemon=True,
+        name="cache-server",
+    )
+    process.start()
+    # Wait until it accepts connections so the first requests are not misses
+    for _ in range(50):
+        if asyncio.run(reachable()):
+            break
+        time.sleep(0.1)
+    print(f"[green]Started cache server on {settings.CACHE_URL}[/green]")
+    return process
+
 def run_app(
     framework: str,
     db: str,
     host: str = "0.0.0.0",
     port: int = 8000,
-    reload: bool = False
+    reload: bool = False,
+    workers: int = 1,
+    loop: Optional[str] = None,
+    http: Optional[str] = None
 ):
-    """Run the application with specified configuration"""
-    web_app = AppFactory.create_app(framework=framework, db=db)
-    
+    """Run the application with specified configuration
+
+    Each worker process builds its own app through ``create_worker_app``,
+    so engines, pools and clients are opened after the worker starts.
+    ``loop`` and ``http`` of None leave the choice to the server, which
+    prefers uvloop and httptools when they are installed.
+    """
+    ensure_cache_server()
+    if workers > 1 and get_settings().CACHE_BACKEND == "memory":
+        print(
+            "[yellow]Each worker keeps its own post and response caches, so a write in one worker "
+            "reaches the others only when their entries expire; set CACHE_BACKEND=shared to share them[/yellow]"
+        )
+    os.environ[FRAMEWORK_ENV] = framework.lower()
+    os.environ[DB_ENV] = db.lower()
+    os.environ[LOOP_ENV] = loop or ""
+
     if framework.lower() == 'fastapi':
         uvicorn.run(
-            web_app,
+            "core.app_factory:create_worker_app",
+            factory=True,
             host=host,
             port=port,
-            reload=reload
+            reload=reload,
+            workers=workers,
+            loop=loop or "auto",
+            http=http or "auto"
         )
     else:  # sanic
-        web_app.run(
+        from sanic import Sanic
+        from sanic.worker.loader import AppLoader
+
+        if http:
+            print("[yellow]Sanic always uses its own HTTP/1.1 parser; --http only applies to FastAPI[/yellow]")
+        loader = AppLoader(factory=create_worker_app)
+        web_app = loader.load()
+        web_app.prepare(
             host=host,
             port=port,
-            debug=reload
+            debug=reload,
+            workers=workers
         )
+        Sanic.serve(primary=web_app, app_loader=loader)
 
 @app.command(name="run")
 def run(
@@ -76,6 +158,24 @@ def run(
         "--reload", "-r",
         help="Enable auto-reload for development",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers", "-w",
+        min=1,
+        help="Worker processes; each opens its own database connections",
+    ),
+    loop: Optional[EventLoop] = typer.Option(
+        None,
+        "--loop",
+        help="Event loop (default: uvloop when installed)",
+        case_sensitive=False,
+    ),
+    http: Optional[HttpParser] = typer.Option(
+        None,
+        "--http",
+        help="HTTP/1.1 parser for uvicorn (default: httptools when installed)",
+        case_sensitive=False,
+    ),
 ):
     """Run the Blog Service with specified configuration"""
     # Show configuration table
@@ -85,6 +185,9 @@ def run(
     table.add_row("Host", host)
     table.add_row("Port", str(port))
     table.add_row("Auto-reload", "✅" if reload else "❌")
+    table.add_row("Workers", str(workers))
+    table.add_row("Event loop", loop.value if loop else "auto")
+    table.add_row("HTTP parser", http.value if http else "auto")
     console.print(table)
     
     run_app(
@@ -93,6 +196,9 @@ def run(
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        loop=loop.value if loop else None,
+        http=http.value if http else None,
     )
 
 @app.command(name="dev")
@@ -112,8 +218,185 @@ def run_dev(
     run(
         framework=framework,
         db=db,
+        host="0.0.0.0",
+        port=8000,
         reload=True,
+        workers=1,
+        loop=None,
+        http=None,
     )
 
+@app.command(name="cache-server")
+def cache_server(
+    url: Optional[str] = typer.Option(
+        None,
+        "--url",
+        help="unix:///path.sock or redis://host:port to listen on (default: CACHE_URL)",
+    ),
+):
+    """Run the shared post cache used by CACHE_BACKEND=shared"""
+    from infrastructure.cache.server import run_server
+
+    settings = get_settings()
+    url = url or settings.CACHE_URL
+    print(f"[green]Cache server listening on {url}[/green]")
+    run_server(url, settings.POST_CACHE_MAX_SIZE, settings.POST_CACHE_TTL_SECONDS)
+
+async def convert_uuids(db: str, batch_size: int) -> dict:
+    if db == "sqlite":
+        from infrastructure.sqlite3.session import dispose_engine, get_engine
+        from infrastructure.sqlite3.uuid_migration import migrate_uuids
+        try:
+            return await migrate_uuids(get_engine(), batch_size)
+        finally:
+            await dispose_engine()
+    else:
+        from infrastructure.mongodb.session import close_client, get_db
+        from infrastructure.mongodb.uuid_migration import migrate_uuids
+        try:
+            return await migrate_uuids(get_db(), batch_size)
+        finally:
+            close_client()
+
+@app.command(name="migrate-uuids")
+def migrate_uuid_storage(
+    db: Database = typer.Option(
+        Database.SQLITE,
+        "--db", "-d",
+        help="Database to migrate",
+        case_sensitive=False,
+    ),
+    batch_size: int = typer.Option(
+        1000,
+        "--batch-size", "-b",
+        help="Rows converted per transaction",
+    ),
+):
+    """Convert stored UUIDs from text to 16-byte binary in batches; safe to run while serving"""
+    counts = asyncio.run(convert_uuids(db.value, batch_size))
+
+    table = Table("Collection", "Converted", title="UUID Migration")
+    for name, count in counts.items():
+        table.add_row(name, str(count))
+    console.print(table)
+
+def time_to_first_response(options: List[str], env: dict, port: int, timeout: float) -> float:
+    """Seconds from launching `blog run` with ``options`` until it answers a request"""
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "run",
+         "--host", "127.0.0.1", "--port", str(port), *options],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        # Own process group, so workers and helpers are stopped with it
+        start_new_session=True,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited with {server.returncode}: blog run {' '.join(options)}")
+            connection = HTTPConnection("127.0.0.1", port, timeout=timeout)
+            try:
+                connection.request("GET", "/api/v1/posts/?limit=1")
+                if connection.getresponse().status == 200:
+                    return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.01)
+            finally:
+                connection.close()
+        raise RuntimeError(f"no response within {timeout:.0f}s: blog run {' '.join(options)}")
+    finally:
+        # Ctrl-C to the whole group. Sanic's manager can miss a SIGINT that
+        # arrives before every worker has reported ready, so fall back to
+        # SIGKILL
+        os.killpg(server.pid, signal.SIGINT)
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            os.killpg(server.pid, signal.SIGKILL)
+            server.wait()
+
+@app.command(name="bench-startup")
+def bench_startup(
+    framework: Optional[Framework] = typer.Option(
+        None,
+        "--framework", "-f",
+        help="Framework to measure (default: both)",
+        case_sensitive=False,
+    ),
+    db: Database = typer.Option(
+        Database.SQLITE,
+        "--db", "-d",
+        help="Database to use; SQLite runs on a scratch file",
+        case_sensitive=False,
+    ),
+    runs: int = typer.Option(
+        5,
+        "--runs", "-n",
+        min=1,
+        help="Launches per combination",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers", "-w",
+        min=1,
+        help="Worker processes per launch",
+    ),
+    port: int = typer.Option(
+        8799,
+        "--port", "-p",
+        help="Port the measured servers listen on",
+    ),
+):
+    """Time to first served request for each event loop and HTTP parser combination"""
+    combinations = []
+    for name in ([framework] if framework else list(Framework)):
+        # Sanic has no parser choice, so only its loop varies
+        parsers = list(HttpParser) if name == Framework.FASTAPI else [None]
+        for loop in EventLoop:
+            for parser in parsers:
+                # Skip backends that are not installed
+                if loop == EventLoop.UVLOOP and importlib.util.find_spec("uvloop") is None:
+                    continue
+                if parser == HttpParser.HTTPTOOLS and importlib.util.find_spec("httptools") is None:
+                    continue
+                options = ["--framework", name.value, "--db", db.value,
+                           "--workers", str(workers), "--loop", loop.value]
+                if parser is not None:
+                    options += ["--http", parser.value]
+                combinations.append((name, loop, parser, options))
+
+    results = []
+    # The scratch database and its WAL files go away with the directory
+    with tempfile.TemporaryDirectory(prefix="blog-startup-") as workdir:
+        env = dict(os.environ)
+        if db == Database.SQLITE:
+            env["SQLITE_DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(workdir, 'blog.db')}"
+
+        # One untimed launch creates the schema, so every timed one starts alike
+        time_to_first_response(combinations[0][3], env, port, timeout=60)
+
+        for name, loop, parser, options in combinations:
+            samples = [time_to_first_response(options, env, port, timeout=60) for _ in range(runs)]
+            flags = f"--loop {loop.value}" + (f" --http {parser.value}" if parser else "")
+            print(f"{name.value} {flags}: {statistics.median(samples) * 1000:.0f} ms")
+            results.append((name.value, loop.value, parser.value if parser else "built-in", flags, samples))
+
+    table = Table(
+        "Framework", "Loop", "HTTP", "Min", "Median", "Max",
+        title=f"Time to first request ({runs} runs, {workers} worker{'s' if workers > 1 else ''})"
+    )
+    fastest = {}
+    for name, loop, parser, flags, samples in sorted(results, key=lambda result: statistics.median(result[4])):
+        fastest.setdefault(name, flags)
+        table.add_row(
+            name, loop, parser,
+            *(f"{value * 1000:.0f} ms" for value in (min(samples), statistics.median(samples), max(samples)))
+        )
+    console.print(table)
+    for name, flags in fastest.items():
+        print(f"[green]Fastest {name}: {flags}[/green]")
+
 if __name__ == "__main__":
     app()
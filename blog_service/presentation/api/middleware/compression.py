@@ -0,0 +1,65 @@
+from typing import Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from presentation.compression import ResponseCompressor, add_vary, weak_etag
+
+class CompressionMiddleware:
+    """Compress response bodies with the coding negotiated from Accept-Encoding.
+
+    Streamed responses, such as the NDJSON export, pass through unchanged:
+    only a body sent in a single message is compressed.
+    """
+
+    def __init__(self, app: ASGIApp, compressor: ResponseCompressor):
+        self.app = app
+        self.compressor = compressor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        coding = self.compressor.choose(Headers(scope=scope).get("accept-encoding"))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                # Held back until the body shows whether it can be compressed
+                start = message
+                return
+            if start is not None and message["type"] == "http.response.body":
+                held, start = start, None
+                if not message.get("more_body", False):
+                    held, body = await self.compress(scope["path"], held, message.get("body", b""), coding)
+                    message = {**message, "body": body}
+                await send(held)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+    async def compress(
+        self, path: str, start: Message, body: bytes, coding: str
+    ) -> Tuple[Message, bytes]:
+        """Start message and body to send, compressed when worthwhile"""
+        headers = MutableHeaders(raw=list(start.get("headers", [])))
+        if not self.compressor.applies(
+            start["status"], headers.get("content-type"), headers.get("content-encoding"), len(body)
+        ):
+            return start, body
+        key = self.compressor.cache_key(
+            path, headers.get("etag"), headers.get("cache-control"), body
+        )
+        compressed = await self.compressor.compress(body, coding, key)
+        if compressed is None:
+            return start, body
+        headers["content-encoding"] = coding
+        headers["content-length"] = str(len(compressed))
+        headers["vary"] = add_vary(headers.get("vary"))
+        if "etag" in headers:
+            headers["etag"] = weak_etag(headers["etag"])
+        return {**start, "headers": headers.raw}, compressed
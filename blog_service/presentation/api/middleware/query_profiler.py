@@ -0,0 +1,28 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from infrastructure.query_profiler import start_profile, current_profile, end_profile
+
+class QueryProfilerMiddleware:
+    """Profile database queries per request and report them as Server-Timing"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_profile(f"{scope['method']} {scope['path']}")
+        profile = current_profile()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", profile.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_profile(token)
@@ -0,0 +1,78 @@
+from typing import Any, Callable, Optional
+from fastapi import Header, Request, Response, status
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from presentation.serialization import (
+    JSON,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPES,
+    Codec,
+    body_codec,
+    negotiate,
+)
+
+class CodecRequest(Request):
+    """Request whose body is parsed with orjson, or msgpack for MessagePack bodies.
+
+    ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so
+    FastAPI still turns malformed JSON into its usual 422 response.
+    """
+
+    codec: Codec = JSON
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = self.codec.loads(await self.body())
+        return self._json
+
+class CodecRoute(APIRoute):
+    """Route class that reads JSON and MessagePack request bodies"""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def codec_handler(request: Request):
+            content_type = request.headers.get("content-type")
+            codec = body_codec(content_type) or JSON
+            scope = request.scope
+            if codec is not JSON:
+                # FastAPI only parses bodies it recognises as JSON; label the
+                # body as JSON and let CodecRequest.json decode it
+                scope = {**scope, "headers": [
+                    (name, JSON_MEDIA_TYPE.encode() if name == b"content-type" else value)
+                    for name, value in scope["headers"]
+                ]}
+            elif content_type and content_type.split(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES:
+                return JSONResponse(
+                    {"detail": "MessagePack support is not installed"},
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+                )
+            codec_request = CodecRequest(scope, request.receive)
+            codec_request.codec = codec
+            return await handler(codec_request)
+
+        return codec_handler
+
+def accepted_codec(accept: Optional[str] = Header(None)) -> Codec:
+    """Response codec negotiated from the Accept header"""
+    return negotiate(accept)
+
+def body_response(
+    codec: Codec,
+    body: bytes,
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[dict] = None
+) -> Response:
+    """Response for a body ``codec`` already wrote, e.g. one from the response cache"""
+    response = Response(body, status_code=status_code, media_type=codec.media_type, headers=headers)
+    response.headers["Vary"] = "Accept"
+    return response
+
+def encoded_response(
+    codec: Codec,
+    value: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[dict] = None
+) -> Response:
+    """Response with ``value`` written by ``codec``; response_model only documents the shape"""
+    return body_response(codec, codec.dumps(value), status_code, headers)
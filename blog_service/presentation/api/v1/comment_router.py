@@ -1,55 +1,49 @@
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from application.ports.unit_of_work import UnitOfWork
-from infrastructure.sqlite3.unit_of_work import SQLiteUnitOfWork
+from application.ports.use_cases.comment_use_cases import CreateCommentUseCase
+from core.dependencies import get_create_comment_use_case, get_readonly_uow, get_write_uow
 from presentation.schemas.comment import CommentCreate, CommentResponse
+from presentation.serialization import COMMENT_RESPONSE, Codec
+from presentation.api.routing import CodecRoute, accepted_codec, encoded_response
 
-router = APIRouter(prefix="/comments", tags=["comments"])
-
-async def get_uow() -> UnitOfWork:
-    return SQLiteUnitOfWork()
+router = APIRouter(prefix="/comments", tags=["comments"], route_class=CodecRoute)
 
 @router.post("/{post_id}", response_model=CommentResponse)
 async def create_comment(
     post_id: UUID,
     comment_data: CommentCreate,
-    uow: UnitOfWork = Depends(get_uow)
-):
-    async with uow as uow:
-        # Check if post exists
-        post = await uow.posts.get(post_id)
-        if not post:
-            raise HTTPException(status_code=404, detail="Post not found")
-
-        # Create comment
-        comment = await uow.comments.add(
-            Comment(
-                id=uuid4(),
-                post_id=post_id,
-                content=comment_data.content,
-                author=comment_data.author,
-                created_at=datetime.utcnow()
-            )
+    codec: Codec = Depends(accepted_codec),
+    use_case: CreateCommentUseCase = Depends(get_create_comment_use_case)
+) -> Response:
+    try:
+        comment = await use_case.execute(
+            post_id=post_id,
+            content=comment_data.content,
+            author=comment_data.author
         )
-        await uow.commit()
-        return comment
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Post not found")
+    return encoded_response(codec, COMMENT_RESPONSE.to_dict(comment))
 
 @router.get("/{post_id}", response_model=List[CommentResponse])
 async def get_comments(
     post_id: UUID,
-    uow: UnitOfWork = Depends(get_uow)
-):
+    codec: Codec = Depends(accepted_codec),
+    uow: UnitOfWork = Depends(get_readonly_uow)
+) -> Response:
     async with uow as uow:
         comments = await uow.comments.get_by_post(post_id)
-        return comments
+        return encoded_response(codec, COMMENT_RESPONSE.to_list(comments))
 
 @router.delete("/{comment_id}")
 async def delete_comment(
     comment_id: UUID,
-    uow: UnitOfWork = Depends(get_uow)
-):
+    codec: Codec = Depends(accepted_codec),
+    uow: UnitOfWork = Depends(get_write_uow)
+) -> Response:
     async with uow as uow:
         await uow.comments.delete(comment_id)
         await uow.commit()
-        return {"message": "Comment deleted"}
+        return encoded_response(codec, {"message": "Comment deleted"})
@@ -1,63 +1,181 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
+from uuid import UUID
 
-from domain.entities.post import Post
 from domain.value_objects.post_status import PostStatus
-from presentation.schemas.post_schema import PostCreate, PostUpdate, PostResponse
+from domain.value_objects.page_cursor import PageCursor, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from domain.value_objects.post_fields import POST_FIELDS, parse_fields
+from presentation.schemas.post_schema import PostCreate, PostUpdate, PostResponse, PostSummaryResponse
+from presentation.ndjson import NDJSON_MEDIA_TYPE, ndjson_chunks
+from presentation.etag import cache_headers, entity_tag, not_modified
+from presentation.serialization import POST_RESPONSE, POST_SUMMARY, Codec, select_fields
+from presentation.api.routing import CodecRoute, accepted_codec, body_response, encoded_response
+from infrastructure.cache.responses import ResponseCache
 from core.dependencies import (
+    get_response_cache,
     get_create_post_use_case,
     get_get_post_use_case,
+    get_get_post_version_use_case,
     get_list_posts_use_case,
+    get_search_posts_use_case,
+    get_export_posts_use_case,
     get_update_post_use_case,
     get_delete_post_use_case,
     get_change_post_status_use_case
 )
-from application.use_cases.post.create_post import CreatePostUseCase
-from application.use_cases.post.get_post import GetPostUseCase
-from application.use_cases.post.list_posts import ListPostsUseCase
-from application.use_cases.post.update_post import UpdatePostUseCase
-from application.use_cases.post.delete_post import DeletePostUseCase
-from application.use_cases.post.change_post_status import ChangePostStatusUseCase
+from application.ports.use_cases.post_use_cases import (
+    CreatePostUseCase,
+    GetPostUseCase,
+    GetPostVersionUseCase,
+    ListPostsUseCase,
+    SearchPostsUseCase,
+    ExportPostsUseCase,
+    UpdatePostUseCase,
+    DeletePostUseCase,
+    ChangePostStatusUseCase
+)
+
+router = APIRouter(prefix="/posts", tags=["posts"], route_class=CodecRoute)
+
+FIELDS_DESCRIPTION = f"Comma separated subset of: {', '.join(POST_FIELDS)}"
 
-router = APIRouter(prefix="/posts", tags=["posts"])
+def get_fields(
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)
+) -> Optional[tuple]:
+    if fields is None:
+        return None
+    try:
+        return parse_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 @router.post("/", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     post: PostCreate,
+    codec: Codec = Depends(accepted_codec),
     use_case: CreatePostUseCase = Depends(get_create_post_use_case)
-) -> Post:
-    return await use_case.execute(post.title, post.content, post.author)
+) -> Response:
+    created = await use_case.execute(post.title, post.content, post.author)
+    return encoded_response(codec, POST_RESPONSE.to_dict(created), status.HTTP_201_CREATED)
 
-@router.get("/{post_id}", response_model=PostResponse)
+@router.get("/search", response_model=List[PostResponse])
+async def search_posts(
+    q: str = Query(..., min_length=1, description="Words to search for in title and content"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    codec: Codec = Depends(accepted_codec),
+    use_case: SearchPostsUseCase = Depends(get_search_posts_use_case)
+) -> Response:
+    posts = await use_case.execute(q, limit=limit, offset=offset)
+    headers = {"X-Next-Offset": str(offset + limit)} if len(posts) == limit else None
+    return encoded_response(codec, POST_RESPONSE.to_list(posts), headers=headers)
+
+@router.get("/export")
+async def export_posts(
+    use_case: ExportPostsUseCase = Depends(get_export_posts_use_case)
+) -> StreamingResponse:
+    """Every post, then every comment, as newline-delimited JSON"""
+    return StreamingResponse(ndjson_chunks(use_case.execute()), media_type=NDJSON_MEDIA_TYPE)
+
+@router.get(
+    "/{post_id}",
+    response_model=PostResponse,
+    responses={304: {"description": "Not modified since the ETag in If-None-Match"}}
+)
 async def get_post(
-    post_id: int,
-    use_case: GetPostUseCase = Depends(get_get_post_use_case)
-) -> Post:
-    post = await use_case.execute(post_id)
+    post_id: UUID,
+    request: Request,
+    fields: Optional[tuple] = Depends(get_fields),
+    if_none_match: Optional[str] = Header(None),
+    version_use_case: GetPostVersionUseCase = Depends(get_get_post_version_use_case),
+    codec: Codec = Depends(accepted_codec),
+    use_case: GetPostUseCase = Depends(get_get_post_use_case),
+    response_cache: ResponseCache = Depends(get_response_cache)
+) -> Response:
+    cached = await response_cache.lookup(
+        "get_post", "fastapi", post_id, codec.media_type, query=request.query_params.multi_items()
+    )
+    if cached.hit:
+        headers = cache_headers("get_post", cached.etag)
+        matched = not_modified(if_none_match, cached.etag)
+        if matched:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "ETag": matched})
+        return body_response(codec, cached.body, headers=headers)
+
+    version = await version_use_case.execute(post_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Post not found")
+    headers = cache_headers("get_post", entity_tag(version, fields, codec.media_type))
+    matched = not_modified(if_none_match, headers["ETag"])
+    if matched:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "ETag": matched})
+
+    post = await use_case.execute(post_id, fields=fields)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    return post
+    body = codec.dumps(select_fields(post, fields) if fields else POST_RESPONSE.to_dict(post))
+    await cached.store(body, headers["ETag"])
+    return body_response(codec, body, headers=headers)
 
-@router.get("/", response_model=List[PostResponse])
+@router.get("/", response_model=List[PostSummaryResponse])
 async def list_posts(
-    use_case: ListPostsUseCase = Depends(get_list_posts_use_case)
-) -> List[Post]:
-    return await use_case.execute()
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from X-Next-Cursor"),
+    fields: Optional[tuple] = Depends(get_fields),
+    codec: Codec = Depends(accepted_codec),
+    use_case: ListPostsUseCase = Depends(get_list_posts_use_case),
+    response_cache: ResponseCache = Depends(get_response_cache)
+) -> Response:
+    try:
+        after = PageCursor.decode(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    headers = cache_headers("list_posts")
+    cached = await response_cache.lookup(
+        "list_posts", "fastapi", codec.media_type, query=request.query_params.multi_items()
+    )
+    if cached.hit:
+        return body_response(codec, cached.body, headers={**headers, **cached.headers})
+
+    posts = await use_case.execute(limit=limit, cursor=after, fields=fields)
+    page_headers = {}
+    if fields:
+        value = [select_fields(row, fields) for row in posts]
+        if len(posts) == limit:
+            page_headers["X-Next-Cursor"] = PageCursor.after_row(posts[-1]).encode()
+    else:
+        value = POST_SUMMARY.to_list(posts)
+        if len(posts) == limit:
+            page_headers["X-Next-Cursor"] = PageCursor.after(posts[-1]).encode()
+    body = codec.dumps(value)
+    # The next cursor is part of the page, so a hit repeats it
+    await cached.store(body, headers=page_headers)
+    return body_response(codec, body, headers={**headers, **page_headers})
 
 @router.put("/{post_id}", response_model=PostResponse)
 async def update_post(
-    post_id: int,
+    post_id: UUID,
     post: PostUpdate,
+    codec: Codec = Depends(accepted_codec),
     use_case: UpdatePostUseCase = Depends(get_update_post_use_case)
-) -> Post:
-    updated_post = await use_case.execute(post_id, post.title, post.content, post.author)
+) -> Response:
+    updated_post = await use_case.execute(
+        post_id,
+        title=post.title,
+        content=post.content,
+        author=post.author,
+        status=post.status
+    )
     if not updated_post:
         raise HTTPException(status_code=404, detail="Post not found")
-    return updated_post
+    return encoded_response(codec, POST_RESPONSE.to_dict(updated_post))
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
-    post_id: int,
+    post_id: UUID,
     use_case: DeletePostUseCase = Depends(get_delete_post_use_case)
 ):
     deleted = await use_case.execute(post_id)
@@ -66,20 +184,22 @@ async def delete_post(
 
 @router.post("/{post_id}/publish", response_model=PostResponse)
 async def publish_post(
-    post_id: int,
+    post_id: UUID,
+    codec: Codec = Depends(accepted_codec),
     use_case: ChangePostStatusUseCase = Depends(get_change_post_status_use_case)
-) -> Post:
+) -> Response:
     post = await use_case.execute(post_id, PostStatus.PUBLISHED)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    return post
+    return encoded_response(codec, POST_RESPONSE.to_dict(post))
 
 @router.post("/{post_id}/archive", response_model=PostResponse)
 async def archive_post(
-    post_id: int,
+    post_id: UUID,
+    codec: Codec = Depends(accepted_codec),
     use_case: ChangePostStatusUseCase = Depends(get_change_post_status_use_case)
-) -> Post:
+) -> Response:
     post = await use_case.execute(post_id, PostStatus.ARCHIVED)
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    return post
+    return encoded_response(codec, POST_RESPONSE.to_dict(post))
@@ -0,0 +1,152 @@
+"""Response compression shared by the FastAPI and Sanic middleware.
+
+The coding is negotiated from Accept-Encoding among zstd, br and gzip, in
+the server's preference order from ``COMPRESSION_ENCODINGS``. zstd needs the
+``zstandard`` package and br needs ``brotli``. A coding whose package is
+missing is never offered, so gzip from the standard library is always there
+as a fallback.
+
+Small bodies are sent as they are: below ``COMPRESSION_MIN_SIZE`` the saving
+is smaller than the cost. Bodies of at least ``COMPRESSION_THREAD_MIN_SIZE``
+are compressed on the default executor, so a large listing does not hold
+the event loop while other requests wait.
+
+Compressed bodies of cacheable responses are kept in a small cache. A
+response is cacheable unless its Cache-Control says ``no-store`` or
+``private``. The key is the ETag when there is one, since a strong tag
+already names the exact bytes. Otherwise the key is a digest of the body.
+A repeated read of a hot post or listing therefore reuses the compressed
+bytes instead of compressing them again.
+"""
+import asyncio
+import gzip
+import hashlib
+from typing import Callable, Dict, Optional, Sequence
+from application.ports.cache import Cache
+from presentation.serialization import accepted_qualities
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional extra
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional extra
+    brotli = None
+
+Compress = Callable[[bytes, int], bytes]
+
+CODINGS: Dict[str, Compress] = {
+    # mtime=0 keeps the output a pure function of the body, so cached and
+    # fresh bytes are identical
+    "gzip": lambda body, level: gzip.compress(body, compresslevel=level, mtime=0),
+}
+if zstandard is not None:
+    CODINGS["zstd"] = lambda body, level: zstandard.compress(body, level)
+if brotli is not None:
+    CODINGS["br"] = lambda body, level: brotli.compress(body, quality=level)
+
+DEFAULT_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+
+# Media types worth compressing; images and already-compressed types are not
+COMPRESSIBLE_TYPES = ("application/json", "application/msgpack", "application/x-msgpack", "text/")
+
+def compressible(content_type: Optional[str]) -> bool:
+    """Whether a response of this Content-Type is worth compressing"""
+    return bool(content_type) and content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+def weak_etag(etag: str) -> str:
+    """``etag`` marked weak: the compressed bytes differ from the identity ones"""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+def add_vary(vary: Optional[str], header: str = "Accept-Encoding") -> str:
+    """A Vary value that also lists ``header``"""
+    if not vary:
+        return header
+    if header.lower() in (name.strip().lower() for name in vary.split(",")):
+        return vary
+    return f"{vary}, {header}"
+
+class ResponseCompressor:
+    """Negotiates a content coding and compresses response bodies with it"""
+
+    def __init__(
+        self,
+        encodings: Sequence[str],
+        levels: Dict[str, int],
+        min_size: int,
+        thread_min_size: int,
+        cache: Optional[Cache] = None
+    ):
+        self.encodings = tuple(coding for coding in encodings if coding in CODINGS)
+        self.levels = {**DEFAULT_LEVELS, **levels}
+        self.min_size = min_size
+        self.thread_min_size = thread_min_size
+        self.cache = cache
+
+    def choose(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """Best coding the client accepts, or None to send the body as is"""
+        if not accept_encoding:
+            return None
+        qualities = accepted_qualities(accept_encoding)
+        wildcard = qualities.get("*", 0.0)
+        best, best_quality = None, 0.0
+        # Ties go to the coding listed first in COMPRESSION_ENCODINGS
+        for coding in self.encodings:
+            quality = qualities.get(coding, wildcard)
+            if quality > best_quality:
+                best, best_quality = coding, quality
+        return best
+
+    def applies(
+        self,
+        status: int,
+        content_type: Optional[str],
+        content_encoding: Optional[str],
+        size: int
+    ) -> bool:
+        """Whether a response with these properties should be compressed"""
+        return (
+            size >= self.min_size
+            and status not in (204, 206, 304)
+            and not content_encoding
+            and compressible(content_type)
+        )
+
+    def cache_key(
+        self,
+        path: str,
+        etag: Optional[str],
+        cache_control: Optional[str],
+        body: bytes
+    ) -> Optional[str]:
+        """Key for the compressed body cache, or None if the response may not be stored"""
+        if self.cache is None:
+            return None
+        if cache_control and any(
+            directive in cache_control.lower() for directive in ("no-store", "private")
+        ):
+            return None
+        if etag:
+            return f"{path}|{etag}"
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    async def compress(self, body: bytes, coding: str, key: Optional[str] = None) -> Optional[bytes]:
+        """``body`` in ``coding``, or None when that would not make it smaller"""
+        if key is not None:
+            cached = await self.cache.get(f"compressed:{coding}:{key}")
+            if cached is not None:
+                return cached
+        level = self.levels[coding]
+        compress = CODINGS[coding]
+        if len(body) >= self.thread_min_size:
+            loop = asyncio.get_running_loop()
+            compressed = await loop.run_in_executor(None, compress, body, level)
+        else:
+            compressed = compress(body, level)
+        if len(compressed) >= len(body):
+            return None
+        if key is not None:
+            await self.cache.set(f"compressed:{coding}:{key}", compressed)
+        return compressed
@@ -0,0 +1,40 @@
+"""Strong ETags and conditional GET handling shared by both frameworks"""
+import hashlib
+from typing import Dict, Optional
+from core.config import get_settings
+
+def entity_tag(version: str, *variant) -> str:
+    """Strong ETag for one representation of a resource version.
+
+    ``variant`` holds everything else that shapes the body, such as the
+    sparse fieldset or the page cursor, so each representation gets its own
+    tag.
+    """
+    digest = hashlib.blake2b(repr((version, variant)).encode(), digest_size=12)
+    return f'"{digest.hexdigest()}"'
+
+def not_modified(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """The If-None-Match entry matching ``etag`` (weak comparison, per RFC 9110), or None.
+
+    The entry is returned as the client sent it, for the 304 to echo: that
+    is the tag the earlier 200 carried, weak if the body was compressed.
+    """
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == etag:
+            return candidate
+    return None
+
+def cache_headers(route: str, etag: Optional[str] = None) -> Dict[str, str]:
+    """ETag and the Cache-Control configured for ``route``"""
+    headers = {}
+    if etag:
+        headers["ETag"] = etag
+    cache_control = get_settings().CACHE_CONTROL.get(route)
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return headers
@@ -0,0 +1,30 @@
+from typing import AsyncIterator, Union
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CHUNK_SIZE = 64 * 1024
+
+def ndjson_line(entity: Union[Post, Comment]) -> bytes:
+    """One export record; the type key tells posts and comments apart"""
+    if isinstance(entity, Post):
+        body = entity.model_dump_json(exclude={"comments"})
+        kind = "post"
+    else:
+        body = entity.model_dump_json()
+        kind = "comment"
+    return f'{{"type":"{kind}",{body[1:]}\n'.encode()
+
+async def ndjson_chunks(
+    entities: AsyncIterator[Union[Post, Comment]],
+    chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Group NDJSON lines into chunks of about chunk_size bytes per write"""
+    buffer = bytearray()
+    async for entity in entities:
+        buffer += ndjson_line(entity)
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
@@ -0,0 +1,37 @@
+from typing import Any, Optional
+from sanic import Request
+from sanic.exceptions import SanicException
+from sanic.response import HTTPResponse
+from presentation.serialization import JSON, Codec, body_codec, negotiate
+
+def accepted_codec(request: Request) -> Codec:
+    """Response codec negotiated from the Accept header"""
+    return negotiate(request.headers.get("accept"))
+
+def read_body(request: Request) -> Any:
+    """Decode a JSON or MessagePack request body, raising 415 for other types"""
+    codec = body_codec(request.headers.get("content-type"))
+    if codec is None:
+        raise SanicException("Send application/json or application/msgpack", status_code=415)
+    if codec is JSON:
+        return request.json
+    return codec.loads(request.body)
+
+def body_response(
+    codec: Codec,
+    body: bytes,
+    status: int = 200,
+    headers: Optional[dict] = None
+) -> HTTPResponse:
+    """Response for a body ``codec`` already wrote, e.g. one from the response cache"""
+    response = HTTPResponse(body, status=status, content_type=codec.media_type, headers=headers)
+    response.headers["Vary"] = "Accept"
+    return response
+
+def encoded_response(
+    codec: Codec,
+    value: Any,
+    status: int = 200,
+    headers: Optional[dict] = None
+) -> HTTPResponse:
+    return body_response(codec, codec.dumps(value), status, headers)
@@ -0,0 +1,34 @@
+from typing import Callable
+from sanic import Request
+from sanic.response import HTTPResponse
+from presentation.compression import ResponseCompressor, add_vary, weak_etag
+
+def compress_responses(compressor: ResponseCompressor) -> Callable:
+    """Response middleware compressing bodies with the coding negotiated from Accept-Encoding"""
+
+    async def compress_response(request: Request, response: HTTPResponse) -> None:
+        # Streamed responses (request.respond) have no body here and are left alone
+        body = response.body
+        if not body:
+            return
+        coding = compressor.choose(request.headers.get("accept-encoding"))
+        if coding is None or not compressor.applies(
+            response.status,
+            response.content_type,
+            response.headers.get("content-encoding"),
+            len(body)
+        ):
+            return
+        key = compressor.cache_key(
+            request.path, response.headers.get("etag"), response.headers.get("cache-control"), body
+        )
+        compressed = await compressor.compress(body, coding, key)
+        if compressed is None:
+            return
+        response.body = compressed
+        response.headers["Content-Encoding"] = coding
+        response.headers["Vary"] = add_vary(response.headers.get("vary"))
+        if "etag" in response.headers:
+            response.headers["ETag"] = weak_etag(response.headers["etag"])
+
+    return compress_response
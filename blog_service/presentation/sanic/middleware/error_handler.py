@@ -24,6 +24,16 @@ class ErrorHandler(BaseErrorHandler):
                 status=404
             )
             
+        # Request bodies in a format the routes cannot read
+        if getattr(exception, "status_code", None) == 415:
+            return json(
+                {
+                    "error": "Unsupported Media Type",
+                    "message": str(exception)
+                },
+                status=415
+            )
+            
         # Handle other errors
         return json(
             {
@@ -0,0 +1,13 @@
+from sanic import Request
+from sanic.response import HTTPResponse
+from infrastructure.query_profiler import start_profile, current_profile, end_profile
+
+async def start_query_profile(request: Request) -> None:
+    request.ctx.query_profile_token = start_profile(f"{request.method} {request.path}")
+
+async def finish_query_profile(request: Request, response: HTTPResponse) -> None:
+    token = getattr(request.ctx, "query_profile_token", None)
+    if token is None:
+        return
+    response.headers["Server-Timing"] = current_profile().server_timing()
+    end_profile(token)
@@ -0,0 +1,38 @@
+from typing import Optional, Tuple
+from sanic import Request
+from domain.value_objects.page_cursor import PageCursor, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+def parse_limit(request: Request) -> int:
+    """Read the ``limit`` query param, raising ValueError if invalid"""
+    try:
+        limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    return limit
+
+def parse_offset(request: Request) -> int:
+    """Read the ``offset`` query param, raising ValueError if invalid"""
+    try:
+        offset = int(request.args.get("offset", 0))
+    except ValueError:
+        raise ValueError("offset must be an integer")
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+    return offset
+
+def parse_page_args(request: Request) -> Tuple[int, Optional[PageCursor]]:
+    """Read ``limit`` and ``cursor`` query params, raising ValueError if invalid"""
+    limit = parse_limit(request)
+    token = request.args.get("cursor")
+    cursor = PageCursor.decode(token) if token else None
+    return limit, cursor
+
+def next_cursor(items: list, limit: int) -> Optional[str]:
+    """Opaque cursor for the next page, or None when this page is the last"""
+    if len(items) < limit:
+        return None
+    if isinstance(items[-1], dict):
+        return PageCursor.after_row(items[-1]).encode()
+    return PageCursor.after(items[-1]).encode()
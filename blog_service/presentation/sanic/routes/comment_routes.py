@@ -1,57 +1,54 @@
 from uuid import UUID
 from sanic import Blueprint, Request
-from sanic.response import json
+from sanic.response import empty, json
 from application.use_cases.comment.create_comment import CreateComment
 from application.use_cases.comment.delete_comment import DeleteComment
-from application.use_cases.comment.get_post_comments import GetPostComments
-from core.dependencies import get_uow
+from application.use_cases.comment.get_post_comments_version import GetPostCommentsVersion
+from core.dependencies import get_get_post_comments_use_case, get_uow
+from presentation.etag import cache_headers, entity_tag, not_modified
+from presentation.serialization import COMMENT_DETAIL
+from presentation.sanic.content import accepted_codec, encoded_response, read_body
+from presentation.sanic.pagination import parse_page_args, next_cursor
 
 bp = Blueprint("comments", url_prefix="/comments")
 
 @bp.post("/<post_id:uuid>")
 async def create_comment(request: Request, post_id: UUID):
-    data = request.json
+    data = read_body(request)
     
-    async with get_uow() as uow:
-        use_case = CreateComment(uow)
-        comment = await use_case.execute(
-            post_id=post_id,
-            content=data["content"],
-            author=data["author"]
-        )
-        
-        return json({
-            "id": str(comment.id),
-            "post_id": str(comment.post_id),
-            "content": comment.content,
-            "author": comment.author,
-            "created_at": str(comment.created_at),
-            "updated_at": str(comment.updated_at) if comment.updated_at else None
-        })
+    use_case = CreateComment(get_uow())
+    comment = await use_case.execute(
+        post_id=post_id,
+        content=data["content"],
+        author=data["author"]
+    )
+    
+    return encoded_response(accepted_codec(request), COMMENT_DETAIL.to_dict(comment))
 
 @bp.get("/<post_id:uuid>")
 async def get_comments(request: Request, post_id: UUID):
-    async with get_uow() as uow:
-        use_case = GetPostComments(uow)
-        comments = await use_case.execute(post_id)
-        
-        return json({
-            "comments": [
-                {
-                    "id": str(comment.id),
-                    "post_id": str(comment.post_id),
-                    "content": comment.content,
-                    "author": comment.author,
-                    "created_at": str(comment.created_at),
-                    "updated_at": str(comment.updated_at) if comment.updated_at else None
-                }
-                for comment in comments
-            ]
-        })
+    try:
+        limit, cursor = parse_page_args(request)
+    except ValueError as exc:
+        return json({"error": str(exc)}, status=400)
+
+    codec = accepted_codec(request)
+    version = await GetPostCommentsVersion(get_uow(readonly=True)).execute(post_id)
+    headers = cache_headers("get_comments", entity_tag(version, limit, cursor, codec.media_type))
+    matched = not_modified(request.headers.get("if-none-match"), headers["ETag"])
+    if matched:
+        return empty(status=304, headers={**headers, "ETag": matched})
+
+    use_case = get_get_post_comments_use_case(get_uow(readonly=True))
+    comments = await use_case.execute(post_id, limit=limit, cursor=cursor)
+    
+    return encoded_response(codec, {
+        "comments": COMMENT_DETAIL.to_list(comments),
+        "next_cursor": next_cursor(comments, limit)
+    }, headers=headers)
 
 @bp.delete("/<comment_id:uuid>")
 async def delete_comment(request: Request, comment_id: UUID):
-    async with get_uow() as uow:
-        use_case = DeleteComment(uow)
-        await use_case.execute(comment_id)
-        return json({"message": "Comment deleted"})
+    use_case = DeleteComment(get_uow())
+    await use_case.execute(comment_id)
+    return encoded_response(accepted_codec(request), {"message": "Comment deleted"})
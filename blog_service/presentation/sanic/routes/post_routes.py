@@ -1,127 +1,164 @@
+from typing import Optional, Sequence
 from uuid import UUID
 from sanic import Blueprint, Request
-from sanic.response import json
+from sanic.response import empty, json
 from application.use_cases.post.create_post_with_comments import CreatePostWithComments
 from application.use_cases.post.delete_post import DeletePost
-from application.use_cases.post.get_post import GetPost
+from application.use_cases.post.export_posts import ExportPosts
+from application.use_cases.post.get_post_version import GetPostVersion
 from application.use_cases.post.list_posts import ListPosts
+from application.use_cases.post.search_posts import SearchPosts
 from application.use_cases.post.update_post import UpdatePost
+from domain.value_objects.post_fields import parse_fields
 from presentation.schemas.post_schema import PostCreate, PostUpdate
-from core.dependencies import get_uow
+from presentation.ndjson import NDJSON_MEDIA_TYPE, ndjson_chunks
+from presentation.etag import cache_headers, entity_tag, not_modified
+from presentation.serialization import (
+    COMMENT_SUMMARY,
+    POST_CORE,
+    POST_DETAIL,
+    POST_SEARCH_RESULT,
+    POST_SUMMARY,
+    select_fields,
+)
+from presentation.sanic.content import accepted_codec, body_response, encoded_response, read_body
+from presentation.sanic.pagination import parse_page_args, parse_limit, parse_offset, next_cursor
+from core.dependencies import get_get_post_use_case, get_response_cache, get_uow
 
 bp = Blueprint("posts", url_prefix="/posts")
 
+def requested_fields(request: Request) -> Optional[Sequence[str]]:
+    raw = request.args.get("fields")
+    return parse_fields(raw) if raw is not None else None
+
 @bp.post("/")
 async def create_post(request: Request):
-    data = request.json
+    data = read_body(request)
     post_data = PostCreate(**data)
     comments_data = data.pop("comments", [])
     
-    async with get_uow() as uow:
-        use_case = CreatePostWithComments(uow)
-        post, comments = await use_case.execute(
-            title=post_data.title,
-            content=post_data.content,
-            author=post_data.author,
-            comments_data=comments_data
-        )
-        
-        return json({
-            "post": {
-                "id": str(post.id),
-                "title": post.title,
-                "content": post.content,
-                "author": post.author,
-                "created_at": str(post.created_at),
-                "updated_at": str(post.updated_at) if post.updated_at else None
-            },
-            "comments": [
-                {
-                    "id": str(comment.id),
-                    "content": comment.content,
-                    "author": comment.author,
-                    "created_at": str(comment.created_at)
-                }
-                for comment in comments
-            ]
-        })
+    use_case = CreatePostWithComments(get_uow())
+    post, comments = await use_case.execute(
+        title=post_data.title,
+        content=post_data.content,
+        author=post_data.author,
+        comments_data=comments_data
+    )
+    
+    return encoded_response(accepted_codec(request), {
+        "post": POST_CORE.to_dict(post),
+        "comments": COMMENT_SUMMARY.to_list(comments)
+    })
+
+@bp.get("/export")
+async def export_posts(request: Request):
+    use_case = ExportPosts(get_uow(readonly=True))
+    response = await request.respond(content_type=NDJSON_MEDIA_TYPE)
+    async for chunk in ndjson_chunks(use_case.execute()):
+        await response.send(chunk)
+    await response.eof()
 
 @bp.get("/<post_id:uuid>")
 async def get_post(request: Request, post_id: UUID):
-    async with get_uow() as uow:
-        use_case = GetPost(uow)
-        post = await use_case.execute(post_id)
-        
-        if not post:
-            return json({"error": "Post not found"}, status=404)
-        
-        return json({
-            "id": str(post.id),
-            "title": post.title,
-            "content": post.content,
-            "author": post.author,
-            "created_at": str(post.created_at),
-            "updated_at": str(post.updated_at) if post.updated_at else None,
-            "comments": [
-                {
-                    "id": str(comment.id),
-                    "content": comment.content,
-                    "author": comment.author,
-                    "created_at": str(comment.created_at)
-                }
-                for comment in post.comments
-            ]
-        })
+    try:
+        fields = requested_fields(request)
+    except ValueError as exc:
+        return json({"error": str(exc)}, status=400)
+
+    codec = accepted_codec(request)
+    cached = await get_response_cache().lookup(
+        "get_post", "sanic", post_id, codec.media_type, query=request.query_args
+    )
+    if cached.hit:
+        headers = cache_headers("get_post", cached.etag)
+        matched = not_modified(request.headers.get("if-none-match"), cached.etag)
+        if matched:
+            return empty(status=304, headers={**headers, "ETag": matched})
+        return body_response(codec, cached.body, headers=headers)
+
+    version = await GetPostVersion(get_uow(readonly=True)).execute(post_id)
+    if version is None:
+        return json({"error": "Post not found"}, status=404)
+    headers = cache_headers("get_post", entity_tag(version, fields, codec.media_type))
+    matched = not_modified(request.headers.get("if-none-match"), headers["ETag"])
+    if matched:
+        return empty(status=304, headers={**headers, "ETag": matched})
+
+    use_case = get_get_post_use_case(get_uow(readonly=True))
+    post = await use_case.execute(post_id, fields=fields)
+    
+    if not post:
+        return json({"error": "Post not found"}, status=404)
+    body = codec.dumps(select_fields(post, fields) if fields else POST_DETAIL.to_dict(post))
+    await cached.store(body, headers["ETag"])
+    return body_response(codec, body, headers=headers)
 
 @bp.get("/")
 async def list_posts(request: Request):
-    async with get_uow() as uow:
-        use_case = ListPosts(uow)
-        posts = await use_case.execute()
-        
-        return json({
-            "posts": [
-                {
-                    "id": str(post.id),
-                    "title": post.title,
-                    "content": post.content,
-                    "author": post.author,
-                    "created_at": str(post.created_at),
-                    "updated_at": str(post.updated_at) if post.updated_at else None,
-                    "comments_count": len(post.comments)
-                }
-                for post in posts
-            ]
-        })
+    try:
+        limit, cursor = parse_page_args(request)
+        fields = requested_fields(request)
+    except ValueError as exc:
+        return json({"error": str(exc)}, status=400)
+
+    codec = accepted_codec(request)
+    headers = cache_headers("list_posts")
+    cached = await get_response_cache().lookup(
+        "list_posts", "sanic", codec.media_type, query=request.query_args
+    )
+    if cached.hit:
+        return body_response(codec, cached.body, headers=headers)
+
+    use_case = ListPosts(get_uow(readonly=True))
+    posts = await use_case.execute(limit=limit, cursor=cursor, fields=fields)
+    body = codec.dumps({
+        "posts": (
+            [select_fields(row, fields) for row in posts]
+            if fields else POST_SUMMARY.to_list(posts)
+        ),
+        "next_cursor": next_cursor(posts, limit)
+    })
+    await cached.store(body)
+    return body_response(codec, body, headers=headers)
+
+@bp.get("/search")
+async def search_posts(request: Request):
+    query = request.args.get("q", "").strip()
+    if not query:
+        return json({"error": "q is required"}, status=400)
+    try:
+        limit = parse_limit(request)
+        offset = parse_offset(request)
+    except ValueError as exc:
+        return json({"error": str(exc)}, status=400)
+
+    use_case = SearchPosts(get_uow(readonly=True))
+    posts = await use_case.execute(query, limit=limit, offset=offset)
+    
+    return encoded_response(accepted_codec(request), {
+        "posts": POST_SEARCH_RESULT.to_list(posts),
+        "next_offset": offset + limit if len(posts) == limit else None
+    })
 
 @bp.put("/<post_id:uuid>")
 async def update_post(request: Request, post_id: UUID):
-    data = request.json
+    data = read_body(request)
     update_data = PostUpdate(**data)
     
-    async with get_uow() as uow:
-        use_case = UpdatePost(uow)
-        post = await use_case.execute(
-            post_id=post_id,
-            title=update_data.title,
-            content=update_data.content
-        )
+    use_case = UpdatePost(get_uow())
+    post = await use_case.execute(
+        post_id=post_id,
+        title=update_data.title,
+        content=update_data.content
+    )
+    
+    if not post:
+        return json({"error": "Post not found"}, status=404)
         
-        if not post:
-            return json({"error": "Post not found"}, status=404)
-            
-        return json({
-            "id": str(post.id),
-            "title": post.title,
-            "content": post.content,
-            "author": post.author,
-            "created_at": str(post.created_at),
-            "updated_at": str(post.updated_at)
-        })
+    return encoded_response(accepted_codec(request), POST_CORE.to_dict(post))
 
 @bp.delete("/<post_id:uuid>")
 async def delete_post(request: Request, post_id: UUID):
-    async with get_uow() as uow:
-        use_case = DeletePost(uow)
-        await use_case.execute(post_id)
-        return json({"message": "Post deleted"})
+    use_case = DeletePost(get_uow())
+    await use_case.execute(post_id)
+    return encoded_response(accepted_codec(request), {"message": "Post deleted"})
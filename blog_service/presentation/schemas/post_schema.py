@@ -40,6 +40,28 @@ class PostUpdate(BaseModel):
             }
         }
 
+class PostSummaryResponse(BaseModel):
+    id: UUID
+    title: str
+    author: str
+    status: PostStatus
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    comments_count: int = Field(default=0, ge=0)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "title": "My Blog Post",
+                "author": "John Doe",
+                "status": "PUBLISHED",
+                "created_at": "2023-01-01T00:00:00",
+                "updated_at": "2023-01-02T00:00:00",
+                "comments_count": 5
+            }
+        }
+
 class PostResponse(PostBase):
     id: UUID
     created_at: datetime
@@ -0,0 +1,164 @@
+"""JSON and MessagePack encoding shared by the FastAPI and Sanic routes.
+
+Each response shape is an ``EntityEncoder``, built once at import. It
+reads the named attributes with one ``attrgetter`` call, adds computed
+and nested values, and hands the dict to orjson. orjson writes UUID,
+datetime and Enum values natively, in the same ISO formats pydantic uses,
+so no per-field ``str()`` calls or ``jsonable_encoder`` passes are needed.
+
+Routes pick a ``Codec`` from the Accept header with ``negotiate``, and
+read bodies with the codec for their Content-Type. MessagePack bodies
+carry the same keys and the same string forms of ids, timestamps and
+statuses as JSON; it needs the optional ``ormsgpack`` package, which
+writes those types natively the way orjson does.
+"""
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import orjson
+from domain.value_objects.post_summary import SUMMARY_FIELDS
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional extra
+    ormsgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+loads = orjson.loads
+
+def dumps(value: Any) -> bytes:
+    """Encode plain values: dicts, lists, and projected rows with UUIDs and datetimes"""
+    return orjson.dumps(value)
+
+def select_fields(row: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """The requested fields of a projected row, in request order"""
+    return {name: row[name] for name in fields}
+
+class Codec:
+    """A media type with the functions that write and read it"""
+
+    def __init__(self, media_type: str, dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any]):
+        self.media_type = media_type
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"Codec({self.media_type!r})"
+
+JSON = Codec(JSON_MEDIA_TYPE, dumps, loads)
+MSGPACK: Optional[Codec] = (
+    Codec(MSGPACK_MEDIA_TYPE, ormsgpack.packb, ormsgpack.unpackb) if ormsgpack else None
+)
+
+def _media_type(value: str) -> str:
+    return value.split(";", 1)[0].strip().lower()
+
+def accepted_qualities(accept: str) -> Dict[str, float]:
+    """Quality per value of an Accept-style header, such as Accept or Accept-Encoding"""
+    ranges = {}
+    for part in accept.split(","):
+        media_type, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        ranges[media_type.strip().lower()] = quality
+    return ranges
+
+def negotiate(accept: Optional[str]) -> Codec:
+    """Codec for a response: MessagePack when Accept prefers it, JSON otherwise"""
+    if not accept or MSGPACK is None or "msgpack" not in accept:
+        return JSON
+    ranges = accepted_qualities(accept)
+    msgpack_quality = max(ranges.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES)
+    json_quality = max(
+        ranges.get(media_type, 0.0) for media_type in (JSON_MEDIA_TYPE, "application/*", "*/*")
+    )
+    return MSGPACK if msgpack_quality > json_quality else JSON
+
+def body_codec(content_type: Optional[str]) -> Optional[Codec]:
+    """Codec for a request body, or None when its Content-Type is not supported"""
+    if not content_type:
+        return JSON
+    media_type = _media_type(content_type)
+    if media_type == JSON_MEDIA_TYPE or media_type.endswith("+json"):
+        return JSON
+    if media_type in MSGPACK_MEDIA_TYPES:
+        return MSGPACK
+    return None
+
+class EntityEncoder:
+    """Dict/JSON encoder for one response shape of an entity.
+
+    ``fields`` are copied from attributes. ``computed`` maps output names to
+    functions of the entity, and ``nested`` maps attribute names holding
+    lists to the encoder for their items. Keys come out in the order
+    fields, computed, nested.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        computed: Optional[Dict[str, Callable[[Any], Any]]] = None,
+        nested: Optional[Dict[str, "EntityEncoder"]] = None
+    ):
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._get = attrgetter(*self.fields)
+        self._single = len(self.fields) == 1
+        self._computed = tuple((computed or {}).items())
+        self._nested = tuple((nested or {}).items())
+
+    def to_dict(self, entity: Any) -> Dict[str, Any]:
+        values = self._get(entity)
+        row = {self.fields[0]: values} if self._single else dict(zip(self.fields, values))
+        for name, compute in self._computed:
+            row[name] = compute(entity)
+        for name, encoder in self._nested:
+            row[name] = encoder.to_list(getattr(entity, name))
+        return row
+
+    def to_list(self, entities: Iterable[Any]) -> List[Dict[str, Any]]:
+        to_dict = self.to_dict
+        return [to_dict(entity) for entity in entities]
+
+    def dumps(self, entity: Any) -> bytes:
+        return orjson.dumps(self.to_dict(entity))
+
+    def dumps_many(self, entities: Iterable[Any]) -> bytes:
+        return orjson.dumps(self.to_list(entities))
+
+def comments_count(post: Any) -> int:
+    return len(post.comments)
+
+# FastAPI shapes, matching the response_model schemas in presentation.schemas
+POST_RESPONSE = EntityEncoder(
+    ("title", "content", "author", "status", "id", "created_at", "updated_at"),
+    computed={"comments_count": comments_count}
+)
+COMMENT_RESPONSE = EntityEncoder(
+    ("content", "author", "id", "post_id", "created_at", "updated_at")
+)
+
+# List views of both frameworks, over PostSummary read models
+POST_SUMMARY = EntityEncoder(SUMMARY_FIELDS)
+
+# Sanic shapes
+COMMENT_SUMMARY = EntityEncoder(("id", "content", "author", "created_at"))
+COMMENT_DETAIL = EntityEncoder(
+    ("id", "post_id", "content", "author", "created_at", "updated_at")
+)
+POST_SEARCH_RESULT = EntityEncoder(
+    ("id", "title", "content", "author", "created_at", "updated_at"),
+    computed={"comments_count": comments_count}
+)
+POST_DETAIL = EntityEncoder(
+    ("id", "title", "content", "author", "created_at", "updated_at"),
+    nested={"comments": COMMENT_SUMMARY}
+)
+POST_CORE = EntityEncoder(("id", "title", "content", "author", "created_at", "updated_at"))
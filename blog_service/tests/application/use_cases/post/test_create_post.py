@@ -57,6 +57,36 @@ async def test_create_post_with_comments(uow):
         saved_comment = await uow.comments.get(comment.id)
         assert saved_comment == comment
 
+async def test_create_post_with_many_comments_uses_one_batch(uow):
+    """Test imported comments are written with a single add_many call"""
+    # Arrange
+    use_case = CreatePostWithComments(uow)
+    comments_data = [
+        {"content": f"Imported comment {i}", "author": "Importer"}
+        for i in range(500)
+    ]
+    batches = []
+    add_many = uow.comments.add_many
+
+    async def recording_add_many(comments):
+        batches.append(len(comments))
+        return await add_many(comments)
+
+    uow.comments.add_many = recording_add_many
+
+    # Act
+    post, comments = await use_case.execute(
+        title="Imported Post",
+        content="Post Content",
+        author="Post Author",
+        comments_data=comments_data
+    )
+
+    # Assert
+    assert batches == [500]
+    assert len(comments) == 500
+    assert all(comment.post_id == post.id for comment in comments)
+
 async def test_create_post_with_invalid_comment_data(uow):
     """Test creating a post with invalid comment data should rollback"""
     # Arrange
@@ -0,0 +1,56 @@
+import json
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from application.use_cases.post.export_posts import ExportPosts
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from presentation.ndjson import ndjson_chunks
+
+pytestmark = pytest.mark.asyncio
+
+def make_post(title: str) -> Post:
+    return Post(
+        id=uuid4(),
+        title=title,
+        content="Content",
+        author="Test Author",
+        status=PostStatus.PUBLISHED,
+        created_at=datetime.utcnow()
+    )
+
+async def test_export_streams_posts_then_comments(uow):
+    """Test the export yields every post before any comment"""
+    # Arrange
+    post = await uow.posts.add(make_post("First"))
+    comment = await uow.comments.add(Comment(
+        id=uuid4(),
+        post_id=post.id,
+        content="Nice",
+        author="Reader",
+        created_at=datetime.utcnow()
+    ))
+    use_case = ExportPosts(uow)
+
+    # Act
+    exported = [entity async for entity in use_case.execute()]
+
+    # Assert
+    assert exported == [post, comment]
+
+async def test_export_ndjson_chunks(uow):
+    """Test NDJSON output has one typed record per line across chunks"""
+    # Arrange
+    posts = [await uow.posts.add(make_post(f"Post {i}")) for i in range(10)]
+    use_case = ExportPosts(uow)
+
+    # Act
+    chunks = [chunk async for chunk in ndjson_chunks(use_case.execute(), chunk_size=300)]
+
+    # Assert
+    assert len(chunks) > 1
+    records = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert [record["id"] for record in records] == [str(post.id) for post in posts]
+    assert all(record["type"] == "post" for record in records)
+    assert "comments" not in records[0]
@@ -0,0 +1,102 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from application.use_cases.comment.get_post_comments_version import GetPostCommentsVersion
+from application.use_cases.post.get_post_version import GetPostVersion
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from presentation.etag import entity_tag, not_modified
+
+pytestmark = pytest.mark.asyncio
+
+def make_post() -> Post:
+    return Post(
+        id=uuid4(),
+        title="Versioned",
+        content="Content",
+        author="Test Author",
+        status=PostStatus.PUBLISHED,
+        created_at=datetime(2024, 1, 1)
+    )
+
+def make_comment(post: Post, created_at: datetime) -> Comment:
+    return Comment(
+        id=uuid4(),
+        post_id=post.id,
+        content="Comment",
+        author="Reader",
+        created_at=created_at
+    )
+
+async def test_post_version_is_none_for_missing_post(uow):
+    """Test a missing post has no version, so routes can answer 404 first"""
+    # Act
+    version = await GetPostVersion(uow).execute(uuid4())
+
+    # Assert
+    assert version is None
+
+async def test_post_version_changes_when_post_is_updated(uow):
+    """Test updating a post moves its version"""
+    # Arrange
+    post = await uow.posts.add(make_post())
+    before = await GetPostVersion(uow).execute(post.id)
+
+    # Act
+    await uow.posts.update(post.model_copy(update={"updated_at": datetime(2024, 1, 2)}))
+    after = await GetPostVersion(uow).execute(post.id)
+
+    # Assert
+    assert before != after
+
+async def test_post_version_changes_when_comments_change(uow):
+    """Test adding or deleting a comment moves both the post and comment versions"""
+    # Arrange
+    post = await uow.posts.add(make_post())
+    first = await uow.comments.add(make_comment(post, datetime(2024, 1, 2)))
+    versions = [
+        await GetPostVersion(uow).execute(post.id),
+        await GetPostCommentsVersion(uow).execute(post.id)
+    ]
+
+    # Act
+    await uow.comments.add(make_comment(post, datetime(2024, 1, 3)))
+    added = [
+        await GetPostVersion(uow).execute(post.id),
+        await GetPostCommentsVersion(uow).execute(post.id)
+    ]
+    await uow.comments.delete(first.id)
+    deleted = [
+        await GetPostVersion(uow).execute(post.id),
+        await GetPostCommentsVersion(uow).execute(post.id)
+    ]
+
+    # Assert
+    assert len({tuple(versions), tuple(added), tuple(deleted)}) == 3
+    assert all(before != after for before, after in zip(versions, added))
+    assert all(before != after for before, after in zip(added, deleted))
+
+async def test_if_none_match_compares_tags_per_representation(uow):
+    """Test a tag only matches the representation it was issued for"""
+    # Arrange
+    post = await uow.posts.add(make_post())
+    version = await GetPostVersion(uow).execute(post.id)
+    full, sparse = entity_tag(version, None), entity_tag(version, ("id", "title"))
+
+    # Assert
+    assert not_modified(f'W/"other", {full}', full)
+    assert not_modified("*", full)
+    assert not not_modified(full, sparse)
+    assert not not_modified(None, full)
+
+async def test_if_none_match_returns_the_entry_as_sent(uow):
+    """Test the matching entry is echoed with its weak prefix for the 304"""
+    # Arrange
+    post = await uow.posts.add(make_post())
+    full = entity_tag(await GetPostVersion(uow).execute(post.id), None)
+
+    # Assert
+    assert not_modified(f'"other", W/{full}', full) == f"W/{full}"
+    assert not_modified(full, full) == full
+    assert not_modified("*", full) == full
@@ -0,0 +1,58 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from application.use_cases.post.search_posts import SearchPosts
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+
+pytestmark = pytest.mark.asyncio
+
+def make_post(title: str, content: str) -> Post:
+    return Post(
+        id=uuid4(),
+        title=title,
+        content=content,
+        author="Test Author",
+        status=PostStatus.PUBLISHED,
+        created_at=datetime.utcnow()
+    )
+
+async def test_search_posts_returns_matches(uow):
+    """Test searching returns only posts containing every term"""
+    # Arrange
+    match = await uow.posts.add(make_post("Async Python", "Event loops explained"))
+    await uow.posts.add(make_post("Gardening", "Growing tomatoes"))
+    use_case = SearchPosts(uow)
+
+    # Act
+    posts = await use_case.execute("python event")
+
+    # Assert
+    assert posts == [match]
+
+async def test_search_posts_paginates(uow):
+    """Test limit and offset select a window of the results"""
+    # Arrange
+    for i in range(5):
+        await uow.posts.add(make_post(f"Python {i}", "Content"))
+    use_case = SearchPosts(uow)
+
+    # Act
+    first_page = await use_case.execute("python", limit=2)
+    last_page = await use_case.execute("python", limit=2, offset=4)
+
+    # Assert
+    assert len(first_page) == 2
+    assert len(last_page) == 1
+
+async def test_search_posts_no_match(uow):
+    """Test searching for an unknown term returns nothing"""
+    # Arrange
+    await uow.posts.add(make_post("Async Python", "Event loops explained"))
+    use_case = SearchPosts(uow)
+
+    # Act
+    posts = await use_case.execute("haskell")
+
+    # Assert
+    assert posts == []
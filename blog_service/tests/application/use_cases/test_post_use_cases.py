@@ -68,7 +68,8 @@ class TestListPosts:
 
         # Assert
         assert len(posts) == 1
-        assert posts[0] == sample_post
+        assert posts[0].id == sample_post.id
+        assert posts[0].comments_count == 0
 
     async def test_list_empty_posts(self, uow):
         # Arrange
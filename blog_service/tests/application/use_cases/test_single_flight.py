@@ -0,0 +1,103 @@
+import asyncio
+import pytest
+from application.use_cases.single_flight import SingleFlight
+
+pytestmark = pytest.mark.asyncio
+
+class SlowQuery:
+    def __init__(self, delay: float = 0.01, error: Exception = None):
+        self.delay = delay
+        self.error = error
+        self.runs = 0
+
+    async def __call__(self):
+        self.runs += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return "post"
+
+async def test_concurrent_calls_share_one_execution():
+    """Test a burst of calls for one key runs the query once"""
+    # Arrange
+    flight = SingleFlight()
+    query = SlowQuery()
+
+    # Act
+    results = await asyncio.gather(*(flight.do("post:1", query) for _ in range(50)))
+
+    # Assert
+    assert results == ["post"] * 50
+    assert query.runs == 1
+    assert flight.stats()["coalesced"] == 49
+    assert flight.stats()["in_flight"] == 0
+
+async def test_errors_reach_every_waiting_caller():
+    """Test a failed query fails all callers instead of hanging them"""
+    # Arrange
+    flight = SingleFlight()
+    query = SlowQuery(error=RuntimeError("db down"))
+
+    # Act
+    results = await asyncio.gather(
+        *(flight.do("post:1", query) for _ in range(3)), return_exceptions=True
+    )
+
+    # Assert
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert query.runs == 1
+
+async def test_cancelled_leader_does_not_cancel_followers():
+    """Test the shared query survives the caller that started it"""
+    # Arrange
+    flight = SingleFlight()
+    query = SlowQuery(delay=0.05)
+    leader = asyncio.ensure_future(flight.do("post:1", query))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do("post:1", query))
+    await asyncio.sleep(0)
+
+    # Act
+    leader.cancel()
+    result = await follower
+
+    # Assert
+    assert result == "post"
+    assert query.runs == 1
+
+async def test_followers_stop_waiting_after_timeout():
+    """Test a follower runs its own query once the bounded wait expires"""
+    # Arrange
+    flight = SingleFlight(timeout=0.01)
+    stuck, fresh = SlowQuery(delay=1), SlowQuery(delay=0)
+    leader = asyncio.ensure_future(flight.do("post:1", stuck))
+    await asyncio.sleep(0)
+
+    # Act
+    result = await flight.do("post:1", fresh)
+
+    # Assert
+    assert result == "post"
+    assert fresh.runs == 1
+    assert flight.stats()["timeouts"] == 1
+    leader.cancel()
+
+async def test_calls_after_a_write_do_not_join_older_flights():
+    """Test a generation change starts a new flight for the same key"""
+    # Arrange
+    generation = [0]
+
+    async def current_generation():
+        return generation[0]
+
+    flight = SingleFlight(generation=current_generation)
+    query = SlowQuery()
+    before = asyncio.ensure_future(flight.do("post:1", query))
+    await asyncio.sleep(0)
+
+    # Act
+    generation[0] += 1
+    await asyncio.gather(before, flight.do("post:1", query))
+
+    # Assert
+    assert query.runs == 2
@@ -3,7 +3,9 @@ from typing import AsyncGenerator
 from uuid import UUID, uuid4
 from domain.entities.post import Post
 from domain.entities.comment import Comment
+from domain.value_objects.entity_version import EntityVersion
 from domain.value_objects.post_status import PostStatus
+from domain.value_objects.post_summary import PostSummary
 
 class MockRepository:
     def __init__(self):
@@ -13,11 +15,49 @@ class MockRepository:
         self.items[str(item.id)] = item
         return item
 
+    async def add_many(self, items):
+        for item in items:
+            self.items[str(item.id)] = item
+        return list(items)
+
     async def get(self, id: UUID):
         return self.items.get(str(id))
 
-    async def list(self):
-        return list(self.items.values())
+    async def exists(self, id: UUID):
+        return str(id) in self.items
+
+    async def list(self, limit=None, after=None):
+        return list(self.items.values())[:limit]
+
+    async def list_summaries(self, limit=None, after=None):
+        return [
+            PostSummary(
+                item.id, item.title, item.author, item.status,
+                item.created_at, item.updated_at, len(item.comments)
+            )
+            for item in list(self.items.values())[:limit]
+        ]
+
+    async def stream(self, batch_size=500):
+        for item in list(self.items.values()):
+            yield item
+
+    async def get_by_post(self, post_id: UUID, limit=None, after=None):
+        return [item for item in self.items.values() if item.post_id == post_id][:limit]
+
+    async def get_version(self, id: UUID):
+        item = self.items.get(str(id))
+        return EntityVersion.of(item.created_at, item.updated_at) if item else None
+
+    async def get_version_by_post(self, post_id: UUID):
+        items = [item for item in self.items.values() if item.post_id == post_id]
+        return EntityVersion(
+            count=len(items),
+            modified_at=max(
+                (max(filter(None, (item.created_at, item.updated_at))) for item in items),
+                default=None
+            )
+        )
 
     async def update(self, item):
         if str(item.id) in self.items:
@@ -26,12 +66,31 @@ class MockRepository:
         return None
 
     async def delete(self, id: UUID):
-        self.items.pop(str(id), None)
+        return self.items.pop(str(id), None) is not None
+
+    async def delete_by_post(self, post_id: UUID):
+        for key, item in list(self.items.items()):
+            if item.post_id == post_id:
+                del self.items[key]
+
+class MockPostSearch:
+    def __init__(self, posts: MockRepository):
+        self.posts = posts
+
+    async def search(self, query: str, limit: int, offset: int = 0):
+        terms = query.lower().split()
+        matches = [
+            post for post in self.posts.items.values()
+            if all(term in f"{post.title} {post.content}".lower() for term in terms)
+        ]
+        return matches[offset:offset + limit]
 
 class MockUnitOfWork:
     def __init__(self):
         self.posts = MockRepository()
         self.comments = MockRepository()
+        self.search = MockPostSearch(self.posts)
+        self.readonly = False
         self.committed = False
         self.rolled_back = False
 
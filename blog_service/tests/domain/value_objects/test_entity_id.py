@@ -0,0 +1,43 @@
+import time
+from uuid import RFC_4122, uuid4
+from domain.value_objects import entity_id
+from domain.value_objects.entity_id import new_id, set_id_generator, uuid7
+
+def test_uuid7_layout():
+    """Test version, variant and the embedded millisecond timestamp"""
+    # Arrange
+    before = time.time_ns() // 1_000_000
+
+    # Act
+    value = uuid7()
+
+    # Assert
+    after = time.time_ns() // 1_000_000
+    assert value.version == 7
+    assert value.variant == RFC_4122
+    assert before <= value.int >> 80 <= after + 1
+
+def test_uuid7_sorts_in_creation_order():
+    """Test ids generated in one burst are strictly increasing"""
+    # Act
+    values = [uuid7() for _ in range(10000)]
+
+    # Assert
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+def test_new_id_uses_configured_generator():
+    """Test the generator is pluggable and defaults to UUIDv7"""
+    # Arrange
+    default = entity_id._generator
+
+    try:
+        # Act
+        set_id_generator(uuid4)
+        generated = new_id()
+    finally:
+        set_id_generator(default)
+
+    # Assert
+    assert generated.version == 4
+    assert new_id().version == 7
@@ -0,0 +1,42 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from domain.entities.post import Post
+from domain.value_objects.page_cursor import PageCursor
+from domain.value_objects.post_status import PostStatus
+
+def test_cursor_round_trip():
+    """Test an encoded cursor decodes back to the same position"""
+    # Arrange
+    cursor = PageCursor(created_at=datetime(2023, 1, 1, 12, 30), id=uuid4())
+
+    # Act
+    decoded = PageCursor.decode(cursor.encode())
+
+    # Assert
+    assert decoded == cursor
+
+def test_cursor_after_entity():
+    """Test a cursor built from an entity keeps its sort key"""
+    # Arrange
+    post = Post(
+        id=uuid4(),
+        title="Test Post",
+        content="Test Content",
+        author="Test Author",
+        status=PostStatus.DRAFT,
+        created_at=datetime.utcnow()
+    )
+
+    # Act
+    cursor = PageCursor.after(post)
+
+    # Assert
+    assert cursor.created_at == post.created_at
+    assert cursor.id == post.id
+
+def test_decode_invalid_cursor():
+    """Test decoding garbage raises ValueError"""
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid page cursor"):
+        PageCursor.decode("not-a-cursor")
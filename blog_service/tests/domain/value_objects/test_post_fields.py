@@ -0,0 +1,22 @@
+import pytest
+from domain.value_objects.post_fields import parse_fields
+
+def test_parse_fields():
+    """Test a field list is split, trimmed and de-duplicated in order"""
+    # Act
+    fields = parse_fields(" id,title , author,id,created_at")
+
+    # Assert
+    assert fields == ("id", "title", "author", "created_at")
+
+def test_parse_unknown_field():
+    """Test unknown field names are rejected"""
+    # Act & Assert
+    with pytest.raises(ValueError, match="Unknown fields: password"):
+        parse_fields("id,password")
+
+def test_parse_empty_fields():
+    """Test an empty field list is rejected"""
+    # Act & Assert
+    with pytest.raises(ValueError, match="at least one field"):
+        parse_fields(" , ")
@@ -0,0 +1,100 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from mongomock_motor import AsyncMongoMockClient
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from infrastructure.hydration import hydrate_comment
+from infrastructure.mongodb.repositories.post_repository import MongoPostRepository
+from infrastructure.sqlite3.repositories.comment_repository import SQLiteCommentRepository
+from infrastructure.sqlite3.repositories.post_repository import SQLitePostRepository
+
+def validated_post() -> Post:
+    post_id = uuid4()
+    return Post(
+        id=post_id,
+        title="Title",
+        content="Content",
+        author="Author",
+        status=PostStatus.PUBLISHED,
+        # Millisecond precision survives a Mongo round trip
+        created_at=datetime(2024, 1, 2, 3, 4, 5, 678000),
+        updated_at=datetime(2024, 1, 3),
+        comments=[
+            Comment(
+                id=uuid4(),
+                post_id=post_id,
+                content=f"Comment {i}",
+                author="Reader",
+                created_at=datetime(2024, 1, 2, 4, i),
+                updated_at=None
+            )
+            for i in range(3)
+        ]
+    )
+
+def assert_same_entity(hydrated: Post, validated: Post) -> None:
+    assert hydrated == validated
+    assert hydrated.model_dump_json() == validated.model_dump_json()
+    assert hydrated.model_fields_set == validated.model_fields_set
+    assert [comment.model_fields_set for comment in hydrated.comments] == [
+        comment.model_fields_set for comment in validated.comments
+    ]
+    with pytest.raises(ValueError):
+        hydrated.title = "Changed"
+
+@pytest.mark.asyncio
+async def test_sqlite_rows_hydrate_to_the_validated_entities(tmp_path):
+    """Test posts and comments read from SQLite match what validation builds"""
+    # Arrange
+    post = validated_post()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'blog.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        await SQLitePostRepository(session).add(post)
+        await SQLiteCommentRepository(session).add_many(post.comments)
+        await session.commit()
+
+    # Act
+    async with AsyncSession(engine) as session:
+        loaded = await SQLitePostRepository(session).get(post.id)
+    await engine.dispose()
+
+    # Assert
+    assert_same_entity(loaded, post)
+
+@pytest.mark.asyncio
+async def test_mongo_documents_hydrate_to_the_validated_entities():
+    """Test posts with embedded comments read from Mongo match what validation builds"""
+    # Arrange
+    post = validated_post()
+    repository = MongoPostRepository(AsyncMongoMockClient()["blog"]["posts"])
+    await repository.add(post)
+
+    # Act
+    loaded = await repository.get(post.id)
+
+    # Assert
+    assert_same_entity(loaded, post)
+
+def test_hydrator_still_validates_stored_values():
+    """Test a malformed stored row is rejected rather than built unchecked"""
+    # Arrange
+    values = {
+        "id": "not-a-uuid",
+        "post_id": uuid4(),
+        "content": "Content",
+        "author": "Reader",
+        "created_at": datetime(2024, 1, 2),
+        "updated_at": None
+    }
+
+    # Act / Assert
+    with pytest.raises(ValidationError):
+        hydrate_comment(values)
@@ -0,0 +1,86 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from mongomock_motor import AsyncMongoMockClient
+from pymongo import ReadPreference
+from core.config import Settings
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from infrastructure.mongodb import session
+from infrastructure.mongodb.session import client_options, read_preference
+from infrastructure.mongodb.repositories.post_repository import MongoPostRepository
+
+def test_client_options_from_settings():
+    """Test pool, compression and read preference settings reach the client"""
+    # Arrange
+    settings = Settings(
+        MONGODB_MAX_POOL_SIZE=50,
+        MONGODB_MIN_POOL_SIZE=5,
+        MONGODB_MAX_IDLE_TIME_MS=60000,
+        MONGODB_WAIT_QUEUE_TIMEOUT_MS=2000,
+        MONGODB_COMPRESSORS="zstd,snappy"
+    )
+
+    # Act
+    options = client_options(settings)
+
+    # Assert
+    assert options == {
+        "maxPoolSize": 50,
+        "minPoolSize": 5,
+        "maxIdleTimeMS": 60000,
+        "waitQueueTimeoutMS": 2000,
+        "readPreference": "primary",
+        "compressors": "zstd,snappy",
+    }
+
+def test_client_options_skip_unset_values():
+    """Test unset timeouts and compressors fall back to driver defaults"""
+    # Act
+    options = client_options(Settings(MONGODB_COMPRESSORS=""))
+
+    # Assert
+    assert "maxIdleTimeMS" not in options
+    assert "waitQueueTimeoutMS" not in options
+    assert "compressors" not in options
+
+@pytest.mark.asyncio
+async def test_list_reads_use_list_read_preference():
+    """Test list queries go to secondaries while writes stay on the primary"""
+    # Arrange
+    collection = AsyncMongoMockClient()["blog_db"]["posts"]
+    repository = MongoPostRepository(collection, read_preference("secondaryPreferred"))
+    now = datetime.now()
+    for i in range(3):
+        await repository.add(Post(
+            id=uuid4(),
+            title=f"Post {i}",
+            content="Content",
+            author="Author",
+            status=PostStatus.DRAFT,
+            created_at=now + timedelta(seconds=i)
+        ))
+
+    # Act
+    posts = await repository.list(limit=2)
+
+    # Assert
+    assert [post.title for post in posts] == ["Post 2", "Post 1"]
+    assert repository.list_collection.read_preference == ReadPreference.SECONDARY_PREFERRED
+    assert repository.collection.read_preference == ReadPreference.PRIMARY
+
+def test_each_process_gets_its_own_client(monkeypatch):
+    """Test a client inherited across fork is replaced in the child"""
+    # Arrange
+    monkeypatch.setattr(session, "_client", None)
+    monkeypatch.setattr(session, "create_client", lambda: object())
+    parent = session.get_client()
+
+    # Act
+    same_process = session.get_client()
+    monkeypatch.setattr(session.os, "getpid", lambda: -1)
+    child = session.get_client()
+
+    # Assert
+    assert same_process is parent
+    assert child is not parent
@@ -0,0 +1,114 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from mongomock_motor import AsyncMongoMockClient
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from infrastructure.mongodb.models.post import PostDocument
+from infrastructure.mongodb.transaction import LazyTransaction
+from infrastructure.mongodb.unit_of_work import MongoUnitOfWork
+
+class FakeSession:
+    def __init__(self):
+        self.in_transaction = False
+        self.transactions = 0
+        self.commits = 0
+        self.ended = False
+
+    def start_transaction(self):
+        self.in_transaction = True
+        self.transactions += 1
+
+    async def commit_transaction(self):
+        self.in_transaction = False
+        self.commits += 1
+
+    async def abort_transaction(self):
+        self.in_transaction = False
+
+    async def end_session(self):
+        self.ended = True
+
+class FakeClient:
+    def __init__(self):
+        self.sessions = []
+
+    async def start_session(self):
+        self.sessions.append(FakeSession())
+        return self.sessions[-1]
+
+def no_sessions_client() -> AsyncMongoMockClient:
+    client = AsyncMongoMockClient()
+
+    async def start_session():
+        raise AssertionError("session started")
+
+    client.start_session = start_session
+    return client
+
+async def seed_post(client) -> Post:
+    post = Post(
+        id=uuid4(),
+        title="Test Post",
+        content="Content",
+        author="Author",
+        status=PostStatus.DRAFT,
+        created_at=datetime.now()
+    )
+    await client["blog_db"].posts.insert_one(PostDocument.to_document(post))
+    return post
+
+@pytest.mark.asyncio
+async def test_readonly_uow_skips_session():
+    """Test a read-only unit of work never opens a session or transaction"""
+    # Arrange
+    client = no_sessions_client()
+    post = await seed_post(client)
+
+    # Act
+    async with MongoUnitOfWork(client, "blog_db", readonly=True) as uow:
+        found = await uow.posts.get(post.id)
+        posts = await uow.posts.list(limit=10)
+        comments = await uow.comments.get_by_post(post.id)
+
+    # Assert
+    assert found.id == post.id
+    assert [p.id for p in posts] == [post.id]
+    assert comments == []
+
+@pytest.mark.asyncio
+async def test_write_uow_without_writes_skips_session():
+    """Test a write unit of work only reading never opens a session"""
+    # Arrange
+    client = no_sessions_client()
+    post = await seed_post(client)
+
+    # Act
+    async with MongoUnitOfWork(client, "blog_db") as uow:
+        found = await uow.posts.get(post.id)
+
+    # Assert
+    assert found.id == post.id
+
+@pytest.mark.asyncio
+async def test_lazy_transaction_starts_on_first_write():
+    """Test the session opens once and a transaction restarts after commit"""
+    # Arrange
+    client = FakeClient()
+    transaction = LazyTransaction(client)
+
+    # Act
+    first = await transaction.begin()
+    second = await transaction.begin()
+    await transaction.commit()
+    await transaction.begin()
+    await transaction.commit()
+    await transaction.end()
+
+    # Assert
+    assert first is second
+    assert len(client.sessions) == 1
+    assert first.transactions == 2
+    assert first.commits == 2
+    assert first.ended
+    assert transaction.session is None
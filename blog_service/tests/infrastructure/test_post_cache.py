@@ -0,0 +1,169 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from application.use_cases.comment.create_comment import CreateComment
+from application.use_cases.post.get_post import GetPost
+from application.use_cases.post.update_post import UpdatePost
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from infrastructure.cache import memory
+from infrastructure.cache.memory import MemoryCache
+from infrastructure.cache.repositories import cache_key
+from infrastructure.cache.unit_of_work import CachingUnitOfWork
+from tests.conftest import MockUnitOfWork
+
+def reader_for(uow: MockUnitOfWork) -> MockUnitOfWork:
+    """Read-only unit of work over the same mock storage"""
+    reader = MockUnitOfWork()
+    reader.posts = uow.posts
+    reader.comments = uow.comments
+    reader.readonly = True
+    return reader
+
+async def add_post(uow: MockUnitOfWork) -> Post:
+    return await uow.posts.add(Post(
+        id=uuid4(),
+        title="Cached",
+        content="Content",
+        author="Author",
+        status=PostStatus.PUBLISHED,
+        created_at=datetime.utcnow()
+    ))
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used():
+    """Test the cache stays bounded and evicts the coldest entry"""
+    # Arrange
+    cache = MemoryCache(max_size=2, ttl=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")
+
+    # Act
+    await cache.set("c", 3)
+
+    # Assert
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(monkeypatch):
+    """Test an entry older than the TTL counts as a miss"""
+    # Arrange
+    now = [1000.0]
+    monkeypatch.setattr(memory.time, "monotonic", lambda: now[0])
+    cache = MemoryCache(max_size=10, ttl=5)
+    await cache.set("a", 1)
+
+    # Act
+    now[0] += 6
+
+    # Assert
+    assert await cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+@pytest.mark.asyncio
+async def test_set_skips_values_read_before_an_invalidation():
+    """Test a read that raced with an invalidation does not repopulate the cache"""
+    # Arrange
+    cache = MemoryCache(max_size=10, ttl=60)
+    generation = await cache.current_generation()
+
+    # Act
+    await cache.invalidate("a")
+    await cache.set("a", "stale", generation)
+
+    # Assert
+    assert await cache.get("a") is None
+
+@pytest.mark.asyncio
+async def test_get_post_is_served_from_cache(uow):
+    """Test repeated reads of a post hit the cache"""
+    # Arrange
+    cache = MemoryCache(max_size=10, ttl=60)
+    post = await add_post(uow)
+
+    # Act
+    first = await GetPost(CachingUnitOfWork(reader_for(uow), cache)).execute(post.id)
+    second = await GetPost(CachingUnitOfWork(reader_for(uow), cache)).execute(post.id)
+
+    # Assert
+    assert first == second == post
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+@pytest.mark.asyncio
+async def test_update_invalidates_cached_post(uow):
+    """Test a committed update is visible to the next cached read"""
+    # Arrange
+    cache = MemoryCache(max_size=10, ttl=60)
+    post = await add_post(uow)
+    await GetPost(CachingUnitOfWork(reader_for(uow), cache)).execute(post.id)
+
+    # Act
+    await UpdatePost(CachingUnitOfWork(uow, cache)).execute(post.id, title="Renamed")
+    found = await GetPost(CachingUnitOfWork(reader_for(uow), cache)).execute(post.id)
+
+    # Assert
+    assert found.title == "Renamed"
+    assert cache.stats()["invalidations"] == 1
+
+@pytest.mark.asyncio
+async def test_create_comment_invalidates_cached_post(uow):
+    """Test adding a comment drops the cached post it belongs to"""
+    # Arrange
+    cache = MemoryCache(max_size=10, ttl=60)
+    post = await add_post(uow)
+    await GetPost(CachingUnitOfWork(reader_for(uow), cache)).execute(post.id)
+
+    # Act
+    await CreateComment(CachingUnitOfWork(uow, cache)).execute(post.id, "Nice", "Reader")
+
+    # Assert
+    assert await cache.get(cache_key(post.id)) is None
+
+@pytest.mark.asyncio
+async def test_missing_post_ids_are_remembered(uow):
+    """Test repeated comments on a missing post only check the database once"""
+    # Arrange
+    cache = MemoryCache(max_size=10, ttl=60)
+    missing = uuid4()
+    lookups = []
+    exists = uow.posts.exists
+
+    async def counting_exists(post_id):
+        lookups.append(post_id)
+        return await exists(post_id)
+
+    uow.posts.exists = counting_exists
+
+    # Act
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            await CreateComment(CachingUnitOfWork(uow, cache, negative_ttl=5)).execute(
+                missing, "Spam", "Bot"
+            )
+
+    # Assert
+    assert lookups == [missing]
+
+@pytest.mark.asyncio
+async def test_creating_a_post_clears_its_negative_entry(uow):
+    """Test a post created after a failed lookup is found right away"""
+    # Arrange
+    cache = MemoryCache(max_size=10, ttl=60)
+    post = await add_post(MockUnitOfWork())
+    writer = CachingUnitOfWork(uow, cache, negative_ttl=5)
+    async with writer:
+        assert not await writer.posts.exists(post.id)
+
+    # Act
+    async with writer:
+        await writer.posts.add(post)
+    comment = await CreateComment(CachingUnitOfWork(uow, cache, negative_ttl=5)).execute(
+        post.id, "First", "Reader"
+    )
+
+    # Assert
+    assert comment.post_id == post.id
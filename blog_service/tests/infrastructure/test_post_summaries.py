@@ -0,0 +1,94 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+from domain.value_objects.page_cursor import PageCursor
+from domain.value_objects.post_status import PostStatus
+from domain.value_objects.post_summary import PostSummary
+from infrastructure.mongodb.models.post import PostDocument, SUMMARY_PROJECTION
+from infrastructure.sqlite3.repositories.comment_repository import SQLiteCommentRepository
+from infrastructure.sqlite3.repositories.post_repository import SQLitePostRepository
+
+def posts_with_comments(count: int):
+    started = datetime(2024, 1, 1)
+    posts = []
+    for i in range(count):
+        post_id = uuid4()
+        posts.append(Post(
+            id=post_id,
+            title=f"Post {i}",
+            content="Long content " * 50,
+            author="Author",
+            status=PostStatus.PUBLISHED,
+            created_at=started + timedelta(minutes=i),
+            comments=[
+                Comment(
+                    id=uuid4(),
+                    post_id=post_id,
+                    content="Comment",
+                    author="Reader",
+                    created_at=started + timedelta(minutes=i, seconds=j)
+                )
+                for j in range(i)
+            ]
+        ))
+    return posts
+
+def expected_summaries(posts):
+    return [
+        PostSummary(
+            post.id, post.title, post.author, post.status,
+            post.created_at, post.updated_at, len(post.comments)
+        )
+        for post in sorted(posts, key=lambda post: post.created_at, reverse=True)
+    ]
+
+@pytest.mark.asyncio
+async def test_sqlite_summaries_count_comments_in_list_order(tmp_path):
+    """Test SQLite summaries carry comment counts and page like list()"""
+    # Arrange
+    posts = posts_with_comments(4)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'blog.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        for post in posts:
+            await SQLitePostRepository(session).add(post)
+        await SQLiteCommentRepository(session).add_many(
+            [comment for post in posts for comment in post.comments]
+        )
+        await session.commit()
+    expected = expected_summaries(posts)
+
+    # Act
+    async with AsyncSession(engine) as session:
+        repository = SQLitePostRepository(session)
+        first = await repository.list_summaries(limit=2)
+        rest = await repository.list_summaries(limit=2, after=PageCursor.after(first[-1]))
+    await engine.dispose()
+
+    # Assert
+    assert first + rest == expected
+    assert all(isinstance(summary, PostSummary) for summary in first + rest)
+
+def test_mongo_summary_projection_leaves_bodies_on_the_server():
+    """Test the Mongo summary projection counts comments instead of returning them"""
+    # Arrange
+    post = posts_with_comments(3)[-1]
+    doc = PostDocument.to_document(post)
+    projected = {
+        name: doc[name] for name, include in SUMMARY_PROJECTION.items() if include == 1
+    }
+    projected["comments_count"] = len(doc["comments"])
+
+    # Act
+    summary = PostDocument.to_summary(projected)
+
+    # Assert
+    assert "content" not in SUMMARY_PROJECTION and "comments" not in SUMMARY_PROJECTION
+    assert SUMMARY_PROJECTION["comments_count"] == {"$size": {"$ifNull": ["$comments", []]}}
+    assert summary == expected_summaries([post])[0]
@@ -0,0 +1,51 @@
+import json
+import logging
+from infrastructure.query_profiler import QueryProfile, settings
+
+def test_profile_keeps_slowest_statements():
+    """Test the profile counts every query but keeps only the N slowest"""
+    # Arrange
+    profile = QueryProfile("GET /posts", top_n=2)
+
+    # Act
+    for statement, duration in [("a", 0.001), ("b", 0.004), ("c", 0.002), ("d", 0.003)]:
+        profile.record(statement, duration)
+
+    # Assert
+    assert profile.query_count == 4
+    assert round(profile.total_time, 6) == 0.010
+    assert sorted(statement for _, _, statement in profile.slowest) == ["b", "d"]
+
+def test_server_timing_header():
+    """Test the Server-Timing value lists the total and slowest statements"""
+    # Arrange
+    profile = QueryProfile("GET /posts", top_n=2)
+    profile.record('SELECT "x"\n  FROM posts', 0.002)
+    profile.record("SELECT 1", 0.001)
+
+    # Act
+    header = profile.server_timing()
+
+    # Assert
+    assert header == (
+        'db;dur=3.000;desc="2 queries", '
+        "db-1;dur=2.000;desc=\"SELECT 'x' FROM posts\", "
+        'db-2;dur=1.000;desc="SELECT 1"'
+    )
+
+def test_slow_query_is_logged(caplog):
+    """Test statements above the threshold are written to the slow-query log"""
+    # Arrange
+    profile = QueryProfile("GET /posts")
+    slow = (settings.SLOW_QUERY_THRESHOLD_MS + 1) / 1000
+
+    # Act
+    with caplog.at_level(logging.WARNING, logger="blog.slow_query"):
+        profile.record("SELECT 1", 0.0)
+        profile.record("SELECT 2", slow)
+
+    # Assert
+    assert len(caplog.records) == 1
+    entry = json.loads(caplog.records[0].getMessage())
+    assert entry["request"] == "GET /posts"
+    assert entry["statement"] == "SELECT 2"
@@ -0,0 +1,82 @@
+import pytest
+from application.use_cases.post.create_post import CreatePost
+from infrastructure.cache.memory import MemoryCache
+from infrastructure.cache.responses import ResponseCache
+from infrastructure.cache.unit_of_work import CachingUnitOfWork
+
+@pytest.mark.asyncio
+async def test_stored_body_is_served_for_the_same_route_and_query():
+    """Test a stored response is a hit for the same arguments in any order"""
+    # Arrange
+    responses = ResponseCache(MemoryCache(max_size=10, ttl=60))
+    miss = await responses.lookup("list_posts", query=[("limit", "5"), ("fields", "id")])
+    await miss.store(b'{"posts":[]}', '"tag"')
+
+    # Act
+    hit = await responses.lookup("list_posts", query=[("fields", "id"), ("limit", "5")])
+    other = await responses.lookup("list_posts", query=[("limit", "6")])
+
+    # Assert
+    assert not miss.hit
+    assert hit.hit and hit.body == b'{"posts":[]}' and hit.etag == '"tag"'
+    assert not other.hit
+
+@pytest.mark.asyncio
+async def test_committed_write_moves_the_generation(uow):
+    """Test creating a post makes cached listings unreachable"""
+    # Arrange
+    cache = MemoryCache(max_size=10, ttl=60)
+    responses = ResponseCache(cache)
+    await (await responses.lookup("list_posts")).store(b"[]")
+
+    # Act
+    await CreatePost(CachingUnitOfWork(uow, cache)).execute("Title", "Content", "Author")
+
+    # Assert
+    assert not (await responses.lookup("list_posts")).hit
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_misses():
+    """Test routes can use a disabled response cache unconditionally"""
+    # Arrange
+    responses = ResponseCache(None)
+    await (await responses.lookup("list_posts")).store(b"[]")
+
+    # Act
+    cached = await responses.lookup("list_posts")
+
+    # Assert
+    assert not cached.hit
+
+@pytest.mark.asyncio
+async def test_bodies_kept_apart_follow_the_post_cache_generation(uow):
+    """Test a separate body store leaves post entries alone and still invalidates on writes"""
+    # Arrange
+    post_cache = MemoryCache(max_size=1, ttl=60)
+    await post_cache.set("post:1", "cached post")
+    responses = ResponseCache(MemoryCache(max_size=10, ttl=60), generations=post_cache)
+    await (await responses.lookup("list_posts", "page", query=[("limit", "1")])).store(b"[]")
+    await (await responses.lookup("list_posts", "page", query=[("limit", "2")])).store(b"[]")
+    hit = await responses.lookup("list_posts", "page", query=[("limit", "1")])
+
+    # Act
+    await CreatePost(CachingUnitOfWork(uow, post_cache)).execute("Title", "Content", "Author")
+
+    # Assert
+    assert hit.hit
+    assert await post_cache.get("post:1") == "cached post"
+    assert not (await responses.lookup("list_posts", "page", query=[("limit", "1")])).hit
+
+@pytest.mark.asyncio
+async def test_stored_headers_are_repeated_on_a_hit():
+    """Test page headers such as the next cursor come back with the body"""
+    # Arrange
+    responses = ResponseCache(MemoryCache(max_size=10, ttl=60))
+    await (await responses.lookup("list_posts")).store(b"[]", headers={"X-Next-Cursor": "abc"})
+
+    # Act
+    cached = await responses.lookup("list_posts")
+
+    # Assert
+    assert cached.headers == {"X-Next-Cursor": "abc"}
+    assert cached.etag is None
@@ -0,0 +1,137 @@
+import asyncio
+import pytest
+from application.use_cases.post.get_post import GetPost
+from application.use_cases.post.update_post import UpdatePost
+from infrastructure.cache.repositories import decode_entry, encode_entry
+from infrastructure.cache.resp import encode_command, open_connection, read_reply
+from infrastructure.cache.server import CacheServer, serve
+from infrastructure.cache.shared import SharedCache
+from infrastructure.cache.unit_of_work import CachingUnitOfWork
+from tests.infrastructure.test_post_cache import add_post, reader_for
+
+@pytest.fixture
+async def cache_url(tmp_path):
+    url = f"unix://{tmp_path / 'cache.sock'}"
+    listener = await serve(url, max_size=100, ttl=60)
+    yield url
+    listener.close()
+    await listener.wait_closed()
+
+def post_cache(url: str) -> SharedCache:
+    """One worker's view of the shared cache"""
+    return SharedCache(
+        url,
+        ttl=60,
+        encode=encode_entry,
+        decode=decode_entry
+    )
+
+@pytest.mark.asyncio
+async def test_entries_are_visible_to_every_client(cache_url):
+    """Test a value stored by one worker is a hit for another"""
+    # Arrange
+    first, second = SharedCache(cache_url, 60, bytes, bytes), SharedCache(cache_url, 60, bytes, bytes)
+    await first.set("post:1", b"cached")
+
+    # Act
+    found = await second.get("post:1")
+
+    # Assert
+    assert found == b"cached"
+    assert second.stats()["hits"] == 1
+    await first.close()
+    await second.close()
+
+@pytest.mark.asyncio
+async def test_invalidation_from_another_client_cancels_guarded_set(cache_url):
+    """Test a read that raced with another worker's invalidation is not stored"""
+    # Arrange
+    reader, writer = SharedCache(cache_url, 60, bytes, bytes), SharedCache(cache_url, 60, bytes, bytes)
+    generation = await reader.current_generation()
+
+    # Act
+    await writer.invalidate("post:1")
+    await reader.set("post:1", b"stale", generation)
+
+    # Assert
+    assert await reader.get("post:1") is None
+    assert await reader.current_generation() == generation + 1
+    await reader.close()
+    await writer.close()
+
+@pytest.mark.asyncio
+async def test_update_in_one_worker_invalidates_the_others(cache_url, uow):
+    """Test a committed update is seen by a different worker's next read"""
+    # Arrange
+    worker_a, worker_b = post_cache(cache_url), post_cache(cache_url)
+    post = await add_post(uow)
+    await GetPost(CachingUnitOfWork(reader_for(uow), worker_b)).execute(post.id)
+
+    # Act
+    await UpdatePost(CachingUnitOfWork(uow, worker_a)).execute(post.id, title="Renamed")
+    found = await GetPost(CachingUnitOfWork(reader_for(uow), worker_b)).execute(post.id)
+
+    # Assert
+    assert found.title == "Renamed"
+    await worker_a.close()
+    await worker_b.close()
+
+@pytest.mark.asyncio
+async def test_unreachable_server_counts_as_a_miss(tmp_path):
+    """Test the cache degrades to misses when the server is down"""
+    # Arrange
+    cache = SharedCache(f"unix://{tmp_path / 'missing.sock'}", 60, bytes, bytes)
+
+    # Act
+    await cache.set("post:1", b"value")
+    found = await cache.get("post:1")
+
+    # Assert
+    assert found is None
+    assert cache.stats()["errors"] == 2
+
+def test_writes_to_unwatched_keys_keep_no_versions():
+    """Test the version map does not grow with keys nobody watches"""
+    # Arrange
+    server = CacheServer(max_size=10, ttl=60)
+
+    # Act
+    for i in range(1000):
+        server.execute([b"SET", f"response:{i}:/posts".encode(), b"v"])
+        server.execute([b"INCR", f"counter:{i}".encode()])
+        server.execute([b"DEL", f"response:{i}:/posts".encode()])
+
+    # Assert
+    assert len(server.versions) == 0
+    assert len(server.watchers) == 0
+
+@pytest.mark.asyncio
+async def test_watched_versions_are_released_when_the_connection_closes(tmp_path):
+    """Test two connections share a watched key's version until both close"""
+    # Arrange
+    server = CacheServer(max_size=10, ttl=60)
+    path = str(tmp_path / "cache.sock")
+    listener = await asyncio.start_unix_server(server.handle, path=path)
+    first, second = await open_connection(f"unix://{path}"), await open_connection(f"unix://{path}")
+    for reader, writer in (first, second):
+        writer.write(encode_command("WATCH", "cache:generation"))
+        await read_reply(reader)
+
+    # Act
+    watching = dict(server.watchers)
+    first[1].write(encode_command("UNWATCH"))
+    await read_reply(first[0])
+    second[1].close()
+    await second[1].wait_closed()
+    for _ in range(100):
+        if not server.versions:
+            break
+        await asyncio.sleep(0.01)
+
+    # Assert
+    assert watching == {b"cache:generation": 2}
+    assert server.versions == {}
+    assert server.watchers == {}
+    first[1].close()
+    listener.close()
+    await listener.wait_closed()
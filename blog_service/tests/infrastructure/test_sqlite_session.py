@@ -0,0 +1,26 @@
+import pytest
+from sqlalchemy import text
+from infrastructure.sqlite3 import session
+
+@pytest.mark.asyncio
+async def test_engine_is_created_per_process_and_disposed(monkeypatch, tmp_path):
+    """Test a forked worker opens its own engine and dispose drops it"""
+    # Arrange
+    monkeypatch.setattr(session, "SQLITE_DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'blog.db'}")
+    monkeypatch.setattr(session, "_engine", None)
+    parent = session.get_engine()
+    async with session.new_session() as db:
+        journal_mode = await db.scalar(text("PRAGMA journal_mode"))
+
+    # Act
+    same_process = session.get_engine()
+    monkeypatch.setattr(session.os, "getpid", lambda: -1)
+    child = session.get_engine()
+    await session.dispose_engine()
+
+    # Assert
+    assert journal_mode == "wal"
+    assert same_process is parent
+    assert child is not parent
+    assert session._engine is None
+    await parent.dispose()
@@ -0,0 +1,164 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from bson.binary import Binary
+from mongomock_motor import AsyncMongoMockClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from domain.entities.comment import Comment
+from domain.value_objects.entity_id import new_id
+from infrastructure.mongodb.models import binary_uuid
+from infrastructure.mongodb.repositories.comment_repository import MongoCommentRepository
+from infrastructure.mongodb.repositories.post_repository import MongoPostRepository
+from infrastructure.mongodb.uuid_migration import migrate_uuids as migrate_mongo_uuids
+from infrastructure.sqlite3.models import binary_uuid as sqlite_binary_uuid
+from infrastructure.sqlite3.models.post import PostModel
+from infrastructure.sqlite3.repositories.comment_repository import SQLiteCommentRepository
+from infrastructure.sqlite3.repositories.post_repository import SQLitePostRepository
+from infrastructure.sqlite3.session import create_missing_indexes, set_sqlite_pragma
+from infrastructure.sqlite3.uuid_migration import migrate_uuids as migrate_sqlite_uuids
+
+pytestmark = pytest.mark.asyncio
+
+# Tables as sqlmodel created them before BinaryUUID: CHAR(32) hex text keys
+LEGACY_SCHEMA = (
+    "CREATE TABLE posts ("
+    " id CHAR(32) NOT NULL, title VARCHAR NOT NULL, content VARCHAR NOT NULL,"
+    " author VARCHAR NOT NULL, status VARCHAR(9) NOT NULL, created_at DATETIME NOT NULL,"
+    " updated_at DATETIME, PRIMARY KEY (id))",
+    "CREATE TABLE comments ("
+    " id CHAR(32) NOT NULL, post_id CHAR(32) NOT NULL, content VARCHAR NOT NULL,"
+    " author VARCHAR NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME,"
+    " PRIMARY KEY (id), FOREIGN KEY(post_id) REFERENCES posts (id))",
+)
+
+@pytest.fixture
+def legacy_ids():
+    return [uuid4() for _ in range(5)]
+
+@pytest.fixture
+async def legacy_engine(tmp_path, legacy_ids):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragma)
+    async with engine.begin() as conn:
+        for ddl in LEGACY_SCHEMA:
+            await conn.exec_driver_sql(ddl)
+        await conn.exec_driver_sql(
+            "INSERT INTO posts (id, title, content, author, status, created_at)"
+            " VALUES (?, 'Title', 'Content', 'Author', 'DRAFT', ?)",
+            [(post_id.hex, datetime.utcnow()) for post_id in legacy_ids]
+        )
+        await conn.exec_driver_sql(
+            "INSERT INTO comments (id, post_id, content, author, created_at)"
+            " VALUES (?, ?, 'Comment', 'Reader', ?)",
+            [(uuid4().hex, post_id.hex, datetime.utcnow()) for post_id in legacy_ids]
+        )
+        # What init_db does for a database created by an older version
+        await conn.run_sync(create_missing_indexes)
+    yield engine
+    await engine.dispose()
+
+async def test_sqlite_migration_converts_text_ids(legacy_engine, legacy_ids, monkeypatch):
+    """Test hex text ids become 16-byte blobs, stay linked and are found without the fallback"""
+    # Arrange
+    engine = legacy_engine
+    monkeypatch.setattr(sqlite_binary_uuid.settings, "SQLITE_UUID_TEXT_FALLBACK", False)
+
+    # Act
+    migrated = await migrate_sqlite_uuids(engine, batch_size=2)
+    again = await migrate_sqlite_uuids(engine, batch_size=2)
+
+    # Assert
+    async with engine.connect() as conn:
+        post_types = (await conn.exec_driver_sql("SELECT DISTINCT typeof(id) FROM posts")).all()
+        linked = await conn.scalar(PostModel.__table__.select().with_only_columns(
+            PostModel.__table__.c.id
+        ).where(PostModel.__table__.c.id == legacy_ids[0]))
+        joined = (await conn.exec_driver_sql(
+            "SELECT count(*) FROM comments JOIN posts ON posts.id = comments.post_id"
+        )).scalar()
+    async with AsyncSession(engine) as session:
+        post = await SQLitePostRepository(session).get(legacy_ids[0])
+    assert migrated == {"posts": 5, "comments": 5}
+    assert again == {"posts": 0, "comments": 0}
+    assert post_types == [("blob",)]
+    assert linked == legacy_ids[0]
+    assert joined == 5
+    assert post.id == legacy_ids[0]
+    assert len(post.comments) == 1
+
+async def test_sqlite_text_fallback_finds_unmigrated_rows(legacy_engine, legacy_ids):
+    """Test reads and writes by id reach rows still keyed by hex text"""
+    # Arrange
+    post_id = legacy_ids[0]
+
+    # Act
+    async with AsyncSession(legacy_engine, expire_on_commit=False) as session:
+        posts, comments = SQLitePostRepository(session), SQLiteCommentRepository(session)
+        post = await posts.get(post_id)
+        version = await posts.get_version(post_id)
+        exists = await posts.exists(post_id)
+        await comments.add(Comment(
+            id=new_id(), post_id=post_id, content="New", author="Reader",
+            created_at=datetime.utcnow()
+        ))
+        updated = await posts.update(post.model_copy(update={"title": "Renamed"}))
+        await session.commit()
+        listed = await comments.get_by_post(post_id)
+
+    # Assert
+    assert post.id == post_id
+    assert len(post.comments) == 1
+    assert version is not None
+    assert exists
+    assert updated.title == "Renamed"
+    assert len(updated.comments) == 2
+    assert [comment.post_id for comment in listed] == [post_id, post_id]
+
+async def test_mongo_migration_converts_string_ids(legacy_ids, monkeypatch):
+    """Test string ids become Binary subtype 4 and are found without the fallback"""
+    # Arrange
+    monkeypatch.setattr(binary_uuid.settings, "MONGODB_UUID_STRING_FALLBACK", False)
+    database = AsyncMongoMockClient()["blog_db"]
+    now = datetime.utcnow()
+    for post_id in legacy_ids:
+        await database.posts.insert_one({
+            "_id": str(post_id), "title": "Title", "content": "Content",
+            "author": "Author", "status": "draft", "created_at": now,
+            "updated_at": None, "comments": []
+        })
+        await database.comments.insert_one({
+            "_id": str(uuid4()), "post_id": str(post_id), "content": "Comment",
+            "author": "Reader", "created_at": now, "updated_at": None
+        })
+
+    # Act
+    migrated = await migrate_mongo_uuids(database, batch_size=2)
+    again = await migrate_mongo_uuids(database, batch_size=2)
+
+    # Assert
+    assert migrated == {"posts": 5, "comments": 5}
+    assert again == {"posts": 0, "comments": 0}
+    doc = await database.posts.find_one({})
+    assert isinstance(doc["_id"], Binary) and doc["_id"].subtype == 4
+    assert await database.posts.count_documents({}) == 5
+    post = await MongoPostRepository(database.posts).get(legacy_ids[0])
+    comments = await MongoCommentRepository(database.comments).get_by_post(legacy_ids[0])
+    assert post.id == legacy_ids[0]
+    assert [comment.post_id for comment in comments] == [legacy_ids[0]]
+
+async def test_mongo_string_fallback_finds_unmigrated_documents(legacy_ids):
+    """Test lookups still match string ids while the fallback is on"""
+    # Arrange
+    database = AsyncMongoMockClient()["blog_db"]
+    await database.posts.insert_one({
+        "_id": str(legacy_ids[0]), "title": "Title", "content": "Content",
+        "author": "Author", "status": "draft", "created_at": datetime.utcnow()
+    })
+
+    # Act
+    post = await MongoPostRepository(database.posts).get(legacy_ids[0])
+
+    # Assert
+    assert post.id == legacy_ids[0]
@@ -0,0 +1,43 @@
+import asyncio
+from uuid import uuid4
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from core.dependencies import get_write_uow
+from presentation.api.v1.comment_router import router
+from tests.conftest import MockUnitOfWork
+from tests.infrastructure.test_post_cache import add_post
+
+def make_client(uow: MockUnitOfWork) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_write_uow] = lambda: uow
+    return TestClient(app)
+
+def test_create_comment_goes_through_the_shared_unit_of_work():
+    """Test a comment is stored on an existing post via the injected unit of work"""
+    # Arrange
+    uow = MockUnitOfWork()
+    post = asyncio.run(add_post(uow))
+    client = make_client(uow)
+
+    # Act
+    response = client.post(f"/comments/{post.id}", json={"content": "Nice", "author": "Reader"})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["post_id"] == str(post.id)
+    assert len(uow.comments.items) == 1
+    assert uow.committed
+
+def test_create_comment_on_a_missing_post_is_not_found():
+    """Test the existence check turns an unknown post into a 404"""
+    # Arrange
+    uow = MockUnitOfWork()
+    client = make_client(uow)
+
+    # Act
+    response = client.post(f"/comments/{uuid4()}", json={"content": "Nice", "author": "Reader"})
+
+    # Assert
+    assert response.status_code == 404
+    assert uow.comments.items == {}
@@ -0,0 +1,130 @@
+import gzip
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from infrastructure.cache.memory import MemoryCache
+from presentation.api.middleware.compression import CompressionMiddleware
+from presentation.compression import CODINGS, ResponseCompressor
+from presentation.etag import not_modified
+
+BODY = b'{"content": "' + b"lorem ipsum " * 200 + b'"}'
+
+def make_compressor(**overrides) -> ResponseCompressor:
+    options = dict(
+        encodings=["zstd", "br", "gzip"],
+        levels={},
+        min_size=1024,
+        thread_min_size=64 * 1024,
+        cache=MemoryCache(max_size=16, ttl=60)
+    )
+    options.update(overrides)
+    return ResponseCompressor(**options)
+
+def test_choose_prefers_server_order_on_ties_and_honours_q_values():
+    """Test negotiation picks the best accepted coding and skips refused ones"""
+    # Arrange
+    compressor = make_compressor(encodings=["br", "gzip"])
+
+    # Act / Assert
+    assert compressor.choose("gzip, br") == ("br" if "br" in CODINGS else "gzip")
+    assert compressor.choose("br;q=0.5, gzip") == "gzip"
+    assert compressor.choose("*;q=0.1, br;q=0") == "gzip"
+    assert compressor.choose("identity") is None
+    assert compressor.choose(None) is None
+
+def test_small_bodies_and_other_types_are_not_compressed():
+    """Test the size threshold, content type and status checks"""
+    # Arrange
+    compressor = make_compressor()
+
+    # Act / Assert
+    assert compressor.applies(200, "application/json", None, 2048)
+    assert not compressor.applies(200, "application/json", None, 100)
+    assert not compressor.applies(200, "image/png", None, 2048)
+    assert not compressor.applies(200, "application/json", "gzip", 2048)
+    assert not compressor.applies(304, "application/json", None, 2048)
+
+@pytest.mark.asyncio
+async def test_cacheable_bodies_are_compressed_once():
+    """Test a second compression of the same tagged body comes from the cache"""
+    # Arrange
+    compressor = make_compressor()
+    key = compressor.cache_key("/posts/1", '"abc"', "no-cache", BODY)
+
+    # Act
+    first = await compressor.compress(BODY, "gzip", key)
+    second = await compressor.compress(BODY, "gzip", key)
+
+    # Assert
+    assert gzip.decompress(first) == BODY
+    assert second is first
+    assert compressor.cache.stats()["hits"] == 1
+    assert compressor.cache_key("/posts/1", '"abc"', "private, max-age=60", BODY) is None
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_compressed_off_the_event_loop():
+    """Test bodies over the thread threshold still round-trip"""
+    # Arrange
+    compressor = make_compressor(thread_min_size=1024, cache=None)
+
+    # Act
+    compressed = await compressor.compress(BODY, "gzip")
+
+    # Assert
+    assert gzip.decompress(compressed) == BODY
+
+def make_client() -> TestClient:
+    async def post(request):
+        matched = not_modified(request.headers.get("if-none-match"), '"abc"')
+        if matched:
+            return Response(status_code=304, headers={"ETag": matched})
+        return Response(BODY, media_type="application/json", headers={"ETag": '"abc"', "Vary": "Accept"})
+
+    async def export(request):
+        return StreamingResponse(iter([BODY, BODY]), media_type="application/x-ndjson")
+
+    app = Starlette(routes=[Route("/post", post), Route("/export", export)])
+    app.add_middleware(CompressionMiddleware, compressor=make_compressor(encodings=["gzip"]))
+    return TestClient(app)
+
+def test_middleware_compresses_and_weakens_the_etag():
+    """Test the ASGI middleware sets the coding headers on a compressed body"""
+    # Arrange
+    client = make_client()
+
+    # Act
+    response = client.get("/post", headers={"Accept-Encoding": "gzip"})
+
+    # Assert
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept, Accept-Encoding"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert int(response.headers["content-length"]) < len(BODY)
+    assert response.content == BODY
+
+def test_not_modified_repeats_the_etag_of_the_compressed_response():
+    """Test a 304 carries the weak tag the compressed 200 sent"""
+    # Arrange
+    client = make_client()
+    first = client.get("/post", headers={"Accept-Encoding": "gzip"})
+
+    # Act
+    response = client.get("/post", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+
+    # Assert
+    assert response.status_code == 304
+    assert response.headers["etag"] == first.headers["etag"] == 'W/"abc"'
+
+def test_middleware_passes_streamed_responses_through():
+    """Test a streamed body is sent as is"""
+    # Arrange
+    client = make_client()
+
+    # Act
+    response = client.get("/export", headers={"Accept-Encoding": "gzip"})
+
+    # Assert
+    assert "content-encoding" not in response.headers
+    assert response.content == BODY + BODY
@@ -0,0 +1,99 @@
+import json
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from domain.entities.comment import Comment
+from domain.entities.post import Post
+from domain.value_objects.post_status import PostStatus
+from presentation.schemas.post_schema import PostResponse
+from presentation.serialization import (
+    JSON,
+    MSGPACK,
+    POST_DETAIL,
+    POST_RESPONSE,
+    body_codec,
+    dumps,
+    loads,
+    negotiate,
+    select_fields,
+)
+
+def make_post() -> Post:
+    post_id = uuid4()
+    return Post(
+        id=post_id,
+        title="Test Post",
+        content="Test Content",
+        author="Test Author",
+        status=PostStatus.PUBLISHED,
+        created_at=datetime(2024, 1, 2, 3, 4, 5, 678),
+        comments=[Comment(
+            id=uuid4(),
+            post_id=post_id,
+            content="Test Comment",
+            author="Test Commenter",
+            created_at=datetime(2024, 1, 3)
+        )]
+    )
+
+def test_post_response_matches_pydantic_json():
+    """Test the FastAPI encoder writes the same JSON the response_model did"""
+    # Arrange
+    post = make_post()
+    expected = PostResponse.model_validate(post).model_dump(mode="json")
+
+    # Act
+    encoded = loads(POST_RESPONSE.dumps(post))
+
+    # Assert
+    assert encoded == {**expected, "comments_count": 1}
+    assert list(encoded) == list(expected)
+
+def test_detail_and_sparse_rows_encode_uuids_and_datetimes():
+    """Test nested comments and projected rows come out as plain JSON values"""
+    # Arrange
+    post = make_post()
+    comment = post.comments[0]
+    row = {"id": post.id, "status": post.status, "created_at": post.created_at, "title": post.title}
+
+    # Act
+    detail = json.loads(POST_DETAIL.dumps(post))
+    sparse = json.loads(dumps(select_fields(row, ("status", "id"))))
+
+    # Assert
+    assert detail["id"] == str(post.id)
+    assert detail["created_at"] == "2024-01-02T03:04:05.000678"
+    assert detail["comments"] == [{
+        "id": str(comment.id),
+        "content": comment.content,
+        "author": comment.author,
+        "created_at": "2024-01-03T00:00:00"
+    }]
+    assert sparse == {"status": post.status.value, "id": str(post.id)}
+
+needs_msgpack = pytest.mark.skipif(MSGPACK is None, reason="ormsgpack is not installed")
+
+@needs_msgpack
+def test_msgpack_carries_the_same_values_as_json():
+    """Test a MessagePack listing decodes to exactly what the JSON one does"""
+    # Arrange
+    rows = POST_RESPONSE.to_list([make_post(), make_post()])
+
+    # Act
+    packed = MSGPACK.loads(MSGPACK.dumps(rows))
+
+    # Assert
+    assert packed == JSON.loads(JSON.dumps(rows))
+
+@needs_msgpack
+def test_negotiation_follows_accept_and_content_type():
+    """Test MessagePack is chosen only when preferred and JSON stays the default"""
+    # Assert
+    assert negotiate(None) is JSON
+    assert negotiate("*/*") is JSON
+    assert negotiate("application/msgpack") is MSGPACK
+    assert negotiate("application/json, application/msgpack;q=0.9") is JSON
+    assert negotiate("application/json;q=0.5, application/x-msgpack") is MSGPACK
+    assert body_codec(None) is JSON
+    assert body_codec("application/msgpack") is MSGPACK
+    assert body_codec("text/plain") is None